@@ -0,0 +1,204 @@
+"""
+로컬 대역 서버를 상대로 관리자의 주요 흐름(이슈 목록, 검색, 상세+댓글, 통계 그래프)을 이슈 수별로 측정한다.
+결과는 한 줄에 측정 하나인 JSON Lines 로 파일 끝에 덧붙여, 커밋 사이의 변화를 비교할 수 있게 한다.
+
+    python benchmarks/bench_api.py --sizes 1000 100000 1000000 --latency 0.02 --output bench_api.jsonl
+    python benchmarks/bench_api.py --sizes 1000 --baseline bench_api.jsonl   # 이전 결과와 비교
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stand_in_server import Faults, StandInServer
+from issuemanagement.models import PRIORITIES, STATUSES
+from issuemanagement.statistics import DASHBOARD_ENDPOINTS
+from issuemanagement.transport import Transport
+from main import MANAGERS
+
+# 측정하는 통계 엔드포인트 (그래프 하나당 하나)
+CHART_ENDPOINTS = (
+    list(DASHBOARD_ENDPOINTS)
+    + [f'issuesPerDayAndStatusInWeek/{status}' for status in STATUSES]
+    + [f'issuesPerDayAndPriorityInWeek/{priority}' for priority in PRIORITIES]
+)
+# 상세+댓글 흐름에서 열어 보는 이슈 수
+DETAIL_SAMPLES = 20
+
+class BenchSession:
+    """
+    벤치마크용 세션. 응답 캐시와 로컬 미러 없이 매번 서버에 요청한다.
+    """
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.cookies = None
+        self.mirror = None
+        self.transport = Transport(pool_maxsize=20)
+
+    def __getattr__(self, name):
+        if name not in MANAGERS:
+            raise AttributeError(name)
+        module_name, class_name = MANAGERS[name]
+        manager = getattr(importlib.import_module(module_name), class_name)(self.base_url, self)
+        setattr(self, name, manager)
+        return manager
+
+    def get_headers(self):
+        return {}
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def consume(records):
+    """
+    반복자를 끝까지 읽고 개수를 반환한다.
+    """
+    if records is None:
+        raise RuntimeError("요청에 실패했습니다.")
+    return sum(1 for _ in records)
+
+def flows(session, project_id, size):
+    """
+    (측정 이름, 측정 함수) 목록을 반환한다. 측정 함수는 처리한 항목 수를 반환한다.
+    """
+    issues = session.issue_manager
+    comments = session.comment_manager
+    stats = session.statistics_manager
+    first_id = (project_id - 1) * size + 1
+    sample_ids = [first_id + i * max(1, size // DETAIL_SAMPLES) for i in range(min(size, DETAIL_SAMPLES))]
+
+    def detail_and_comments():
+        for issue_id in sample_ids:
+            if issues.fetch_issue(project_id, issue_id) is None:
+                raise RuntimeError("이슈를 불러오지 못했습니다.")
+            consume(comments.iter_comments(project_id, issue_id))
+        return len(sample_ids)
+
+    result = [
+        ('issues.load', lambda: consume(issues.stream_issues(project_id))),
+        ('issues.search', lambda: consume(issues.find_issues(project_id, status='NEW', priority='MAJOR'))),
+        ('issues.search_nl', lambda: consume(issues.stream_search(project_id, user_message='login crash'))),
+        ('issue.detail_comments', detail_and_comments),
+    ]
+    for endpoint in CHART_ENDPOINTS:
+        result.append((f'stats.{endpoint}', lambda endpoint=endpoint: draw_chart(stats, project_id, endpoint)))
+    return result
+
+def draw_chart(manager, project_id, endpoint):
+    """
+    통계 데이터를 요청해 화면 없이 그래프를 그린다. 그린 그래프 수를 반환한다.
+    """
+    import matplotlib.pyplot as plt
+
+    data = manager.fetch_statistics(project_id, endpoint)
+    if data is None:
+        raise RuntimeError("통계를 불러오지 못했습니다.")
+    fig = plt.figure(figsize=(10, 6))
+    try:
+        for _, plot, chart_data in manager._chart_specs({endpoint: data}):
+            plot(fig.add_subplot(), chart_data)
+        fig.canvas.draw()
+    finally:
+        plt.close(fig)
+    return 1
+
+def measure(run, repeat):
+    """
+    run 을 repeat 번 실행하고 (걸린 시간 목록(초), 항목 수) 를 반환한다.
+    """
+    times = []
+    items = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        items = run()
+        times.append(time.perf_counter() - started)
+    return times, items
+
+def load_baseline(path):
+    """
+    이전 결과 파일에서 (이슈 수, 측정 이름) 마다 가장 최근 중앙값을 읽는다.
+    """
+    baseline = {}
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                result = json.loads(line)
+                baseline[(result["issues"], result["operation"])] = result["median"]
+    return baseline
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 대역 서버 API 흐름 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000], help='프로젝트당 이슈 수')
+    parser.add_argument('--projects', type=int, default=1, help='프로젝트 수')
+    parser.add_argument('--comments', type=int, default=2, help='이슈당 평균 댓글 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청마다 주입할 지연(초)')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--only', help='이름이 이 문자열로 시작하는 측정만 실행 (예: stats.)')
+    parser.add_argument('--output', help='결과를 덧붙일 JSON Lines 파일')
+    parser.add_argument('--baseline', help='비교할 이전 결과 파일')
+    args = parser.parse_args()
+
+    import matplotlib
+    # 화면 없이 그래프를 그린다.
+    matplotlib.use('Agg', force=True)
+
+    baseline = load_baseline(args.baseline) if args.baseline else {}
+    common = {
+        "timestamp": datetime.datetime.now().isoformat(timespec='seconds'),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "projects": args.projects,
+        "comments": args.comments,
+        "latency": args.latency,
+        "repeat": args.repeat,
+    }
+    output = open(args.output, 'a', encoding='utf-8') if args.output else None
+    print(f"{'issues':>8} {'operation':45} {'median(s)':>10} {'min(s)':>9} {'items':>8} {'vs base':>8}")
+    try:
+        for size in args.sizes:
+            server = StandInServer(projects=args.projects, issues=size, comments=args.comments).start()
+            session = BenchSession(server.base_url)
+            try:
+                for name, run in flows(session, args.projects, size):
+                    if args.only and not name.startswith(args.only):
+                        continue
+                    # 서버 쪽 준비(통계 엔진 생성 등)와 연결 수립은 측정에서 뺀다.
+                    server.faults = Faults()
+                    run()
+                    server.faults = Faults(latency=args.latency)
+                    times, items = measure(run, args.repeat)
+                    result = {
+                        **common, "issues": size, "operation": name,
+                        "median": statistics.median(times), "min": min(times), "max": max(times),
+                        "items": items,
+                    }
+                    previous = baseline.get((size, name))
+                    change = f"{result['median'] / previous:7.2f}x" if previous else ''
+                    print(f"{size:>8} {name:45} {result['median']:>10.4f} {result['min']:>9.4f} {items:>8} {change:>8}")
+                    if output is not None:
+                        output.write(json.dumps(result) + '\n')
+                        output.flush()
+            finally:
+                session.transport.close()
+                server.stop()
+    finally:
+        if output is not None:
+            output.close()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""
+대역 서버를 상대로 여러 이슈의 상세+댓글 조회를 순서대로 했을 때와 비동기 클라이언트로 동시에 했을 때를 비교한다.
+요청마다 지연을 주입해 실제 서버와 비슷한 왕복 시간을 흉내 낸다. 두 방식의 결과가 다르면 실패한다.
+
+    python benchmarks/bench_async.py --issues 1000 --latency 0.05 --concurrency 10 20
+    python benchmarks/bench_async.py --issues 1000 --skip-serial   # 순서대로 조회하는 측정 생략
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_api import BenchSession
+from benchmarks.stand_in_server import Faults, StandInServer
+from issuemanagement.transport import Transport
+
+def serial_details(session, project_id, issue_ids):
+    """
+    기존 관리자로 이슈와 댓글을 하나씩 조회한다.
+    """
+    details = []
+    for issue_id in issue_ids:
+        issue = session.issue_manager.fetch_issue(project_id, issue_id)
+        comments = session.comment_manager.iter_comments(project_id, issue_id)
+        details.append({
+            "projectId": project_id, "id": issue_id, "issue": issue,
+            "comments": list(comments) if comments is not None else None,
+        })
+    return details
+
+def main():
+    parser = argparse.ArgumentParser(description='비동기 클라이언트 동시 조회 벤치마크')
+    parser.add_argument('--issues', type=int, default=1000, help='조회할 이슈 수')
+    parser.add_argument('--comments', type=int, default=2, help='이슈당 평균 댓글 수')
+    parser.add_argument('--latency', type=float, default=0.05, help='요청마다 주입할 지연(초)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 20], help='동시에 보낼 요청 수')
+    parser.add_argument('--skip-serial', action='store_true', help='순서대로 조회하는 측정 생략')
+    args = parser.parse_args()
+
+    server = StandInServer(issues=args.issues, comments=args.comments).start()
+    server.faults = Faults(latency=args.latency)
+    issue_ids = list(range(1, args.issues + 1))
+    failed = False
+    try:
+        expected = None
+        print(f"{'mode':20} {'elapsed(s)':>11} {'issues/s':>9} {'requests':>9}")
+        if not args.skip_serial:
+            session = BenchSession(server.base_url)
+            before = len(server.requests)
+            started = time.perf_counter()
+            expected = serial_details(session, 1, issue_ids)
+            elapsed = time.perf_counter() - started
+            session.transport.close()
+            print(f"{'serial':20} {elapsed:11.2f} {len(issue_ids) / elapsed:9.1f} {len(server.requests) - before:>9}")
+        for concurrency in args.concurrency:
+            session = BenchSession(server.base_url)
+            # 연결 풀도 동시 요청 수에 맞춘다.
+            session.transport.close()
+            session.transport = Transport(pool_maxsize=concurrency)
+            client = session.async_client
+            client.max_concurrency = concurrency
+            before = len(server.requests)
+            started = time.perf_counter()
+            details = client.fetch_issue_details_sync(1, issue_ids)
+            elapsed = time.perf_counter() - started
+            session.transport.close()
+            name = f'async x{concurrency}'
+            print(f"{name:20} {elapsed:11.2f} {len(issue_ids) / elapsed:9.1f} {len(server.requests) - before:>9}")
+            if any(detail["issue"] is None or detail["comments"] is None for detail in details):
+                print(f"실패: {name} 에서 불러오지 못한 이슈가 있습니다.")
+                failed = True
+            elif expected is not None and details != expected:
+                print(f"실패: {name} 결과가 순서대로 조회한 결과와 다릅니다.")
+                failed = True
+    finally:
+        server.stop()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
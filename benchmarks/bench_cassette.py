@@ -0,0 +1,92 @@
+"""
+대역 서버를 상대로 API 흐름을 한 번 실행하며 카세트에 기록한 뒤, 서버 없이 카세트를 재생해 같은 흐름을 반복 측정한다.
+재생한 결과(항목 수)가 기록할 때와 다르거나 재생하지 못한 요청이 있으면 실패한다.
+
+    python benchmarks/bench_cassette.py --issues 10000 --latency 0.02 --repeat 5
+    python benchmarks/bench_cassette.py --cassette session.cassette --replay-only   # 기록해 둔 카세트로만 측정
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_api import BenchSession, flows
+from benchmarks.stand_in_server import Faults, StandInServer
+from issuemanagement.cassette import use_cassette
+
+# 재생할 때 사용하는 주소. 요청은 카세트에서 찾으므로 실제로 연결하지 않는다.
+REPLAY_BASE_URL = 'http://replay.invalid'
+
+def run_flows(session, size, only):
+    """
+    흐름을 한 번씩 실행하고 {측정 이름: (걸린 시간(초), 항목 수)} 를 반환한다.
+    """
+    results = {}
+    for name, run in flows(session, 1, size):
+        if only and not name.startswith(only):
+            continue
+        started = time.perf_counter()
+        items = run()
+        results[name] = (time.perf_counter() - started, items)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='카세트 기록/재생 벤치마크')
+    parser.add_argument('--issues', type=int, default=10000, help='이슈 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='기록할 때 요청마다 주입할 지연(초)')
+    parser.add_argument('--repeat', type=int, default=5, help='재생 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--only', help='이름이 이 문자열로 시작하는 측정만 실행 (예: issues.)')
+    parser.add_argument('--cassette', help='카세트 파일 (기본: 임시 파일)')
+    parser.add_argument('--replay-only', action='store_true', help='기록하지 않고 --cassette 를 재생만 함')
+    args = parser.parse_args()
+
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+    path = args.cassette or os.path.join(tempfile.mkdtemp(), 'bench.cassette')
+    live = {}
+    if not args.replay_only:
+        if os.path.exists(path):
+            os.remove(path)
+        server = StandInServer(issues=args.issues, faults=Faults(latency=args.latency)).start()
+        session = BenchSession(server.base_url)
+        use_cassette(session.transport, path, 'record')
+        try:
+            live = run_flows(session, args.issues, args.only)
+        finally:
+            session.transport.close()
+            server.stop()
+
+    replayed = {}
+    misses = []
+    for _ in range(args.repeat):
+        session = BenchSession(REPLAY_BASE_URL)
+        adapter = use_cassette(session.transport, path, 'replay')
+        for name, result in run_flows(session, args.issues, args.only).items():
+            replayed.setdefault(name, []).append(result)
+        misses += adapter.misses
+        session.transport.close()
+
+    print(f"cassette={path} ({os.path.getsize(path) / 1024:.0f} KB)")
+    print(f"{'operation':45} {'live(s)':>9} {'replay(s)':>10} {'items':>8}")
+    failed = bool(misses)
+    for name, runs in replayed.items():
+        median = statistics.median(elapsed for elapsed, _ in runs)
+        items = {count for _, count in runs}
+        live_time, live_items = live.get(name, (None, None))
+        if len(items) != 1 or (live_items is not None and items != {live_items}):
+            failed = True
+        live_text = f'{live_time:9.4f}' if live_time is not None else f"{'-':>9}"
+        print(f"{name:45} {live_text} {median:10.4f} {runs[0][1]:>8}")
+    if misses:
+        print(f"실패: 카세트에 없는 요청 {len(misses)}개 (예: {misses[0][0]} {misses[0][1]})")
+    elif failed:
+        print("실패: 재생 결과가 기록할 때와 다릅니다.")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+긴 시계열 그래프의 그리는 시간과 메모리를 시계열 길이별로 재고, 이전 방식(모든 점을 문자열 범주 축에 그리고
+호출마다 새 그림을 만드는 방식)과 비교한다. 같은 그래프를 여러 번 열었을 때 열린 그림 수와 메모리 증가도 잰다.
+줄인 그래프가 원래 시계열의 최댓값(튀는 값)을 잃으면 실패한다.
+
+    python benchmarks/bench_charts.py --days 365 3650 36500 --opens 10
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from issuemanagement.statistics import MAX_POINTS, StatisticsManager, lttb
+
+def daily_series(days, seed=0):
+    """
+    days 일 동안의 {날짜: 개수} 시계열을 만든다. 추세, 주기, 가끔 튀는 값을 섞는다.
+    """
+    rng = np.random.default_rng(seed)
+    start = datetime.date(2000, 1, 1)
+    t = np.arange(days)
+    counts = 20 + 10 * np.sin(t / 30) + t / 365 + rng.poisson(3, days)
+    counts[rng.integers(0, days, max(days // 500, 1))] += 80
+    return {(start + datetime.timedelta(days=int(i))).isoformat(): int(c) for i, c in zip(t, counts)}
+
+def draw_before(data):
+    """
+    이전 방식: 호출마다 새 그림을 만들고 모든 점을 문자열 범주 축에 그린다. 그림은 닫지 않는다.
+    """
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.plot(list(data.keys()), list(data.values()), marker='o')
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+    fig.tight_layout()
+    fig.canvas.draw()
+
+def draw_after(manager, data):
+    manager._show_chart(manager._plot_issues_per_day_in_month, data, False)
+    manager._figures['chart'].canvas.draw()
+
+def timed(function, *args):
+    started = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started
+
+def repeated(function, opens, *args):
+    """
+    opens 번 그리고 (평균 시간(ms), 열린 그림 수, 늘어난 메모리(MB)) 를 반환한다.
+    """
+    plt.close('all')
+    function(*args)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    for _ in range(opens):
+        function(*args)
+    elapsed = (time.perf_counter() - started) / opens
+    grown = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return elapsed * 1000, len(plt.get_fignums()), grown / 2 ** 20
+
+def main():
+    parser = argparse.ArgumentParser(description='긴 시계열 그래프 벤치마크')
+    parser.add_argument('--days', type=int, nargs='+', default=[365, 3650, 36500], help='시계열 길이(일)')
+    parser.add_argument('--opens', type=int, default=10, help='같은 그래프를 여는 횟수')
+    parser.add_argument('--before-limit', type=int, default=5000, help='이전 방식은 이 길이까지만 잰다')
+    args = parser.parse_args()
+    # Agg 백엔드에서 plt.show() 가 내는 경고와 이전 방식의 열린 그림 수 경고는 무시한다.
+    warnings.filterwarnings('ignore')
+
+    manager = StatisticsManager(None, None)
+    failed = False
+    print(f"{'days':>7} {'before(ms)':>11} {'after(ms)':>10} {'points':>7} {'peak':>5}")
+    for days in args.days:
+        data = daily_series(days)
+        before = timed(draw_before, data) * 1000 if days <= args.before_limit else float('nan')
+        plt.close('all')
+        after = timed(draw_after, manager, data) * 1000
+        values = np.array(list(data.values()))
+        keep = lttb(np.arange(days), values, MAX_POINTS)
+        kept = values[keep]
+        ok = kept.max() == values.max()
+        failed |= not ok
+        print(f"{days:>7} {before:11.1f} {after:10.1f} {len(keep):>7} {'ok' if ok else 'LOST':>5}")
+
+    data = daily_series(min(args.days))
+    print(f"\nopen the same chart {args.opens} times ({min(args.days)} days)")
+    print(f"{'method':8} {'ms/open':>8} {'figures':>8} {'grown(MB)':>10}")
+    for name, function, extra in (('before', draw_before, ()), ('after', draw_after, (manager,))):
+        milliseconds, figures, grown = repeated(function, args.opens, *extra, data)
+        print(f"{name:8} {milliseconds:8.1f} {figures:>8} {grown:10.1f}")
+    plt.close('all')
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
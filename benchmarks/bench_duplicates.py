@@ -0,0 +1,100 @@
+"""
+중복 이슈 색인(MinHash/LSH)의 색인 시간, 메모리, 조회 시간을 이슈 수별로 재고, 모든 이슈와 비교하는 방식과 비교한다.
+임의의 이슈 사이에 일부 단어만 바꾼 중복을 심어 두고, 색인이 그 중복을 얼마나 찾는지(재현율)도 확인한다.
+
+    python benchmarks/bench_duplicates.py --sizes 10000 100000 --queries 200
+    python benchmarks/bench_duplicates.py --sizes 100000 --memory   # 색인 메모리도 측정 (색인을 한 번 더 만듦)
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from issuemanagement.duplicates import DEFAULT_THRESHOLD, DuplicateIndex, shingles
+
+# 이슈 텍스트를 만들 때 쓰는 단어 수
+VOCABULARY = 20000
+
+def make_issues(count, seed=1):
+    rng = random.Random(seed)
+    words = [f"word{i}" for i in range(VOCABULARY)]
+    return [
+        {
+            "id": issue_id,
+            "title": ' '.join(rng.choices(words, k=6)),
+            "description": ' '.join(rng.choices(words, k=20)),
+            "status": "NEW",
+        }
+        for issue_id in range(1, count + 1)
+    ]
+
+def near_copy(issue, rng, changes=2):
+    """
+    설명의 단어 몇 개만 바꾼 중복 이슈를 만든다.
+    """
+    words = issue["description"].split()
+    for _ in range(changes):
+        words[rng.randrange(len(words))] = f"typo{rng.randrange(1000)}"
+    return {**issue, "description": ' '.join(words)}
+
+def linear_scan(issues_shingles, query, threshold):
+    """
+    모든 이슈와 정확한 Jaccard 유사도를 비교한다. (색인이 없을 때의 비용)
+    """
+    return [
+        issue_id for issue_id, candidate in issues_shingles
+        if len(query & candidate) / len(query | candidate) >= threshold
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description='중복 이슈 색인 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000], help='이슈 수')
+    parser.add_argument('--queries', type=int, default=200, help='조회 횟수 (심어 둔 중복 수)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='중복으로 볼 유사도')
+    parser.add_argument('--memory', action='store_true', help='색인 메모리 측정 (tracemalloc 으로 한 번 더 색인)')
+    args = parser.parse_args()
+
+    print(f"{'issues':>8} {'build(s)':>9} {'memory(MB)':>11} {'lookup(ms)':>11} {'scan(ms)':>9} {'recall':>7}")
+    for size in args.sizes:
+        issues = make_issues(size)
+        started = time.perf_counter()
+        index = DuplicateIndex.from_issues(issues)
+        build = time.perf_counter() - started
+        memory = '-'
+        if args.memory:
+            tracemalloc.start()
+            measured = DuplicateIndex.from_issues(issues)
+            memory = f"{tracemalloc.get_traced_memory()[0] / 2 ** 20:.1f}"
+            tracemalloc.stop()
+            del measured
+
+        rng = random.Random(2)
+        originals = rng.sample(issues, args.queries)
+        copies = [near_copy(issue, rng) for issue in originals]
+        started = time.perf_counter()
+        found = 0
+        for original, copy in zip(originals, copies):
+            matches = index.find_duplicates(copy["title"], copy["description"], args.threshold)
+            found += any(match["id"] == original["id"] for match in matches)
+        lookup = (time.perf_counter() - started) / len(copies)
+
+        # 모든 이슈와 비교하는 방식은 몇 번만 잰다.
+        issues_shingles = [(issue["id"], shingles(issue["title"], issue["description"])) for issue in issues]
+        samples = copies[:5]
+        started = time.perf_counter()
+        for copy in samples:
+            linear_scan(issues_shingles, shingles(copy["title"], copy["description"]), args.threshold)
+        scan = (time.perf_counter() - started) / len(samples)
+
+        print(
+            f"{size:>8} {build:9.2f} {memory:>11} {lookup * 1000:11.3f} {scan * 1000:9.1f} "
+            f"{found / len(copies):7.1%}"
+        )
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+분석용 내보내기(issuemanagement/export.py)의 처리 시간과 최대 메모리를 재고, 중간에 중단한 뒤 이어서 진행해도
+모든 이슈와 댓글이 한 번씩만 들어가는지 확인한다. 결과가 맞지 않으면 실패한다.
+최대 메모리는 프로세스의 최대 RSS 이므로 같은 프로세스에서 도는 대역 서버와 NumPy 도 포함된다.
+(tracemalloc 은 요청마다 할당이 많은 댓글 단계를 몇 배 느리게 하므로 쓰지 않는다.)
+
+    python benchmarks/bench_export.py --issues 100000 --interrupt-after 3
+    python benchmarks/bench_export.py --issues 1000000 --no-comments      # 100만 건 이슈만
+"""
+import argparse
+import glob
+import gzip
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_api import BenchSession
+from benchmarks.stand_in_server import Faults, StandInServer
+from issuemanagement.export import read_columns
+
+class Interrupted(Exception):
+    pass
+
+def verify(directory, server, with_comments):
+    """
+    내보낸 파일을 다시 읽어 대역 서버의 이슈/댓글과 개수와 ID 가 같은지 확인한다. 틀린 점 목록을 반환한다.
+    """
+    data = server.data
+    expected_ids = [issue['id'] for issue in data.iter_issues(1)]
+    problems = []
+    ids = []
+    for path in sorted(glob.glob(os.path.join(directory, 'issues-*.npz'))):
+        ids.extend(read_columns(path)['id'].tolist())
+    if ids != expected_ids:
+        problems.append(f"issue ids differ ({len(ids)} exported, {len(expected_ids)} expected)")
+    lines = 0
+    for path in glob.glob(os.path.join(directory, 'issues-*.jsonl.gz')):
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            lines += sum(1 for _ in file)
+    if lines != len(expected_ids):
+        problems.append(f"jsonl issue lines {lines} != {len(expected_ids)}")
+    if with_comments:
+        comments = sum(
+            len(read_columns(path)['id']) for path in glob.glob(os.path.join(directory, 'comments-*.npz'))
+        )
+        expected = sum(data.comment_count(issue_id) for issue_id in expected_ids)
+        if comments != expected:
+            problems.append(f"comments {comments} != {expected}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description='분석용 내보내기 벤치마크')
+    parser.add_argument('--issues', type=int, default=100000, help='프로젝트의 이슈 수')
+    parser.add_argument('--comments', type=int, default=2, help='이슈당 평균 댓글 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='대역 서버가 요청마다 주입할 지연(초)')
+    parser.add_argument('--part-size', type=int, default=10000, help='파일 하나에 담을 이슈 수')
+    parser.add_argument('--concurrency', type=int, default=16, help='댓글을 동시에 요청할 수')
+    parser.add_argument('--no-comments', action='store_true', help='댓글은 내보내지 않음')
+    parser.add_argument('--interrupt-after', type=int, default=0, help='이슈 부분을 이만큼 쓴 뒤 중단하고 다시 실행')
+    args = parser.parse_args()
+
+    server = StandInServer(issues=args.issues, comments=args.comments).start()
+    server.faults = Faults(latency=args.latency)
+    session = BenchSession(server.base_url)
+    session.async_client.max_concurrency = args.concurrency
+    with_comments = not args.no_comments
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            started = time.perf_counter()
+            if args.interrupt_after:
+                def interrupt(stage, part):
+                    if stage == 'issues' and part['index'] + 1 == args.interrupt_after:
+                        raise Interrupted
+                try:
+                    session.export_manager.export_project(1, directory, with_comments, args.part_size, interrupt)
+                except Interrupted:
+                    print(f"interrupted after {args.interrupt_after} issue parts "
+                          f"({time.perf_counter() - started:.1f}s)")
+            result = session.export_manager.export_project(1, directory, with_comments, args.part_size)
+            elapsed = time.perf_counter() - started
+            # 리눅스에서 ru_maxrss 는 KB 단위이다.
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+            size = sum(os.path.getsize(path) for path in glob.glob(os.path.join(directory, '*')))
+            print(result)
+            print(
+                f"time={elapsed:.1f}s issues/s={result['issues'] / elapsed:,.0f} "
+                f"peak rss={peak / 2 ** 20:.1f}MB output={size / 2 ** 20:.1f}MB"
+            )
+            problems = verify(directory, server, with_comments)
+    finally:
+        session.transport.close()
+        server.stop()
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+요청 지표 기록이 요청 처리에 더하는 시간을 측정한다. 요청 하나당 추가 시간이 목표를 넘으면 실패한다.
+
+    python benchmarks/bench_metrics.py --count 500 --target-us 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stand_in_server import StandInServer
+from issuemanagement.metrics import Metrics
+from issuemanagement.transport import Transport
+
+def time_record(count):
+    """
+    Metrics.record 한 번에 걸리는 시간(초)을 반환한다.
+    """
+    metrics = Metrics()
+    urls = [f'https://example.com/api/projects/1/issues/{i}' for i in range(500)]
+    started = time.perf_counter()
+    for i in range(count):
+        metrics.record('GET', urls[i % len(urls)], 200, 0.02, 0, 1024)
+    return (time.perf_counter() - started) / count
+
+def time_requests(server, count, metrics):
+    """
+    대역 서버에 GET 을 count 번 보내고 요청당 평균 시간(초)을 반환한다.
+    """
+    transport = Transport(metrics=metrics)
+    url = f'{server.base_url}/projects/1/issues/1'
+    transport.get(url)
+    started = time.perf_counter()
+    for _ in range(count):
+        transport.get(url)
+    elapsed = (time.perf_counter() - started) / count
+    transport.close()
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='요청 지표 기록 비용 벤치마크')
+    parser.add_argument('--count', type=int, default=500, help='보낼 요청 수')
+    parser.add_argument('--target-us', type=float, default=20.0, help='기록 한 번의 목표 시간(마이크로초)')
+    args = parser.parse_args()
+
+    record = time_record(args.count * 50)
+    server = StandInServer().start()
+    plain = time_requests(server, args.count, None)
+    measured = time_requests(server, args.count, Metrics())
+    server.stop()
+
+    print(f"record={record * 1e6:.2f}us per call")
+    print(f"request without metrics={plain * 1e6:.0f}us, with metrics={measured * 1e6:.0f}us")
+    if record * 1e6 > args.target_us:
+        print("실패: 지표 기록이 목표 시간을 넘었습니다.")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
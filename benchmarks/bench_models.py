@@ -0,0 +1,79 @@
+"""
+API JSON 사전과 슬롯 기반 Issue 레코드의 메모리 사용량을 비교하는 벤치마크.
+레코드는 json.loads 로 만들어 서버 응답을 디코딩했을 때와 같은 객체 구성을 재현한다.
+
+    python benchmarks/bench_models.py --count 100000
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from issuemanagement.models import PRIORITIES, STATUSES, Issue
+
+def make_payload(count, users=50):
+    """
+    이슈 count 개의 JSON 배열 본문을 만든다.
+    """
+    start = datetime.datetime(2024, 1, 1)
+    issues = [
+        {
+            "id": i,
+            "title": f"Issue {i}: login page crashes",
+            "description": f"Steps to reproduce issue {i}",
+            "reporterUsername": f"tester{i % users}",
+            "assigneeUsername": f"dev{i % users}" if i % 3 else None,
+            "fixerUsername": f"dev{i % users}" if i % 5 == 0 else None,
+            "priority": PRIORITIES[i % len(PRIORITIES)],
+            "status": STATUSES[i % len(STATUSES)],
+            "reportedDate": (start + datetime.timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        for i in range(count)
+    ]
+    return json.dumps(issues)
+
+def measure(build):
+    """
+    build() 가 만든 객체가 차지하는 메모리(바이트)와 걸린 시간(초)을 반환한다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='이슈 레코드 메모리 벤치마크')
+    parser.add_argument('--count', type=int, default=100000, help='이슈 수')
+    args = parser.parse_args()
+
+    payload = make_payload(args.count)
+    dicts, dict_size, dict_time = measure(lambda: json.loads(payload))
+    # 레코드는 디코딩한 사전에서 만든 뒤 사전을 버린다. 레코드가 붙잡고 있는 문자열까지 포함해 잰다.
+    records, record_size, record_time = measure(
+        lambda: [Issue.from_dict(issue) for issue in json.loads(payload)]
+    )
+
+    if [record.to_dict() for record in records] != dicts:
+        print("실패: 레코드를 JSON 으로 되돌린 결과가 원래 사전과 다릅니다.")
+        return 1
+
+    per_100k = 100000 / args.count
+    print(f"issues={args.count}")
+    print(f"dict:   {dict_size / 1e6:8.1f} MB  ({dict_size / args.count:6.0f} B/issue, decode {dict_time:.3f}s)")
+    print(f"record: {record_size / 1e6:8.1f} MB  ({record_size / args.count:6.0f} B/issue, decode+convert {record_time:.3f}s)")
+    print(f"saved per 100k issues: {(dict_size - record_size) * per_100k / 1e6:.1f} MB "
+          f"({1 - record_size / dict_size:.0%})")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
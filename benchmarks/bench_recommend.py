@@ -0,0 +1,112 @@
+"""
+로컬 담당자 추천기와 서버의 담당자 추천(recommendedAssignees)의 정확도와 지연 시간을 비교한다.
+해결된 이슈 중 가장 최근 것들을 시험 세트로 떼어 두고, 나머지 이슈로 로컬 추천기를 학습한 뒤
+시험 이슈의 실제 해결자(없으면 담당자)가 추천 1순위/상위 3명 안에 드는 비율을 잰다.
+
+    python benchmarks/bench_recommend.py --issues 10000 --latency 0.02
+    ISSUE_CONSOLE_USERNAME=... ISSUE_CONSOLE_PASSWORD=... \\
+        python benchmarks/bench_recommend.py --base-url https://swe.mldljyh.tech/api --project 1   # 실제 서버와 비교
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_api import BenchSession
+from benchmarks.stand_in_server import Faults, StandInServer
+from issuemanagement.recommender import HISTORY_STATUSES, LocalRecommender, issue_label
+
+def split_history(issues, test_ratio):
+    """
+    해결된 이슈를 등록일 순서로 정렬해 가장 최근 test_ratio 만큼을 시험 세트로 떼어 낸다. (학습 이슈, 시험 이슈) 를 반환한다.
+    """
+    history = sorted(
+        (issue for issue in issues if issue['status'] in HISTORY_STATUSES and issue_label(issue)),
+        key=lambda issue: issue['reportedDate'],
+    )
+    test = history[len(history) - int(len(history) * test_ratio):] if test_ratio else []
+    test_ids = {issue['id'] for issue in test}
+    return [issue for issue in issues if issue['id'] not in test_ids], test
+
+def accuracy(test, recommendations):
+    """
+    (1순위 정확도, 상위 3명 정확도) 를 반환한다.
+    """
+    top1 = top3 = 0
+    for issue, names in zip(test, recommendations):
+        label = issue_label(issue)
+        top1 += bool(names) and names[0] == label
+        top3 += label in names[:3]
+    return top1 / max(len(test), 1), top3 / max(len(test), 1)
+
+def server_recommend(session, project_id, issue_id):
+    response = session.transport.get(
+        f'{session.base_url}/projects/{project_id}/issues/{issue_id}/recommendedAssignees'
+    )
+    if response.status_code != 200:
+        return []
+    return [assignee['username'] for assignee in response.json()]
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬/서버 담당자 추천 비교')
+    parser.add_argument('--base-url', help='비교할 서버 주소 (기본: 로컬 대역 서버)')
+    parser.add_argument('--project', type=int, default=1, help='프로젝트 ID')
+    parser.add_argument('--issues', type=int, default=10000, help='대역 서버의 이슈 수')
+    parser.add_argument('--latency', type=float, default=0.02, help='대역 서버가 요청마다 주입할 지연(초)')
+    parser.add_argument('--test-ratio', type=float, default=0.2, help='시험 세트로 떼어 둘 해결된 이슈 비율')
+    parser.add_argument('--server-samples', type=int, default=200, help='서버에 추천을 요청할 시험 이슈 수')
+    args = parser.parse_args()
+
+    server = None
+    if args.base_url:
+        session = BenchSession(args.base_url)
+        session.auth_manager.login(os.environ.get('ISSUE_CONSOLE_USERNAME'), os.environ.get('ISSUE_CONSOLE_PASSWORD'))
+    else:
+        server = StandInServer(issues=args.issues).start()
+        session = BenchSession(server.base_url)
+    try:
+        issues = session.issue_manager.stream_issues(args.project)
+        if issues is None:
+            print("이슈 목록을 불러오지 못했습니다.")
+            return 1
+        issues = list(issues)
+        train, test = split_history(issues, args.test_ratio)
+        if not test:
+            print("시험할 해결된 이슈가 없습니다.")
+            return 1
+
+        started = time.perf_counter()
+        recommender = LocalRecommender.from_issues(train)
+        fit_time = time.perf_counter() - started
+        started = time.perf_counter()
+        local = [[name for name, _ in result] for result in recommender.recommend_many(test)]
+        local_time = time.perf_counter() - started
+
+        if server is not None:
+            server.faults = Faults(latency=args.latency)
+        samples = test[:args.server_samples]
+        started = time.perf_counter()
+        remote = [server_recommend(session, args.project, issue['id']) for issue in samples]
+        remote_time = time.perf_counter() - started
+    finally:
+        session.transport.close()
+        if server is not None:
+            server.stop()
+
+    print(f"train={len(train)} (history {recommender.trained}) test={len(test)} developers={len(recommender.developers)}")
+    print(f"local fit: {fit_time:.3f}s")
+    print(f"{'method':8} {'issues':>7} {'top1':>6} {'top3':>6} {'total(s)':>9} {'per issue(ms)':>14}")
+    for name, evaluated, results, elapsed in (
+        ('local', test, local, local_time), ('server', samples, remote, remote_time),
+    ):
+        top1, top3 = accuracy(evaluated, results)
+        print(
+            f"{name:8} {len(evaluated):>7} {top1:6.1%} {top3:6.1%} {elapsed:9.3f} "
+            f"{elapsed / max(len(evaluated), 1) * 1000:14.3f}"
+        )
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
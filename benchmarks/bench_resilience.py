@@ -0,0 +1,123 @@
+"""
+장애를 주입한 대역 서버를 상대로 전송 계층의 제한 시간, 재시도, 회로 차단기 동작을 확인한다.
+기대한 대로 동작하지 않으면 종료 코드 1 을 반환한다.
+
+    python benchmarks/bench_resilience.py
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stand_in_server import Faults, StandInServer
+from issuemanagement.cache import ResponseCache
+from issuemanagement.resilience import UNAVAILABLE_HEADER, CircuitBreaker, RetryPolicy
+from issuemanagement.transport import Transport
+
+def make_transport(max_retries=3, threshold=5, reset=30.0, read_timeout=10):
+    return Transport(
+        cache=ResponseCache(ttl=0.1),
+        timeouts={'default': (1, read_timeout)},
+        retry=RetryPolicy(max_retries, backoff=0.01, max_backoff=0.05),
+        breaker=CircuitBreaker(threshold, reset),
+    )
+
+def scenario_hang(server):
+    """
+    응답하지 않는 서버: 읽기 제한 시간 안에 503 으로 실패해야 한다.
+    """
+    server.faults = Faults(hang=True)
+    transport = make_transport(max_retries=1, read_timeout=0.3)
+    started = time.perf_counter()
+    response = transport.get(f'{server.base_url}/projects')
+    elapsed = time.perf_counter() - started
+    transport.close()
+    ok = response.status_code == 503 and response.headers.get(UNAVAILABLE_HEADER) == 'timeout' and elapsed < 2
+    return ok, f"status={response.status_code} reason={response.headers.get(UNAVAILABLE_HEADER)} elapsed={elapsed:.2f}s"
+
+def scenario_flaky(server, count):
+    """
+    30% 가 503 인 서버: 재시도로 모든 GET 이 성공해야 한다.
+    """
+    server.faults = Faults(error_rate=0.3)
+    transport = make_transport(max_retries=6, threshold=1000)
+    before = len(server.requests)
+    succeeded = sum(
+        transport.get(f'{server.base_url}/projects/1/issues/{i % 20 + 1}').status_code == 200
+        for i in range(count)
+    )
+    sent = len(server.requests) - before
+    transport.close()
+    return succeeded == count, f"succeeded={succeeded}/{count} requests_sent={sent}"
+
+def scenario_write_not_retried(server):
+    """
+    쓰기 요청은 503 을 받아도 다시 보내지 않아야 한다.
+    """
+    server.faults = Faults(error_rate=1.0)
+    transport = make_transport(threshold=1000)
+    before = len(server.requests)
+    response = transport.post(f'{server.base_url}/projects/1/issues', json={"title": "t"})
+    sent = len(server.requests) - before
+    transport.close()
+    return response.status_code == 503 and sent == 1, f"status={response.status_code} requests_sent={sent}"
+
+def scenario_outage(server):
+    """
+    서버 장애: 회로가 열린 뒤에는 서버에 요청하지 않고 캐시된 응답을 돌려주며, 복구되면 다시 닫혀야 한다.
+    """
+    server.faults = Faults()
+    transport = make_transport(max_retries=1, threshold=3, reset=0.5)
+    url = f'{server.base_url}/projects/1/issues/1'
+    cached = transport.get(url, cache=True)
+
+    server.faults = Faults(error_rate=1.0)
+    for _ in range(3):
+        transport.get(f'{server.base_url}/projects')
+    opened = transport.breaker.state == CircuitBreaker.OPEN
+
+    before = len(server.requests)
+    started = time.perf_counter()
+    stale = transport.get(url, cache=True)
+    uncached = transport.get(f'{server.base_url}/projects')
+    fast = time.perf_counter() - started < 0.05
+    skipped = len(server.requests) == before
+    served = stale.status_code == 200 and stale.json() == cached.json()
+    failed_fast = uncached.headers.get(UNAVAILABLE_HEADER) == 'circuit-open'
+
+    server.faults = Faults()
+    time.sleep(0.6)
+    recovered = transport.get(f'{server.base_url}/projects').status_code == 200
+    closed = transport.breaker.state == CircuitBreaker.CLOSED
+    transport.close()
+
+    ok = all((opened, skipped, fast, served, failed_fast, recovered, closed))
+    return ok, (
+        f"opened={opened} no_requests_while_open={skipped} fast={fast} served_cached={served} "
+        f"failed_fast={failed_fast} recovered={recovered and closed}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='전송 계층 장애 대응 점검')
+    parser.add_argument('--count', type=int, default=100, help='불안정한 서버에 보낼 GET 수')
+    args = parser.parse_args()
+
+    server = StandInServer().start()
+    results = [
+        ('hang', scenario_hang(server)),
+        ('flaky', scenario_flaky(server, args.count)),
+        ('write-not-retried', scenario_write_not_retried(server)),
+        ('outage', scenario_outage(server)),
+    ]
+    server.stop()
+
+    failed = False
+    for name, (ok, detail) in results:
+        print(f"{'ok  ' if ok else 'FAIL'} {name:18} {detail}")
+        failed = failed or not ok
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+기간별 이슈 수 카운터(rollups)의 조회 시간을 이슈 수별로 재고, 미러 전체를 다시 세는 방식(StatisticsEngine)과 비교한다.
+카운터를 처음 만드는 시간과, 이슈 일부가 바뀌었을 때 카운터를 고치는 시간도 잰다. 두 방식의 결과가 다르면 실패한다.
+
+    python benchmarks/bench_rollup.py --sizes 10000 100000 --years 5
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stand_in_server import Dataset
+from issuemanagement.mirror import MirrorStore
+from issuemanagement.rollup import RollupStore
+from issuemanagement.stats_engine import StatisticsEngine
+
+# (단위, 구분) 조회 조합
+QUERIES = (('day', None), ('week', 'status'), ('month', 'priority'), ('quarter', 'assignee'))
+
+def timed(function, *args, repeat=1):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+    return result, (time.perf_counter() - started) / repeat
+
+def main():
+    parser = argparse.ArgumentParser(description='기간별 이슈 수 카운터 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000], help='이슈 수')
+    parser.add_argument('--years', type=int, default=5, help='이슈 등록일이 퍼져 있는 기간(년)')
+    parser.add_argument('--changes', type=int, default=100, help='카운터 갱신 시간을 잴 때 바꿀 이슈 수')
+    args = parser.parse_args()
+
+    today = datetime.date.today()
+    start = (today - datetime.timedelta(days=365 * args.years)).isoformat()
+    end = today.isoformat()
+    print(f"{'issues':>8} {'build(s)':>9} {'update(ms)':>11} {'query':>16} {'rollup(ms)':>11} {'recount(ms)':>12}")
+    failed = False
+    for size in args.sizes:
+        data = Dataset(issues=size, days=365 * args.years, today=today)
+        mirror = MirrorStore(':memory:')
+        mirror.save_issues(1, data.iter_issues(1))
+        store = RollupStore(mirror)
+        _, build = timed(store.ensure, 1)
+
+        rng = random.Random(size)
+        changed = [
+            {**data.issue(1, issue_id), "status": "CLOSED", "assigneeUsername": "dev-new"}
+            for issue_id in rng.sample(range(1, size + 1), min(args.changes, size))
+        ]
+        _, update = timed(mirror.save_issues, 1, changed)
+
+        for number, (granularity, by) in enumerate(QUERIES):
+            expected, recount = timed(
+                lambda: StatisticsEngine.from_mirror(mirror, 1).count_over_time(start, end, granularity, by=by)
+            )
+            result, rollup = timed(store.count_over_time, 1, start, end, granularity, by, repeat=20)
+            failed |= result != expected
+            prefix = f"{size:>8} {build:9.2f} {update * 1000:11.1f}" if number == 0 else ' ' * 30
+            query = f"{granularity}/{by or 'all'}"
+            print(
+                f"{prefix} {query:>16} {rollup * 1000:11.2f} {recount * 1000:12.1f}"
+                f"{'' if result == expected else '  MISMATCH'}"
+            )
+        mirror.close()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
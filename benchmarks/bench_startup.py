@@ -0,0 +1,35 @@
+"""
+로그인 화면까지의 시작 시간을 측정하고 목표 시간을 넘으면 실패하는 회귀 벤치마크.
+
+    python benchmarks/bench_startup.py --target 0.25 --repeat 7
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from issuemanagement.startup import HEAVY_MODULES, measure_import_times, measure_time_to_prompt
+
+def main():
+    parser = argparse.ArgumentParser(description='시작 시간 회귀 벤치마크')
+    parser.add_argument('--target', type=float, default=0.25, help='로그인 화면까지의 목표 시간(초)')
+    parser.add_argument('--repeat', type=int, default=5, help='측정 횟수 (중앙값 사용)')
+    args = parser.parse_args()
+
+    elapsed = measure_time_to_prompt(args.repeat)
+    loaded = {module.split('.')[0] for module, _, _ in measure_import_times()}
+    heavy = [module for module in HEAVY_MODULES if module in loaded]
+
+    print(f"time_to_prompt={elapsed:.3f}s target={args.target:.3f}s")
+    failed = False
+    if elapsed > args.target:
+        print("실패: 목표 시작 시간을 넘었습니다.")
+        failed = True
+    if heavy:
+        print(f"실패: 시작 시 무거운 모듈을 불러옵니다: {', '.join(heavy)}")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
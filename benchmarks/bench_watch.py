@@ -0,0 +1,91 @@
+"""
+변경 사항 지켜보기(watch)의 폴링 한 번당 받은 바이트 수와 시간을, 매번 이슈 목록 전체를 받아 비교하는 방식과 비교한다.
+바뀐 것이 없는 폴링과 폴링마다 이슈 하나가 바뀌는 경우를 각각 잰다.
+
+    python benchmarks/bench_watch.py --issues 10000 --polls 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_api import BenchSession
+from benchmarks.stand_in_server import StandInServer
+from issuemanagement.models import PRIORITIES
+from issuemanagement.watch import Watcher, issue_snapshot
+
+class FullListPoller:
+    """
+    조건부 요청 없이 매번 이슈 목록 전체를 받아 이전 목록과 비교하는 방식.
+    """
+    def __init__(self, session, project_id):
+        self.session = session
+        self.url = f'{session.base_url}/projects/{project_id}/issues'
+        self.snapshot = None
+        self.bytes_received = 0
+
+    def poll(self):
+        response = self.session.transport.get(self.url)
+        self.bytes_received += len(response.content)
+        fresh = issue_snapshot(response.json())
+        previous, self.snapshot = self.snapshot, fresh
+        if previous is None:
+            return []
+        return [issue_id for issue_id, value in fresh.items() if previous.get(issue_id) != value]
+
+def measure(server, poller, polls, change):
+    """
+    polls 번 폴링하며 (폴링당 받은 바이트, 폴링당 시간(ms), 찾은 변경 수) 를 반환한다.
+    change 가 참이면 폴링 전마다 이슈 하나의 우선순위를 바꾼다.
+    """
+    received = poller_bytes(poller)
+    found = 0
+    elapsed = 0.0
+    for number in range(polls):
+        if change:
+            with server.lock:
+                issue_id = number % server.data.issues_per_project + 1
+                priority = server.data.issue(1, issue_id)["priority"]
+                server.data.update_issue(1, issue_id, {"priority": PRIORITIES[PRIORITIES.index(priority) - 1]})
+        started = time.perf_counter()
+        found += len(poller.poll() or [])
+        elapsed += time.perf_counter() - started
+    return (poller_bytes(poller) - received) / polls, elapsed / polls * 1000, found
+
+def poller_bytes(poller):
+    return poller.fetcher.bytes_received if isinstance(poller, Watcher) else poller.bytes_received
+
+def main():
+    parser = argparse.ArgumentParser(description='변경 사항 지켜보기 벤치마크')
+    parser.add_argument('--issues', type=int, default=10000, help='프로젝트의 이슈 수')
+    parser.add_argument('--polls', type=int, default=20, help='경우마다 폴링할 횟수')
+    args = parser.parse_args()
+
+    server = StandInServer(issues=args.issues).start()
+    session = BenchSession(server.base_url)
+    try:
+        pollers = {
+            'full-list': FullListPoller(session, 1),
+            'watch': Watcher(session.base_url, session, 1),
+        }
+        print(f"{'method':10} {'case':10} {'KB/poll':>9} {'ms/poll':>9} {'changes':>8}")
+        for name, poller in pollers.items():
+            # 첫 폴링은 기준 스냅숏을 만든다.
+            poller.poll()
+            for case, change in (('unchanged', False), ('1 change', True)):
+                kilobytes, milliseconds, found = measure(server, poller, args.polls, change)
+                print(f"{name:10} {case:10} {kilobytes / 1024:9.1f} {milliseconds:9.2f} {found:8}")
+        watcher = pollers['watch']
+        print(
+            f"watch requests={watcher.fetcher.requests} not-modified={watcher.fetcher.not_modified} "
+            f"followed issues={len(watcher.comments)}"
+        )
+    finally:
+        session.transport.close()
+        server.stop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,490 @@
+"""
+이슈 관리 API 를 흉내 내는 로컬 대역 서버. 관리자가 사용하는 엔드포인트(로그인, 프로젝트, 이슈, 검색,
+자연어 검색, 댓글, 통계, 담당자 추천)를 제공하고 장애(지연, 오류 응답, 연결 끊김, 응답 없음)를 주입할 수 있다.
+이슈와 댓글은 ID 로부터 그때그때 만들어 내므로 100만 건 규모도 메모리에 올리지 않고 제공한다.
+벤치마크와 점검 스크립트에서 실제 서버 대신 사용한다.
+
+    python benchmarks/stand_in_server.py --port 8080 --projects 2 --issues 100000 --comments 3 --latency 0.02
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from issuemanagement.models import PRIORITIES, STATUSES
+
+# 이슈 제목을 만들 때 쓰는 단어 (검색 벤치마크가 고르게 걸리도록 섞어 쓴다)
+WORDS = (
+    'login', 'crash', 'timeout', 'page', 'button', 'database', 'export', 'upload',
+    'search', 'profile', 'payment', 'mobile', 'layout', 'session', 'cache', 'report',
+)
+# 응답 본문을 이 개수씩 묶어 한 청크로 보낸다.
+STREAM_BATCH = 1000
+
+class Faults:
+    """
+    요청마다 주입할 장애 설정. 실행 중에 값을 바꿀 수 있다.
+    """
+    def __init__(self, latency=0.0, error_rate=0.0, error_status=503, drop_rate=0.0, hang=False):
+        # 모든 응답 전에 기다리는 시간(초)
+        self.latency = latency
+        # error_status 로 응답할 확률
+        self.error_rate = error_rate
+        self.error_status = error_status
+        # 응답 없이 연결을 끊을 확률
+        self.drop_rate = drop_rate
+        # True 이면 응답하지 않는다. (읽기 시간 초과 재현)
+        self.hang = hang
+
+class Dataset:
+    """
+    대역 서버의 데이터. 프로젝트 수 × 프로젝트당 이슈 수 × 이슈당 평균 댓글 수로 크기를 정한다.
+    이슈와 댓글은 ID 로 결정되는 값으로 만들고, 등록/수정/삭제된 것만 따로 보관한다.
+    """
+    def __init__(self, projects=1, issues=50, comments=2, users=5, days=365, today=None):
+        self.issues_per_project = issues
+        self.comments_per_issue = comments
+        self.users = users
+        # 등록일은 today 이전 days 일 동안 고르게 퍼뜨린다. (통계의 이번 주/이번 달 구간이 비지 않도록)
+        self.today = today or datetime.datetime.now().replace(microsecond=0)
+        self.days = days
+        self.projects = [{"id": p, "name": f"project-{p}"} for p in range(1, projects + 1)]
+        # (프로젝트 ID, 이슈 ID) -> 바뀐 이슈 (삭제되면 None)
+        self.changed = {}
+        # 프로젝트 ID -> 새로 등록된 이슈 ID 목록
+        self.created = {}
+        # 이슈 ID -> 새로 등록된 댓글 목록
+        self.added_comments = {}
+        # 댓글 ID -> 수정된 내용 (삭제되면 None)
+        self.comment_overrides = {}
+        # 이슈 ID -> 삭제된 댓글 수
+        self.deleted_comments = {}
+        # (종류, ID) -> 버전. 목록이 바뀔 때마다 올려 ETag 로 쓴다.
+        self.versions = {}
+        self.next_issue_id = projects * issues + 1
+        self.next_comment_id = (projects * issues + 1) * 1000
+        # 프로젝트 ID -> 통계 엔진 (이슈가 바뀌면 버린다)
+        self._engines = {}
+
+    def has_project(self, project_id):
+        return any(project["id"] == project_id for project in self.projects)
+
+    def _base_ids(self, project_id):
+        first = (project_id - 1) * self.issues_per_project + 1
+        return range(first, first + self.issues_per_project)
+
+    def make_issue(self, project_id, issue_id):
+        """
+        ID 로 결정되는 이슈를 만든다.
+        """
+        users = self.users
+        offset = (issue_id - 1) % self.issues_per_project
+        reported = self.today - datetime.timedelta(
+            seconds=(self.issues_per_project - offset) * self.days * 86400 // self.issues_per_project
+        )
+        words = (WORDS[issue_id % len(WORDS)], WORDS[issue_id * 7 % len(WORDS)])
+        status = STATUSES[issue_id % len(STATUSES)]
+        # 개발자마다 맡는 분야가 있도록 첫 단어로 해결자를 정하고, 열 건 중 한 건은 다른 개발자가 해결한다.
+        fixer = issue_id % len(WORDS) % users if issue_id % 10 else issue_id * 3 % users
+        return {
+            "id": issue_id,
+            "title": f"{words[0]} {words[1]} issue {issue_id}",
+            "description": f"Steps to reproduce the {words[0]} problem in project {project_id}",
+            "reporterUsername": f"tester{issue_id % users}",
+            "assigneeUsername": f"dev{issue_id % users}" if status != 'NEW' else None,
+            "fixerUsername": f"dev{fixer}" if status in ('FIXED', 'RESOLVED', 'CLOSED') else None,
+            "priority": PRIORITIES[issue_id * 3 % len(PRIORITIES)],
+            "status": status,
+            "reportedDate": reported.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+    def issue(self, project_id, issue_id):
+        """
+        이슈 하나를 반환한다. 없으면 None 을 반환한다.
+        """
+        key = (project_id, issue_id)
+        if key in self.changed:
+            return self.changed[key]
+        if issue_id in self._base_ids(project_id):
+            return self.make_issue(project_id, issue_id)
+        return None
+
+    def iter_issues(self, project_id):
+        """
+        프로젝트의 이슈를 ID 순서로 하나씩 내보낸다.
+        """
+        for issue_id in self._base_ids(project_id):
+            issue = self.issue(project_id, issue_id)
+            if issue is not None:
+                yield issue
+        for issue_id in list(self.created.get(project_id, ())):
+            issue = self.issue(project_id, issue_id)
+            if issue is not None:
+                yield issue
+
+    def etag(self, kind, key):
+        """
+        이슈 목록('issues', 프로젝트 ID) 이나 댓글 목록('comments', 이슈 ID) 의 현재 ETag 를 반환한다.
+        """
+        return f'"{kind}-{key}-{self.versions.get((kind, key), 0)}"'
+
+    def _bump(self, kind, key):
+        self.versions[(kind, key)] = self.versions.get((kind, key), 0) + 1
+
+    def comment_count(self, issue_id):
+        # 0 부터 2 × 평균까지 고르게 돌아가므로 이슈당 평균은 comments_per_issue 가 된다.
+        return issue_id % (2 * self.comments_per_issue + 1)
+
+    def _comment_total(self, project_id, issue_id):
+        generated = self.comment_count(issue_id) if issue_id in self._base_ids(project_id) else 0
+        return generated + len(self.added_comments.get(issue_id, ())) - self.deleted_comments.get(issue_id, 0)
+
+    def comments(self, project_id, issue_id):
+        issue = self.issue(project_id, issue_id)
+        reported = datetime.datetime.fromisoformat(issue["reportedDate"])
+        generated = [
+            {
+                "id": issue_id * 1000 + k,
+                "username": f"dev{(issue_id + k) % self.users}",
+                "createdAt": (reported + datetime.timedelta(hours=k + 1)).strftime("%Y-%m-%dT%H:%M:%S"),
+                "content": f"comment {k + 1} on issue {issue_id}",
+            }
+            for k in range(self.comment_count(issue_id))
+            if issue_id in self._base_ids(project_id)
+        ]
+        comments = generated + self.added_comments.get(issue_id, [])
+        if not self.comment_overrides:
+            return comments
+        overrides = self.comment_overrides
+        return [
+            {**comment, "content": overrides[comment["id"]]} if comment["id"] in overrides else comment
+            for comment in comments
+            if overrides.get(comment["id"], '') is not None
+        ]
+
+    def create_project(self, name):
+        project = {"id": len(self.projects) + 1, "name": name}
+        self.projects.append(project)
+        return project
+
+    def create_issue(self, project_id, body):
+        issue = {
+            "assigneeUsername": None, "fixerUsername": None, "priority": "MAJOR", "status": "NEW",
+            **body, "id": self.next_issue_id,
+        }
+        self.next_issue_id += 1
+        self.changed[(project_id, issue["id"])] = issue
+        self.created.setdefault(project_id, []).append(issue["id"])
+        self._engines.pop(project_id, None)
+        self._bump('issues', project_id)
+        return issue
+
+    def update_issue(self, project_id, issue_id, body):
+        issue = {**self.issue(project_id, issue_id), **body, "id": issue_id}
+        self.changed[(project_id, issue_id)] = issue
+        self._engines.pop(project_id, None)
+        self._bump('issues', project_id)
+        return issue
+
+    def delete_issue(self, project_id, issue_id):
+        self.changed[(project_id, issue_id)] = None
+        self._engines.pop(project_id, None)
+        self._bump('issues', project_id)
+
+    def add_comment(self, project_id, issue_id, content):
+        comment = {
+            "id": self.next_comment_id, "username": "tester0",
+            "createdAt": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S"), "content": content,
+        }
+        self.next_comment_id += 1
+        self.added_comments.setdefault(issue_id, []).append(comment)
+        self._engines.pop(project_id, None)
+        self._bump('comments', issue_id)
+        return comment
+
+    def update_comment(self, project_id, issue_id, comment_id, content):
+        if not any(c["id"] == comment_id for c in self.comments(project_id, issue_id)):
+            return None
+        self.comment_overrides[comment_id] = content
+        self._bump('comments', issue_id)
+        return next(c for c in self.comments(project_id, issue_id) if c["id"] == comment_id)
+
+    def delete_comment(self, project_id, issue_id, comment_id):
+        if any(c["id"] == comment_id for c in self.comments(project_id, issue_id)):
+            self.comment_overrides[comment_id] = None
+            self.deleted_comments[issue_id] = self.deleted_comments.get(issue_id, 0) + 1
+            self._engines.pop(project_id, None)
+            self._bump('comments', issue_id)
+
+    def statistics(self, project_id, endpoint):
+        """
+        통계를 계산한다. 이슈가 바뀌기 전까지는 처음 만든 통계 엔진을 재사용한다.
+        """
+        from issuemanagement.stats_engine import StatisticsEngine
+
+        engine = self._engines.get(project_id)
+        if engine is None:
+            issues = list(self.iter_issues(project_id))
+            engine = self._engines[project_id] = StatisticsEngine(
+                [i["id"] for i in issues], [i["title"] for i in issues],
+                [i["reportedDate"] for i in issues], [i["status"] for i in issues],
+                [i["priority"] for i in issues], [i["assigneeUsername"] for i in issues],
+                [i["fixerUsername"] for i in issues],
+                [self._comment_total(project_id, i["id"]) for i in issues],
+                self.today.date(),
+            )
+        return engine.compute(endpoint)
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 한 번에 보내 Nagle 알고리즘과 지연 ACK 로 인한 지연을 피한다.
+    disable_nagle_algorithm = True
+    wbufsize = -1
+    # 응답에 붙일 ETag (이슈/댓글 목록 GET 만)
+    etag = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def _handle(self, method):
+        server = self.server
+        with server.lock:
+            server.requests.append((method, self.path))
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'null')
+
+        faults = server.faults
+        if faults.latency:
+            time.sleep(faults.latency)
+        if faults.hang:
+            # 클라이언트가 포기할 때까지 응답하지 않는다.
+            server.released.wait()
+            self.close_connection = True
+            return
+        if random.random() < faults.drop_rate:
+            self.close_connection = True
+            return
+        if random.random() < faults.error_rate:
+            self._send(faults.error_status, {"error": "injected"})
+            return
+
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        with server.lock:
+            self.etag = server.etag(url.path) if method == 'GET' else None
+            if self.etag is not None and self.headers.get('If-None-Match') == self.etag:
+                status, payload = 304, None
+            else:
+                status, payload = server.route(method, url.path, params, body)
+        if isinstance(payload, (dict, list)) or payload is None:
+            self._send(status, payload)
+        else:
+            self._send_array(status, payload)
+
+    def _send(self, status, payload=None):
+        data = b'' if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        if status == 200 and self.command == 'POST' and self.path.endswith('/login'):
+            self.send_header('Set-Cookie', 'jwt=stand-in; Path=/')
+        if self.etag is not None and status in (200, 304):
+            self.send_header('ETag', self.etag)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_array(self, status, records):
+        """
+        레코드 반복자를 JSON 배열로 만들어 가며 청크 전송 인코딩으로 보낸다.
+        """
+        self.send_response(status)
+        if self.etag is not None:
+            self.send_header('ETag', self.etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        batch = []
+        first = True
+        for record in records:
+            batch.append(json.dumps(record))
+            if len(batch) >= STREAM_BATCH:
+                self._write_chunk(('[' if first else ',') + ','.join(batch))
+                first = False
+                batch = []
+        self._write_chunk(('[' if first else (',' if batch else '')) + ','.join(batch) + ']')
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _write_chunk(self, text):
+        data = text.encode()
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Dataset 을 제공하는 대역 서버
+    """
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), projects=1, issues=50, comments=2, faults=None):
+        super().__init__(address, StandInHandler)
+        self.faults = faults or Faults()
+        self.data = Dataset(projects, issues, comments)
+        self.lock = threading.Lock()
+        # 받은 요청 (메서드, 경로) 기록
+        self.requests = []
+        # hang 장애로 붙잡아 둔 요청을 풀어준다.
+        self.released = threading.Event()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """
+        백그라운드 스레드에서 요청을 받기 시작하고 자신을 반환한다.
+        """
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.released.set()
+        self.shutdown()
+        self.server_close()
+
+    def etag(self, path):
+        """
+        이슈 목록과 댓글 목록 GET 에 붙일 ETag 를 반환한다. 다른 경로는 None 을 반환한다.
+        """
+        match = re.fullmatch(r'/projects/(\d+)/issues(?:/(\d+)/comments)?', path)
+        if match is None or not self.data.has_project(int(match[1])):
+            return None
+        if match[2] is None:
+            return self.data.etag('issues', int(match[1]))
+        if self.data.issue(int(match[1]), int(match[2])) is None:
+            return None
+        return self.data.etag('comments', int(match[2]))
+
+    def route(self, method, path, params, body):
+        """
+        요청을 처리하고 (상태 코드, 응답 본문) 을 반환한다. 목록은 반복자로 반환해 받는 대로 보낸다.
+        """
+        data = self.data
+        if path == '/users/login':
+            return 200, {}
+        if path == '/users/logout':
+            return 200, {}
+        if path == '/users/signup':
+            return 201, {}
+        if path == '/users/devs':
+            return 200, [{"username": f"dev{i}", "role": "DEV"} for i in range(data.users)]
+        if path == '/projects':
+            if method == 'POST':
+                return 201, data.create_project(body.get("name"))
+            return 200, data.projects
+
+        match = re.fullmatch(r'/projects/(\d+)(?:/issues(?:/(search|searchbynl|\d+))?(?:/(comments|recommendedAssignees))?)?(?:/comments/(\d+))?', path)
+        if match and data.has_project(int(match[1])):
+            project_id = int(match[1])
+            if path == f'/projects/{project_id}':
+                if method == 'DELETE':
+                    data.projects = [p for p in data.projects if p["id"] != project_id]
+                    return 204, None
+                return 200, next(p for p in data.projects if p["id"] == project_id)
+            return self._route_issues(method, project_id, match[2], match[3], match[4], params, body)
+        match = re.fullmatch(r'/projects/(\d+)/statistics/(.+)', path)
+        if match and data.has_project(int(match[1])):
+            result = data.statistics(int(match[1]), match[2])
+            return (404, {"error": "unknown statistics"}) if result is None else (200, result)
+        return 404, {"error": "not found"}
+
+    def _route_issues(self, method, project_id, target, sub, comment_id, params, body):
+        data = self.data
+        if target is None:
+            if method == 'POST':
+                return 201, data.create_issue(project_id, body)
+            return 200, data.iter_issues(project_id)
+        if target == 'search':
+            fields = {key: value for key, value in params.items() if key != 'projectId'}
+            return 200, (
+                issue for issue in data.iter_issues(project_id)
+                if all(issue.get(k) == v for k, v in fields.items())
+            )
+        if target == 'searchbynl':
+            words = set(params.get('userMessage', '').lower().split())
+            matches = (
+                issue for issue in data.iter_issues(project_id)
+                if words & set(issue["title"].lower().split())
+            )
+            return 200, [issue for _, issue in zip(range(20), matches)]
+
+        issue_id = int(target)
+        issue = data.issue(project_id, issue_id)
+        if issue is None:
+            return 404, {"error": "not found"}
+        if sub == 'recommendedAssignees':
+            return 200, [{"username": f"dev{(issue_id + k) % data.users}"} for k in range(3)]
+        if sub == 'comments' or comment_id is not None:
+            if method == 'POST':
+                return 201, data.add_comment(project_id, issue_id, body.get("content"))
+            if comment_id is not None:
+                if method == 'DELETE':
+                    data.delete_comment(project_id, issue_id, int(comment_id))
+                    return 204, None
+                comment = data.update_comment(project_id, issue_id, int(comment_id), (body or {}).get("content"))
+                return (200, comment) if comment is not None else (404, {"error": "not found"})
+            return 200, data.comments(project_id, issue_id)
+        if method == 'PUT':
+            return 200, data.update_issue(project_id, issue_id, body)
+        if method == 'DELETE':
+            data.delete_issue(project_id, issue_id)
+            return 204, None
+        return 200, issue
+
+def main():
+    parser = argparse.ArgumentParser(description='장애를 주입할 수 있는 로컬 대역 API 서버')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--projects', type=int, default=1, help='프로젝트 수')
+    parser.add_argument('--issues', type=int, default=50, help='프로젝트당 이슈 수')
+    parser.add_argument('--comments', type=int, default=2, help='이슈당 평균 댓글 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연(초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 확률')
+    parser.add_argument('--error-status', type=int, default=503, help='오류 응답 코드')
+    parser.add_argument('--drop-rate', type=float, default=0.0, help='연결을 끊을 확률')
+    parser.add_argument('--hang', action='store_true', help='응답하지 않기')
+    args = parser.parse_args()
+
+    faults = Faults(args.latency, args.error_rate, args.error_status, args.drop_rate, args.hang)
+    server = StandInServer(('127.0.0.1', args.port), args.projects, args.issues, args.comments, faults)
+    print(f"{server.base_url} 에서 대기 중 (Ctrl+C 로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.released.set()
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
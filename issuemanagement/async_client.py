@@ -0,0 +1,282 @@
+import asyncio
+import contextlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+# 동시에 보낼 최대 요청 수의 기본값
+DEFAULT_CONCURRENCY = 16
+
+class AsyncClient:
+    """
+    프로젝트/이슈/댓글/통계 조회의 asyncio 버전을 제공하는 클래스.
+    요청은 세션이 공유하는 연결 풀(transport)로 보내므로 제한 시간, 재시도, 캐시, 지표가 그대로 적용된다.
+    blocking HTTP 호출은 전용 스레드 풀에서 실행하고, 세마포어로 동시에 보내는 요청 수를 제한한다.
+    동기 메뉴 코드는 run() 이나 *_sync 메서드로 호출한다.
+    """
+    def __init__(self, base_url, session, max_concurrency=None):
+        self.base_url = base_url
+        self.session = session
+        # 연결 풀보다 많이 보내면 연결을 기다리기만 하므로 풀 크기를 넘지 않는다.
+        self.max_concurrency = max_concurrency or min(DEFAULT_CONCURRENCY, session.transport.pool_maxsize)
+        self._executor = None
+        self._semaphore = None
+        self._loop = None
+
+    # --- 실행 ---
+
+    def run(self, coroutine):
+        """
+        동기 코드에서 코루틴을 실행하고 결과를 반환한다. Ctrl+C 를 누르면 남은 작업을 취소한다.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            self._executor = executor
+            try:
+                return asyncio.run(coroutine)
+            finally:
+                self._executor = None
+                self._semaphore = None
+                self._loop = None
+
+    def iterate(self, async_iterable):
+        """
+        비동기 반복자를 동기 코드에서 하나씩 꺼내 쓰는 반복자로 바꾼다.
+        꺼내지 않는 동안에는 이벤트 루프가 멈추고, 반복을 멈추거나 Ctrl+C 를 누르면 남은 작업을 취소한다.
+        """
+        iterator = aiter(async_iterable)
+
+        async def next_item():
+            return await anext(iterator)
+
+        loop = asyncio.new_event_loop()
+        step = None
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            self._executor = executor
+            try:
+                while True:
+                    step = loop.create_task(next_item())
+                    try:
+                        yield loop.run_until_complete(step)
+                    except StopAsyncIteration:
+                        return
+            finally:
+                try:
+                    if step is not None and not step.done():
+                        # Ctrl+C 로 멈춘 경우 진행 중이던 단계를 취소해야 반복자를 닫을 수 있다.
+                        step.cancel()
+                        loop.run_until_complete(asyncio.gather(step, return_exceptions=True))
+                    loop.run_until_complete(iterator.aclose())
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                finally:
+                    loop.close()
+                    self._executor = None
+                    self._semaphore = None
+                    self._loop = None
+
+    @staticmethod
+    async def _as_completed(coroutines):
+        """
+        코루틴을 동시에 실행하고 끝나는 순서대로 결과를 내보낸다. 반복을 멈추면 남은 작업을 취소한다.
+        """
+        tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _call(self, function, *args):
+        """
+        blocking 함수를 스레드 풀에서 실행한다. 세마포어를 얻을 때까지 기다린다.
+        이미 실행 중인 HTTP 요청은 취소해도 제한 시간까지는 스레드에서 계속 실행된다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 세마포어는 이벤트 루프마다 새로 만든다.
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, function, *args)
+
+    def _get_json(self, url, params=None, cache=False):
+        response = self.session.transport.get(url, params=params, cache=cache)
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    # --- 단일 조회 ---
+
+    async def fetch_projects(self):
+        """
+        모든 프로젝트를 반환한다. 실패하면 None 을 반환한다.
+        """
+        return await self._call(self._get_json, f'{self.base_url}/projects', None, True)
+
+    async def fetch_issues(self, project_id):
+        """
+        프로젝트의 모든 이슈를 반환한다. 실패하면 None 을 반환한다.
+        """
+        return await self._call(self._get_json, f'{self.base_url}/projects/{project_id}/issues')
+
+    async def search_issues(self, project_id, params=None, user_message=None):
+        """
+        이슈 검색 결과를 반환한다. user_message 를 주면 서버의 자연어 검색을 사용한다. 실패하면 None 을 반환한다.
+        """
+        if user_message is not None:
+            return await self._call(
+                self._get_json, f'{self.base_url}/projects/{project_id}/issues/searchbynl',
+                {"userMessage": user_message},
+            )
+        return await self._call(
+            self._get_json, f'{self.base_url}/projects/{project_id}/issues/search',
+            {"projectId": project_id, **(params or {})},
+        )
+
+    async def fetch_issue(self, project_id, issue_id):
+        """
+        이슈 하나를 반환한다. 실패하면 None 을 반환한다.
+        """
+        return await self._call(
+            self._get_json, f'{self.base_url}/projects/{project_id}/issues/{issue_id}', None, True
+        )
+
+    async def fetch_comments(self, project_id, issue_id):
+        """
+        이슈의 댓글 목록을 반환한다. 실패하면 None 을 반환한다.
+        """
+        return await self._call(
+            self._get_json, f'{self.base_url}/projects/{project_id}/issues/{issue_id}/comments'
+        )
+
+    async def fetch_statistics(self, project_id, endpoint):
+        """
+        프로젝트의 통계 데이터 하나를 반환한다. (예: 'issuesPerMonth') 실패하면 None 을 반환한다.
+        """
+        return await self._call(
+            self._get_json, f'{self.base_url}/projects/{project_id}/statistics/{endpoint}', None, True
+        )
+
+    # --- 여러 건 동시 조회 ---
+
+    async def fetch_issue_detail(self, project_id, issue_id, with_comments=True):
+        """
+        이슈와 댓글을 동시에 요청해 {"projectId", "issue", "comments"} 사전으로 반환한다.
+        이슈를 불러오지 못하면 issue 가 None, 댓글을 불러오지 못하면 comments 가 None 이다.
+        """
+        if with_comments:
+            issue, comments = await asyncio.gather(
+                self.fetch_issue(project_id, issue_id), self.fetch_comments(project_id, issue_id)
+            )
+        else:
+            issue, comments = await self.fetch_issue(project_id, issue_id), None
+        return {"projectId": project_id, "id": issue_id, "issue": issue, "comments": comments}
+
+    async def iter_issue_details(self, project_id, issue_ids, with_comments=True):
+        """
+        여러 이슈의 상세와 댓글을 동시에 요청하고 끝나는 순서대로 내보내는 비동기 반복자.
+        반복을 멈추면 아직 시작하지 않은 요청은 취소한다.
+        """
+        details = self._as_completed(
+            self.fetch_issue_detail(project_id, issue_id, with_comments) for issue_id in dict.fromkeys(issue_ids)
+        )
+        async with contextlib.aclosing(details):
+            async for detail in details:
+                yield detail
+
+    async def fetch_issue_details(self, project_id, issue_ids, with_comments=True):
+        """
+        여러 이슈의 상세와 댓글을 동시에 요청해 issue_ids 순서대로 반환한다.
+        """
+        return await asyncio.gather(*(
+            self.fetch_issue_detail(project_id, issue_id, with_comments)
+            for issue_id in dict.fromkeys(issue_ids)
+        ))
+
+    async def fetch_comments_many(self, project_id, issue_ids):
+        """
+        여러 이슈의 댓글을 동시에 요청해 {이슈 ID: 댓글 목록} 으로 반환한다. 불러오지 못한 이슈는 None 이다.
+        """
+        issue_ids = list(dict.fromkeys(issue_ids))
+        results = await asyncio.gather(*(self.fetch_comments(project_id, issue_id) for issue_id in issue_ids))
+        return dict(zip(issue_ids, results))
+
+    async def search_projects(self, projects, params=None, user_message=None):
+        """
+        여러 프로젝트에 같은 검색을 동시에 요청하고 끝나는 순서대로 (프로젝트, 검색 결과) 를 내보내는 비동기 반복자.
+        검색에 실패한 프로젝트는 검색 결과가 None 이다.
+        """
+        async def search(project):
+            return project, await self.search_issues(project['id'], params, user_message)
+
+        results = self._as_completed(search(project) for project in projects)
+        async with contextlib.aclosing(results):
+            async for result in results:
+                yield result
+
+    async def fetch_project_statistics(self, project_ids, endpoints):
+        """
+        여러 프로젝트의 여러 통계를 동시에 요청해 {프로젝트 ID: {엔드포인트: 데이터}} 로 반환한다.
+        """
+        pairs = [(project_id, endpoint) for project_id in project_ids for endpoint in endpoints]
+        results = await asyncio.gather(*(
+            self.fetch_statistics(project_id, endpoint) for project_id, endpoint in pairs
+        ))
+        statistics = {project_id: {} for project_id in project_ids}
+        for (project_id, endpoint), data in zip(pairs, results):
+            statistics[project_id][endpoint] = data
+        return statistics
+
+    # --- 동기 코드용 ---
+
+    def fetch_issue_details_sync(self, project_id, issue_ids, with_comments=True):
+        return self.run(self.fetch_issue_details(project_id, issue_ids, with_comments))
+
+    def export_issue_details(self, project_id, path, issue_ids=None, with_comments=True):
+        """
+        이슈 상세와 댓글을 동시에 받아 끝나는 대로 JSONL 파일에 쓴다. (쓴 수, 실패한 이슈 ID 목록) 을 반환한다.
+        issue_ids 를 주지 않으면 프로젝트의 모든 이슈를 내보낸다.
+        """
+        async def export(file):
+            ids = issue_ids
+            if ids is None:
+                issues = await self.fetch_issues(project_id)
+                if issues is None:
+                    return None
+                ids = [issue['id'] for issue in issues]
+            written, failed = 0, []
+            async for detail in self.iter_issue_details(project_id, ids, with_comments):
+                if detail["issue"] is None or (with_comments and detail["comments"] is None):
+                    failed.append(detail["id"])
+                    continue
+                file.write(json.dumps(detail, ensure_ascii=False) + '\n')
+                written += 1
+            return written, failed
+
+        with open(path, 'w', encoding='utf-8') as file:
+            return self.run(export(file))
+
+    def export_screen(self, project_id):
+        """
+        프로젝트 이슈의 상세와 댓글을 JSONL 파일로 내보내는 화면
+        """
+        path = input("저장할 파일 경로: ").strip()
+        if not path:
+            print("파일 경로를 입력하세요.")
+            return
+        with_comments = input("댓글도 포함할까요? (y/n): ").strip().lower() != 'n'
+        try:
+            result = self.export_issue_details(project_id, path, with_comments=with_comments)
+        except OSError as error:
+            print(f"파일을 저장하지 못했습니다: {error}")
+            return
+        except KeyboardInterrupt:
+            print("내보내기를 중단했습니다.")
+            return
+        if result is None:
+            print("이슈 목록을 불러오는 데 실패했습니다.")
+            return
+        written, failed = result
+        print(f"{written}개 이슈를 {path} 에 저장했습니다.")
+        if failed:
+            print(f"불러오지 못한 이슈 {len(failed)}개: {', '.join(map(str, failed[:20]))}")
@@ -1,5 +1,4 @@
 import getpass
-import requests
 
 class AuthManager:
     """
@@ -14,7 +13,7 @@ class AuthManager:
         사용자의 로그인을 처리하고 성공하면 쿠키를 반환한다.
         """
         data = {"username": username, "password": password}
-        response = requests.post(f'{self.base_url}/users/login', json=data)
+        response = self.session.transport.post(f'{self.base_url}/users/login', json=data)
 
         if response.status_code == 200:
             return response.cookies
@@ -24,8 +23,8 @@ class AuthManager:
         """
         현재 사용자를 로그아웃한다.
         """
-        response = requests.post(
-            f'{self.base_url}/users/logout', headers=self.session.get_headers()
+        response = self.session.transport.post(
+            f'{self.base_url}/users/logout'
         )
         return response.status_code == 200
 
@@ -34,8 +33,8 @@ class AuthManager:
         새로운 사용자 계정을 생성한다. (관리자용)
         """
         data = {"username": username, "password": password, "role": role}
-        response = requests.post(
-            f'{self.base_url}/users/signup', json=data, headers=self.session.get_headers()
+        response = self.session.transport.post(
+            f'{self.base_url}/users/signup', json=data
         )
         return response.status_code == 201
 
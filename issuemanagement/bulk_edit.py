@@ -0,0 +1,209 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from issuemanagement.models import PRIORITIES, STATUSES
+
+# 일괄 수정할 수 있는 필드
+EDITABLE_FIELDS = ('status', 'priority', 'assigneeUsername')
+DEFAULT_WORKERS = 8
+
+def diff_issue(before, after):
+    """
+    두 이슈의 바뀐 필드를 {필드: [이전 값, 새 값]} 사전으로 반환한다.
+    """
+    return {
+        field: [before.get(field), after[field]]
+        for field in after
+        if before.get(field) != after[field]
+    }
+
+class BulkEditManager:
+    """
+    여러 이슈의 상태, 우선순위, 담당자를 한 번에 수정하는 클래스
+    """
+    def __init__(self, base_url, session, max_workers=None):
+        self.base_url = base_url
+        self.session = session
+        # 동시에 보낼 GET/PUT 쌍의 수 (연결 풀보다 많으면 연결을 기다리기만 한다.)
+        self.max_workers = max_workers or min(DEFAULT_WORKERS, session.transport.pool_maxsize)
+
+    def validate_changes(self, changes):
+        """
+        수정 내용을 검사하고 정리된 사전을 반환한다. 잘못된 값이 있으면 ValueError 를 발생시킨다.
+        담당자를 지정하면 개발자 목록을 한 번만 불러와 확인하고, 상태를 함께 주지 않았으면 ASSIGNED 로 바꾼다.
+        """
+        changes = {field: value for field, value in changes.items() if value is not None}
+        unknown = set(changes) - set(EDITABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"일괄 수정할 수 없는 항목입니다: {', '.join(sorted(unknown))}")
+        if not changes:
+            raise ValueError("수정할 항목이 없습니다.")
+        if 'status' in changes:
+            changes['status'] = changes['status'].upper()
+            if changes['status'] not in STATUSES:
+                raise ValueError(f"잘못된 상태입니다: {changes['status']}")
+        if 'priority' in changes:
+            changes['priority'] = changes['priority'].upper()
+            if changes['priority'] not in PRIORITIES:
+                raise ValueError(f"잘못된 우선순위입니다: {changes['priority']}")
+        if 'assigneeUsername' in changes:
+            devs = self.load_developers()
+            if devs is None:
+                raise ValueError("개발자 목록을 불러오는 데 실패했습니다.")
+            if changes['assigneeUsername'] not in devs:
+                raise ValueError(f"개발자 목록에 없는 담당자입니다: {changes['assigneeUsername']}")
+            changes.setdefault('status', 'ASSIGNED')
+        return changes
+
+    def load_developers(self):
+        """
+        개발자 이름 집합을 반환한다. 실패하면 None 을 반환한다.
+        """
+        response = self.session.transport.get(f'{self.base_url}/users/devs', cache=True)
+        if response.status_code != 200:
+            return None
+        return {dev['username'] for dev in response.json()}
+
+    def bulk_edit(self, project_id, issue_ids, changes, dry_run=False):
+        """
+        이슈들에 수정 내용을 동시에 적용하고 결과 보고서를 반환한다.
+        dry_run=True 이면 이슈를 불러와 바뀔 내용만 계산하고 서버에는 쓰지 않는다.
+        """
+        changes = self.validate_changes(changes)
+        issue_ids = list(dict.fromkeys(issue_ids))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(
+                lambda issue_id: self._edit_one(project_id, issue_id, changes, dry_run), issue_ids
+            ))
+
+        report = {
+            "projectId": project_id,
+            "dryRun": dry_run,
+            "changes": changes,
+            "updated": [],
+            "unchanged": [],
+            "failed": [],
+        }
+        saved = []
+        for issue_id, issue, diff, error in results:
+            if error is not None:
+                report["failed"].append({"id": issue_id, "error": error})
+            elif not diff:
+                report["unchanged"].append(issue_id)
+            else:
+                report["updated"].append({"id": issue_id, "title": issue.get('title'), "diff": diff})
+                saved.append(issue)
+
+        mirror = self.session.mirror
+        if saved and not dry_run and mirror is not None:
+            # 수정한 이슈를 한 번에 미러에 반영한다.
+            mirror.save_issues(project_id, saved)
+        return report
+
+    def _edit_one(self, project_id, issue_id, changes, dry_run):
+        """
+        이슈 하나를 불러와 수정 내용을 적용한다. (이슈 ID, 수정된 이슈, 차이, 오류) 를 반환한다.
+        """
+        try:
+            return self._get_and_put(project_id, issue_id, changes, dry_run)
+        except requests.RequestException as error:
+            # 한 이슈의 통신 실패가 나머지 이슈의 수정을 막지 않도록 결과로 기록한다.
+            return issue_id, None, None, f'통신 실패 ({error.__class__.__name__})'
+
+    def _get_and_put(self, project_id, issue_id, changes, dry_run):
+        url = f'{self.base_url}/projects/{project_id}/issues/{issue_id}'
+        # 불러온 본문 전체를 다시 PUT 하므로 캐시된 본문도 서버에 재검증한 뒤에만 쓴다.
+        # (확인하지 않은 본문을 쓰면 그사이 다른 사용자가 고친 내용을 덮어쓴다)
+        response = self.session.transport.get(url, cache=True, revalidate=True)
+        if response.status_code != 200:
+            return issue_id, None, None, f'조회 실패 (HTTP {response.status_code})'
+        issue = response.json()
+        diff = diff_issue(issue, changes)
+        if not diff or dry_run:
+            return issue_id, {**issue, **changes}, diff, None
+
+        updated = {**issue, **changes}
+        response = self.session.transport.put(url, json=updated)
+        if response.status_code != 200:
+            return issue_id, None, None, f'수정 실패 (HTTP {response.status_code})'
+        return issue_id, updated, diff, None
+
+    def bulk_edit_screen(self, project_id):
+        """
+        이슈를 골라 일괄 수정한다. 바뀔 내용을 먼저 보여주고 확인을 받은 뒤에 적용한다.
+        """
+        issue_ids = self._select_issue_ids(project_id)
+        if not issue_ids:
+            print("선택된 이슈가 없습니다.")
+            return
+
+        print(f"선택된 이슈: {len(issue_ids)}개")
+        print("바꿀 값을 입력하세요. (바꾸지 않을 항목은 비워두세요)")
+        changes = {
+            "status": input("상태 (NEW, ASSIGNED, FIXED, RESOLVED, CLOSED, REOPENED): ").strip() or None,
+            "priority": input("우선순위 (BLOCKER, CRITICAL, MAJOR, MINOR, TRIVIAL): ").strip() or None,
+            "assigneeUsername": input("담당자: ").strip() or None,
+        }
+        try:
+            report = self.bulk_edit(project_id, issue_ids, changes, dry_run=True)
+        except ValueError as error:
+            print(error)
+            return
+
+        self._print_report(report)
+        if not report["updated"]:
+            return
+        if input(f"{len(report['updated'])}개 이슈를 수정할까요? (y/n): ").strip().lower() != 'y':
+            print("일괄 수정을 취소했습니다.")
+            return
+        report = self.bulk_edit(project_id, [item["id"] for item in report["updated"]], changes)
+        self._print_report(report)
+
+    def _select_issue_ids(self, project_id):
+        """
+        일괄 수정할 이슈 ID 목록을 입력받는다. (ID 목록, 검색 조건 또는 검색어)
+        """
+        select_by = input("선택 방법 (ids, assignee, reporter, status, priority, text, all): ").strip().lower()
+        if select_by == "ids":
+            try:
+                return [int(value) for value in input("이슈 ID (쉼표로 구분): ").replace(',', ' ').split()]
+            except ValueError:
+                print("잘못된 입력입니다. 숫자를 입력하세요.")
+                return None
+
+        filters = {}
+        query = ''
+        if select_by in ("assignee", "reporter"):
+            filters[select_by] = input("이름: ").strip()
+        elif select_by in ("status", "priority"):
+            filters[select_by] = input("값: ").strip().upper()
+        elif select_by == "text":
+            query = input("검색어: ")
+        elif select_by != "all":
+            print("잘못된 입력입니다.")
+            return None
+        issues = self.session.issue_manager.find_issues(project_id, query, **filters)
+        if issues is None:
+            print("이슈 검색에 실패했습니다.")
+            return None
+        return [issue['id'] for issue in issues]
+
+    @staticmethod
+    def _print_report(report):
+        """
+        일괄 수정 결과 (또는 미리보기) 를 표시한다.
+        """
+        title = "일괄 수정 미리보기" if report["dryRun"] else "일괄 수정 결과"
+        print(f"\n--- {title} ---")
+        for item in report["updated"]:
+            print(f"#{item['id']} {item['title']}")
+            for field, (old, new) in item["diff"].items():
+                print(f"  {field}: {old if old else '미지정'} -> {new}")
+        verb = "수정 예정" if report["dryRun"] else "수정됨"
+        print(
+            f"{verb} {len(report['updated'])}개, 변경 없음 {len(report['unchanged'])}개, "
+            f"실패 {len(report['failed'])}개"
+        )
+        for item in report["failed"]:
+            print(f"  실패 #{item['id']}: {item['error']}")
@@ -0,0 +1,330 @@
+import csv
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# 파일 확장자 -> 입력 형식
+IMPORT_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+# 서버가 이슈를 만들지 않았다고 보고 다시 보낼 응답 코드 (요청 과다, 일시적으로 사용 불가)
+# 다른 5xx 는 이슈가 만들어졌을 수도 있으므로 다시 보내지 않고 다음 실행에서 확인한다.
+RETRY_STATUSES = {429, 503}
+# 동시에 보낼 요청 수와 초당 요청 수의 기본값 (초당 요청 수 0 이면 제한하지 않음)
+DEFAULT_WORKERS = 8
+DEFAULT_RATE = 20.0
+# 진행 상황을 출력하는 간격(초)
+PROGRESS_INTERVAL = 1.0
+
+def read_records(path):
+    """
+    CSV 또는 JSONL 파일을 열어 (레코드 번호, 레코드) 를 한 줄씩 내보내는 반복자를 반환한다.
+    파일 전체를 메모리에 올리지 않는다.
+    """
+    fmt = IMPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {path} (csv, jsonl)")
+    f = open(path, newline='', encoding='utf-8-sig')
+    return _iter_csv(f) if fmt == 'csv' else _iter_jsonl(f)
+
+def _iter_csv(f):
+    with f:
+        yield from enumerate(csv.DictReader(f))
+
+def _iter_jsonl(f):
+    with f:
+        index = 0
+        for line in f:
+            if line.strip():
+                yield index, json.loads(line)
+                index += 1
+
+def _request_not_sent(error):
+    """
+    연결을 맺지 못해 요청이 서버에 닿지 않은 오류이면 True 를 반환한다.
+    응답을 기다리다 끊긴 경우(읽기 시간 초과, 연결 끊김)는 서버가 이슈를 만들었을 수 있으므로 False 이다.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+class RateLimiter:
+    """
+    초당 요청 수를 제한하는 토큰 버킷. 여러 스레드에서 함께 사용한다.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        토큰 하나를 얻을 때까지 기다린다.
+        """
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+class Checkpoint:
+    """
+    가져오기 진행 상황을 기록하는 JSONL 파일.
+    요청을 보내기 전에 'sent', 성공하면 'done', 실패하면 'failed' 를 한 줄씩 덧붙인다.
+    서버에 반영되었는지 알 수 없는 경우에는 'sent' 로 남겨 다음 실행에서 서버의 이슈 목록과 맞춰 본다.
+    """
+    def __init__(self, path, project_id):
+        self.path = path
+        self.project_id = project_id
+        # 레코드 번호 -> 마지막 기록
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 중단되어 잘린 마지막 줄
+                        continue
+                    if entry.get('project') == project_id:
+                        self.entries[entry['index']] = entry
+        self.file = open(path, 'a', encoding='utf-8')
+        self.lock = threading.Lock()
+
+    def state(self, index):
+        entry = self.entries.get(index)
+        return entry['state'] if entry else None
+
+    def record(self, index, state, **fields):
+        entry = {'project': self.project_id, 'index': index, 'state': state, **fields}
+        with self.lock:
+            self.entries[index] = entry
+            self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            # 프로세스가 중단되어도 기록이 남도록 바로 내보낸다.
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class ImportManager:
+    """
+    CSV/JSONL 파일의 이슈를 동시에 등록하는 클래스. 중단된 가져오기는 체크포인트에서 이어서 진행한다.
+    """
+    def __init__(self, base_url, session, max_retries=5, backoff=0.5):
+        self.base_url = base_url
+        self.session = session
+        # 일시적인 실패를 다시 시도할 최대 횟수와 첫 대기 시간(초)
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+    def import_issues(self, project_id, path, checkpoint_path=None, max_workers=None, rate=DEFAULT_RATE):
+        """
+        파일의 이슈를 프로젝트에 등록하고 결과 요약을 반환한다.
+        체크포인트에 완료로 기록된 레코드는 건너뛰고, 보냈지만 결과가 기록되지 않은 레코드는
+        서버에 이미 등록되었는지 확인한 뒤에만 다시 보낸다.
+        """
+        records = read_records(path)
+        checkpoint = Checkpoint(checkpoint_path or f'{path}.checkpoint', project_id)
+        # 연결 풀보다 많은 스레드는 연결을 기다리기만 한다.
+        workers = max_workers or min(DEFAULT_WORKERS, self.session.transport.pool_maxsize)
+        limiter = RateLimiter(rate)
+        issue_manager = self.session.issue_manager
+        summary = {
+            "projectId": project_id,
+            "created": 0,
+            "skipped": 0,
+            "recovered": 0,
+            "failed": 0,
+            "unconfirmed": 0,
+            "interrupted": False,
+        }
+        existing = None
+        started = last_report = time.monotonic()
+
+        def finish(futures):
+            for future in futures:
+                index, state, value = future.result()
+                if state == 'done':
+                    # 응답 본문에서 ID 를 읽지 못했으면 ID 없이 완료로 기록한다.
+                    checkpoint.record(index, 'done', id=value)
+                    summary["created"] += 1
+                elif state == 'failed':
+                    checkpoint.record(index, 'failed', error=value)
+                    summary["failed"] += 1
+                else:
+                    # 'sent' 기록을 그대로 두어 다음 실행에서 등록 여부를 확인한다.
+                    summary["unconfirmed"] += 1
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        in_flight = set()
+        try:
+            for index, record in records:
+                state = checkpoint.state(index)
+                if state == 'done':
+                    summary["skipped"] += 1
+                    continue
+
+                title = (record.get('title') or '').strip()
+                if not title:
+                    checkpoint.record(index, 'failed', error='제목 없음')
+                    summary["failed"] += 1
+                    continue
+                reported_date = record.get('reportedDate') or None
+                if state == 'sent':
+                    # 이전 실행에서 요청을 보낸 뒤 결과를 기록하지 못했다. 같은 등록일로 다시 만든다.
+                    reported_date = checkpoint.entries[index].get('reportedDate') or reported_date
+                issue = issue_manager.build_issue(
+                    project_id, title, record.get('description') or '', reported_date
+                )
+                if state == 'sent':
+                    if existing is None:
+                        existing = self._existing_issue_keys(project_id)
+                    issue_id = existing.get(self._issue_key(issue))
+                    if issue_id is not None:
+                        checkpoint.record(index, 'done', id=issue_id)
+                        summary["recovered"] += 1
+                        continue
+
+                if len(in_flight) >= workers * 2:
+                    # 파일을 끝까지 읽어 두지 않도록 진행 중인 요청 수를 제한한다.
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    finish(done)
+                in_flight.add(executor.submit(self._submit, project_id, index, issue, checkpoint, limiter))
+
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    self._print_progress(summary, now - started)
+            while in_flight:
+                done, in_flight = wait(in_flight, timeout=PROGRESS_INTERVAL)
+                finish(done)
+                if in_flight:
+                    self._print_progress(summary, time.monotonic() - started)
+        except KeyboardInterrupt:
+            # 보내는 중이던 요청은 'sent' 로 남아 다음 실행에서 확인한다.
+            summary["interrupted"] = True
+            executor.shutdown(wait=True, cancel_futures=True)
+            print("\n가져오기가 중단되었습니다. 같은 파일로 다시 실행하면 이어서 진행합니다.")
+        finally:
+            executor.shutdown(wait=True)
+            checkpoint.close()
+
+        elapsed = time.monotonic() - started
+        summary["elapsed"] = round(elapsed, 3)
+        summary["rate"] = round(summary["created"] / elapsed, 1) if elapsed else 0.0
+        self._print_progress(summary, elapsed)
+
+        mirror = self.session.mirror
+        if summary["created"] and mirror is not None and mirror.has_project(project_id):
+            # 새 이슈가 목록에 바로 보이도록 미러를 한 번에 갱신한다.
+            self.session.sync_manager.sync_project(project_id, with_comments=False)
+        return summary
+
+    def import_screen(self, project_id):
+        """
+        가져올 파일을 입력받아 이슈를 일괄 등록한다.
+        """
+        path = input("가져올 파일 경로 (csv 또는 jsonl): ").strip()
+        try:
+            summary = self.import_issues(project_id, path)
+        except (OSError, ValueError) as error:
+            print(f"가져오기에 실패했습니다: {error}")
+            return
+        print(
+            f"가져오기 완료: 등록 {summary['created']}개, 건너뜀 {summary['skipped'] + summary['recovered']}개, "
+            f"실패 {summary['failed']}개, 확인 필요 {summary['unconfirmed']}개"
+        )
+        if summary["failed"]:
+            print("실패한 이슈는 같은 파일로 다시 실행하면 다시 시도합니다.")
+        if summary["unconfirmed"]:
+            print("등록되었는지 알 수 없는 이슈는 같은 파일로 다시 실행하면 서버에서 확인한 뒤에만 다시 보냅니다.")
+
+    def _submit(self, project_id, index, issue, checkpoint, limiter):
+        """
+        이슈 하나를 등록한다. (레코드 번호, 상태, 이슈 ID 또는 오류) 를 반환한다.
+        상태는 'done'(등록됨), 'failed'(등록되지 않음), 'sent'(등록되었는지 알 수 없음) 중 하나이다.
+        요청이 서버에 닿지 않았거나 서버가 429/503 으로 거절한 경우에만 다시 보낸다.
+        """
+        checkpoint.record(index, 'sent', reportedDate=issue['reportedDate'])
+        url = f'{self.base_url}/projects/{project_id}/issues'
+        error = None
+        delay = 0.0
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(delay)
+            limiter.acquire()
+            try:
+                response = self.session.transport.post(url, json=issue)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if not _request_not_sent(exc):
+                    return index, 'sent', str(exc)
+                error = str(exc)
+                delay = self._retry_delay(attempt)
+                continue
+            if response.status_code == 201:
+                return index, 'done', self._created_id(response)
+            error = f'HTTP {response.status_code}'
+            if response.status_code >= 500 and response.status_code not in RETRY_STATUSES:
+                return index, 'sent', error
+            if response.status_code not in RETRY_STATUSES:
+                break
+            delay = self._retry_delay(attempt, response)
+        return index, 'failed', error
+
+    @staticmethod
+    def _created_id(response):
+        """
+        201 응답 본문에서 새 이슈 ID 를 읽는다. 본문이 비었거나 JSON 이 아니면 None 을 반환한다.
+        """
+        try:
+            created = response.json()
+        except ValueError:
+            return None
+        return created.get('id') if isinstance(created, dict) else None
+
+    def _retry_delay(self, attempt, response=None):
+        """
+        다시 시도하기 전 대기 시간(초). Retry-After 헤더가 있으면 따르고, 없으면 지수 백오프에 지터를 더한다.
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return float(retry_after)
+        delay = min(30.0, self.backoff * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _existing_issue_keys(self, project_id):
+        """
+        서버에 이미 있는 이슈의 (제목, 등록일, 등록자) -> 이슈 ID 사전을 만든다.
+        """
+        response = self.session.transport.get(f'{self.base_url}/projects/{project_id}/issues')
+        if response.status_code != 200:
+            raise ValueError("중단된 가져오기를 확인하기 위한 이슈 목록을 불러오지 못했습니다.")
+        return {self._issue_key(issue): issue['id'] for issue in response.json()}
+
+    @staticmethod
+    def _issue_key(issue):
+        return issue.get('title'), issue.get('reportedDate'), issue.get('reporterUsername')
+
+    @staticmethod
+    def _print_progress(summary, elapsed):
+        rate = summary["created"] / elapsed if elapsed else 0.0
+        print(
+            f"진행: 등록 {summary['created']}개, 건너뜀 {summary['skipped'] + summary['recovered']}개, "
+            f"실패 {summary['failed']}개 ({rate:.1f}개/초)"
+        )
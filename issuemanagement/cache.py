@@ -0,0 +1,109 @@
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+def response_validators(response):
+    """
+    응답의 ETag / Last-Modified 로 조건부 GET 에 보낼 검증 헤더(If-None-Match / If-Modified-Since)를 만든다.
+    """
+    headers = {}
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+class CacheEntry:
+    """
+    캐시된 응답 하나와 저장 시각을 담는 클래스
+    """
+    def __init__(self, response):
+        self.response = response
+        self.stored_at = time.monotonic()
+
+    def validators(self):
+        """
+        조건부 GET 에 사용할 검증 헤더(If-None-Match / If-Modified-Since)를 반환한다.
+        """
+        return response_validators(self.response)
+
+class ResponseCache:
+    """
+    리소스 URL을 키로 하는 GET 응답 캐시. TTL 과 LRU 방식으로 항목을 관리한다.
+    """
+    def __init__(self, ttl=10, max_entries=256):
+        # 이 시간(초) 안의 항목은 서버에 묻지 않고 바로 사용한다.
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url, params=None):
+        """
+        URL 과 쿼리 파라미터로 캐시 키를 만든다.
+        """
+        if params:
+            return f'{url}?{urlencode(sorted(params.items()))}'
+        return url
+
+    def lookup(self, key):
+        """
+        캐시 항목을 찾아 반환하고 최근 사용으로 표시한다. 없으면 None 을 반환한다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry):
+        return time.monotonic() - entry.stored_at < self.ttl
+
+    def store(self, key, response):
+        """
+        응답을 저장하고, 최대 개수를 넘으면 가장 오래 사용하지 않은 항목을 제거한다.
+        """
+        with self._lock:
+            self._entries[key] = CacheEntry(response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revalidated(self, key):
+        """
+        서버가 304 로 응답한 항목의 저장 시각을 갱신한다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+
+    def invalidate(self, url):
+        """
+        주어진 URL 과 그 하위 리소스(검색 결과 포함)의 캐시 항목을 모두 제거한다.
+        """
+        prefix = url.rstrip('/')
+        with self._lock:
+            for key in list(self._entries):
+                if key == prefix or key.startswith((prefix + '/', prefix + '?')):
+                    del self._entries[key]
+
+    def invalidate_for_write(self, method, url):
+        """
+        쓰기 요청(POST/PUT/DELETE)이 성공한 뒤 영향을 받는 항목을 제거한다.
+        """
+        url = url.split('?', 1)[0].rstrip('/')
+        if method == 'POST':
+            # POST 는 컬렉션에 대한 요청이므로 컬렉션 자체를 무효화한다.
+            self.invalidate(url)
+        else:
+            # PUT/DELETE 는 개별 리소스이므로 해당 리소스와 상위 컬렉션을 무효화한다.
+            self.invalidate(url.rsplit('/', 1)[0])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,211 @@
+import base64
+import datetime
+import gzip
+import http.client
+import io
+import json
+import os
+import threading
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from issuemanagement.metrics import endpoint_template
+
+CASSETTE_VERSION = 1
+CASSETTE_MODES = ('record', 'replay')
+# 카세트에 남기는 응답 헤더. 요청 헤더와 요청 본문(비밀번호 등)은 남기지 않는다.
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After', 'Set-Cookie')
+# 재생한 응답에 붙이는 헤더
+REPLAY_HEADER = 'X-Issue-Console-Replay'
+
+def request_key(method, url):
+    """
+    요청의 (메서드, 경로, 엔드포인트 템플릿, 정렬된 쿼리 파라미터) 를 반환한다. 호스트는 비교하지 않는다.
+    """
+    parts = urlsplit(url)
+    params = tuple(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return method, parts.path, endpoint_template(parts.path), params
+
+def _redact_cookie(value):
+    # 인증 토큰은 남기지 않고 쿠키 이름만 남긴다. (재생할 때는 로그인 성공 여부만 중요하다)
+    cookie = SimpleCookie()
+    cookie.load(value)
+    return '; '.join(f'{name}=recorded' for name in cookie) or value
+
+class CassetteWriter:
+    """
+    요청과 응답을 gzip 으로 압축한 JSON Lines 카세트 파일에 하나씩 덧붙이는 클래스.
+    파일이 이미 있으면 이어서 기록하므로 여러 번 실행한 명령을 카세트 하나에 모을 수 있다.
+    """
+    def __init__(self, path):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            read_cassette(path)
+        self._file = gzip.open(path, 'at' if exists else 'wt', encoding='utf-8')
+        self._lock = threading.Lock()
+        if not exists:
+            self._write({"version": CASSETTE_VERSION, "recordedAt": datetime.datetime.now().isoformat(timespec='seconds')})
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def record(self, request, response, elapsed):
+        method, path, _, params = request_key(request.method, request.url)
+        headers = {
+            name: response.headers[name] for name in KEPT_HEADERS if name in response.headers
+        }
+        if 'Set-Cookie' in headers:
+            headers['Set-Cookie'] = _redact_cookie(headers['Set-Cookie'])
+        content = response.content or b''
+        try:
+            body, encoding = content.decode('utf-8'), None
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode('ascii'), 'base64'
+        entry = {
+            "method": method, "path": path, "params": params,
+            "status": response.status_code, "headers": headers, "body": body, "elapsed": round(elapsed, 6),
+        }
+        if encoding:
+            entry["encoding"] = encoding
+        with self._lock:
+            self._write(entry)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+def read_cassette(path):
+    """
+    카세트 파일의 기록을 순서대로 읽어 목록으로 반환한다. 형식이 맞지 않으면 ValueError 를 발생시킨다.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        header = json.loads(file.readline() or 'null')
+        if not isinstance(header, dict) or header.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"카세트 파일 형식이 아닙니다: {path}")
+        entries = []
+        for line in file:
+            if line.strip():
+                entry = json.loads(line)
+                entry["params"] = tuple(tuple(pair) for pair in entry["params"])
+                entries.append(entry)
+    return entries
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    실제로 요청을 보내고, 받은 응답을 카세트에 기록하는 어댑터
+    """
+    def __init__(self, writer, **kwargs):
+        super().__init__(**kwargs)
+        self.writer = writer
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        # 스트리밍 응답도 본문을 모두 읽어 기록한다. 읽은 본문은 iter_content 가 그대로 내보낸다.
+        response.content
+        self.writer.record(request, response, time.perf_counter() - started)
+        return response
+
+    def close(self):
+        super().close()
+        self.writer.close()
+
+class ReplayAdapter(BaseAdapter):
+    """
+    카세트에 기록된 응답을 돌려주는 어댑터. 서버에 요청하지 않는다.
+    같은 메서드/경로/파라미터의 기록을 먼저 찾고, 없으면 같은 엔드포인트 템플릿/파라미터의 기록을 사용한다.
+    같은 요청이 여러 번 기록되었으면 기록된 순서대로 돌려주고, 다 쓰면 마지막 응답을 계속 돌려준다.
+    """
+    def __init__(self, entries, latency_scale=0.0):
+        super().__init__()
+        # 기록된 응답 시간에 곱해 기다릴 배율 (0 이면 바로 응답)
+        self.latency_scale = latency_scale
+        self._exact = {}
+        self._by_template = {}
+        for entry in entries:
+            method, path, template, _ = request_key(entry["method"], entry["path"])
+            self._exact.setdefault((method, path, entry["params"]), []).append(entry)
+            self._by_template.setdefault((method, template, entry["params"]), []).append(entry)
+        self._positions = {}
+        self._lock = threading.Lock()
+        # 기록에 없어 재생하지 못한 요청 (메서드, URL)
+        self.misses = []
+
+    def _next(self, table, key, conditional):
+        entries = table.get(key)
+        if not entries:
+            return None
+        if not conditional:
+            # 캐시가 없는 요청에 304 를 돌려주지 않는다.
+            entries = [entry for entry in entries if entry["status"] != 304] or entries
+        position = self._positions.get((id(table), key, conditional), 0)
+        self._positions[(id(table), key, conditional)] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        method, path, template, params = request_key(request.method, request.url)
+        conditional = 'If-None-Match' in request.headers or 'If-Modified-Since' in request.headers
+        with self._lock:
+            entry = (
+                self._next(self._exact, (method, path, params), conditional)
+                or self._next(self._by_template, (method, template, params), conditional)
+            )
+            if entry is None:
+                self.misses.append((method, request.url))
+        if entry is None:
+            return self._build(request, 404, {REPLAY_HEADER: 'miss'}, b'', 0.0)
+        if self.latency_scale and entry["elapsed"]:
+            time.sleep(entry["elapsed"] * self.latency_scale)
+        body = entry["body"].encode('utf-8')
+        if entry.get("encoding") == 'base64':
+            body = base64.b64decode(entry["body"])
+        headers = {**entry["headers"], REPLAY_HEADER: 'hit'}
+        return self._build(request, entry["status"], headers, body, entry["elapsed"])
+
+    def _build(self, request, status, headers, body, elapsed):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.client.responses.get(status, '')
+        response.headers = CaseInsensitiveDict(headers)
+        response.headers['Content-Length'] = str(len(body))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = datetime.timedelta(seconds=elapsed)
+        if 'Set-Cookie' in headers:
+            cookie = SimpleCookie()
+            cookie.load(headers['Set-Cookie'])
+            for name, morsel in cookie.items():
+                response.cookies.set(name, morsel.value)
+        return response
+
+    def close(self):
+        pass
+
+def use_cassette(transport, path, mode, latency_scale=0.0):
+    """
+    전송 계층이 카세트를 기록(record)하거나 재생(replay)하도록 어댑터를 바꿔 끼우고 어댑터를 반환한다.
+    """
+    if mode == 'record':
+        adapter = RecordingAdapter(
+            CassetteWriter(path),
+            pool_connections=transport.pool_connections,
+            pool_maxsize=transport.pool_maxsize,
+        )
+    elif mode == 'replay':
+        adapter = ReplayAdapter(read_cassette(path), latency_scale)
+    else:
+        raise ValueError(f"지원하지 않는 카세트 모드입니다: {mode}")
+    transport.http.mount('https://', adapter)
+    transport.http.mount('http://', adapter)
+    return adapter
@@ -0,0 +1,562 @@
+import argparse
+import contextlib
+import getpass
+import json
+import os
+import sys
+
+import requests
+
+from issuemanagement.bulk_import import DEFAULT_RATE
+from issuemanagement.export import PART_SIZE
+from issuemanagement.metrics import EXPORT_FORMATS
+from issuemanagement.rollup import DIMENSIONS, GRANULARITIES
+from issuemanagement.watch import MAX_INTERVAL, MIN_INTERVAL
+
+def login_from_environment(session):
+    """
+    환경 변수(ISSUE_CONSOLE_USERNAME, ISSUE_CONSOLE_PASSWORD)로 로그인한다. 없으면 입력받는다.
+    """
+    username = os.environ.get('ISSUE_CONSOLE_USERNAME') or input("아이디: ")
+    password = os.environ.get('ISSUE_CONSOLE_PASSWORD') or getpass.getpass("비밀번호: ")
+    session.cookies = session.auth_manager.login(username, password)
+    return session.cookies is not None
+
+class JsonWriter:
+    """
+    결과를 표준 출력에 JSON 또는 JSONL 로 쓰는 클래스
+    """
+    def __init__(self, stream, fmt='jsonl'):
+        self.stream = stream
+        self.fmt = fmt
+
+    @staticmethod
+    def _dumps(value):
+        return json.dumps(value, ensure_ascii=False)
+
+    def write_object(self, value):
+        self.stream.write(self._dumps(value) + '\n')
+
+    def write_records(self, records):
+        """
+        레코드를 받는 대로 바로 쓴다. jsonl 은 한 줄에 하나, json 은 배열 하나로 쓴다. 쓴 개수를 반환한다.
+        """
+        count = 0
+        if self.fmt == 'json':
+            self.stream.write('[')
+        for record in records:
+            if self.fmt == 'json':
+                self.stream.write((',\n' if count else '\n') + self._dumps(record))
+            else:
+                self.stream.write(self._dumps(record) + '\n')
+            count += 1
+        if self.fmt == 'json':
+            self.stream.write('\n]\n' if count else ']\n')
+        return count
+
+def fail(message, code=1):
+    print(json.dumps({"error": message}, ensure_ascii=False), file=sys.stderr)
+    return code
+
+def build_parser():
+    """
+    명령줄 모드의 인자 파서를 만든다.
+    """
+    # 데이터를 출력하는 명령에 공통으로 붙는 출력 형식 인자
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument(
+        '--format', dest='output_format', choices=('jsonl', 'json'), default='jsonl',
+        help='목록 출력 형식 (기본: jsonl)',
+    )
+    parser = argparse.ArgumentParser(prog='main.py', description='이슈 관리 콘솔 명령줄 모드')
+    parser.add_argument('--metrics', metavar='FILE', help='명령을 마친 뒤 API 요청 지표를 파일로 저장')
+    parser.add_argument(
+        '--metrics-format', choices=EXPORT_FORMATS,
+        help='지표 파일 형식 (기본: 확장자가 .json 이면 json, 아니면 prometheus)',
+    )
+    parser.add_argument('--metrics-table', action='store_true', help='명령을 마친 뒤 API 요청 지표를 표준 오류에 표로 출력')
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument('--record', metavar='CASSETTE', help='보낸 요청과 받은 응답을 카세트 파일에 기록')
+    cassette.add_argument('--replay', metavar='CASSETTE', help='서버 대신 카세트 파일에 기록된 응답을 사용')
+    parser.add_argument(
+        '--replay-latency', type=float, default=0.0, metavar='SCALE',
+        help='재생할 때 기록된 응답 시간에 이 배율을 곱해 기다림 (기본 0: 바로 응답)',
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    projects = subparsers.add_parser('projects', help='프로젝트').add_subparsers(dest='action', required=True)
+    projects.add_parser('list', help='프로젝트 목록', parents=[output])
+
+    issues = subparsers.add_parser('issues', help='이슈').add_subparsers(dest='action', required=True)
+    issues_list = issues.add_parser('list', help='이슈 목록', parents=[output])
+    issues_list.add_argument('--project', type=int, required=True)
+    issues_list.add_argument('--local', action='store_true', help='로컬 미러에서 읽기')
+    issues_search = issues.add_parser('search', help='이슈 검색', parents=[output])
+    issues_search.add_argument('--project', type=int, required=True)
+    issues_search.add_argument('--assignee')
+    issues_search.add_argument('--reporter')
+    issues_search.add_argument('--status', type=str.upper)
+    issues_search.add_argument('--priority', type=str.upper)
+    issues_search.add_argument('--text', help='검색어 (로컬 색인 사용)')
+    issues_search.add_argument('--nl', help='서버 자연어 검색')
+    issues_search.add_argument('--limit', type=int, help='검색어 검색 결과 수')
+    issues_search_all = issues.add_parser('search-all', help='모든 프로젝트에서 이슈 검색', parents=[output])
+    issues_search_all.add_argument('--projects', nargs='+', type=int, help='검색할 프로젝트 ID (기본: 전체)')
+    issues_search_all.add_argument('--assignee')
+    issues_search_all.add_argument('--reporter')
+    issues_search_all.add_argument('--status', type=str.upper)
+    issues_search_all.add_argument('--priority', type=str.upper)
+    issues_search_all.add_argument('--nl', help='서버 자연어 검색')
+    issues_search_all.add_argument('--concurrency', type=int, help='동시에 검색할 프로젝트 수')
+    issues_search_all.add_argument(
+        '--ranked', action='store_true', help='모든 결과를 받은 뒤 프로젝트 안의 순위 순서로 정렬 (기본: 받는 대로 출력)'
+    )
+    issues_recommend = issues.add_parser(
+        'recommend', help='담당자가 없는 NEW 이슈의 담당자를 로컬 이력으로 일괄 추천', parents=[output]
+    )
+    issues_recommend.add_argument('--project', type=int, required=True)
+    issues_recommend.add_argument('--top', type=int, default=3, help='이슈마다 추천할 담당자 수')
+    issues_duplicates = issues.add_parser(
+        'duplicates', help='중복 이슈 묶음 보고서 (--title 을 주면 비슷한 기존 이슈 확인)', parents=[output]
+    )
+    issues_duplicates.add_argument('--project', type=int, required=True)
+    issues_duplicates.add_argument('--threshold', type=float, help='중복으로 볼 유사도 (0~1, 기본 0.5)')
+    issues_duplicates.add_argument('--min-size', type=int, default=2, help='보고할 묶음의 최소 이슈 수')
+    issues_duplicates.add_argument('--title', help='등록하려는 이슈 제목')
+    issues_duplicates.add_argument('--description', default='', help='등록하려는 이슈 설명')
+    issues_import = issues.add_parser('import', help='CSV/JSONL 파일에서 이슈 일괄 등록', parents=[output])
+    issues_import.add_argument('--project', type=int, required=True)
+    issues_import.add_argument('file', help='가져올 파일 (csv: title,description[,reportedDate] 열, jsonl: 같은 키)')
+    issues_import.add_argument('--checkpoint', help='체크포인트 파일 (기본: <파일>.checkpoint)')
+    issues_import.add_argument('--workers', type=int, help='동시에 보낼 요청 수')
+    issues_import.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 최대 요청 수 (0: 제한 없음)')
+    issues_edit = issues.add_parser('edit', help='이슈 일괄 수정', parents=[output])
+    issues_edit.add_argument('--project', type=int, required=True)
+    issues_edit.add_argument('--ids', nargs='+', type=int, help='수정할 이슈 ID')
+    issues_edit.add_argument('--where-assignee', help='이 담당자의 이슈 선택')
+    issues_edit.add_argument('--where-reporter', help='이 등록자의 이슈 선택')
+    issues_edit.add_argument('--where-status', type=str.upper, help='이 상태의 이슈 선택')
+    issues_edit.add_argument('--where-priority', type=str.upper, help='이 우선순위의 이슈 선택')
+    issues_edit.add_argument('--where-text', help='검색어에 맞는 이슈 선택 (로컬 색인 사용)')
+    issues_edit.add_argument('--set-status', help='새 상태')
+    issues_edit.add_argument('--set-priority', help='새 우선순위')
+    issues_edit.add_argument('--set-assignee', help='새 담당자 (상태를 주지 않으면 ASSIGNED 로 바뀜)')
+    issues_edit.add_argument('--dry-run', action='store_true', help='바뀔 내용만 보여주고 수정하지 않음')
+    issues_show = issues.add_parser('show', help='이슈 상세 정보', parents=[output])
+    issues_show.add_argument('--project', type=int, required=True)
+    issues_show.add_argument('--id', type=int, required=True)
+    issues_show.add_argument('--comments', action='store_true', help='댓글 포함')
+    issues_details = issues.add_parser('details', help='여러 이슈의 상세와 댓글을 동시에 조회', parents=[output])
+    issues_details.add_argument('--project', type=int, required=True)
+    issues_details.add_argument('--ids', nargs='+', type=int, help='조회할 이슈 ID (기본: 전체)')
+    issues_details.add_argument('--no-comments', action='store_true', help='댓글은 조회하지 않음')
+    issues_details.add_argument('--concurrency', type=int, help='동시에 보낼 요청 수')
+
+    comments = subparsers.add_parser('comments', help='댓글').add_subparsers(dest='action', required=True)
+    comments_list = comments.add_parser('list', help='댓글 목록', parents=[output])
+    comments_list.add_argument('--project', type=int, required=True)
+    comments_list.add_argument('--issue', type=int, required=True)
+    comments_add = comments.add_parser('add', help='댓글 추가', parents=[output])
+    comments_add.add_argument('--project', type=int, required=True)
+    comments_add.add_argument('--issue', type=int, required=True)
+    comments_add.add_argument('--content', required=True, help="댓글 내용 ('-' 이면 표준 입력)")
+
+    export_data = subparsers.add_parser('export', help='이슈와 댓글을 분석용 파일(JSONL.gz, .npz 열 파일)로 내보내기')
+    export_data.add_argument('--project', type=int, required=True)
+    export_data.add_argument('--output', required=True, help='저장할 디렉터리 (같은 디렉터리로 다시 실행하면 이어서 진행)')
+    export_data.add_argument('--no-comments', action='store_true', help='댓글은 내보내지 않음')
+    export_data.add_argument('--part-size', type=int, default=PART_SIZE, help=f'파일 하나에 담을 이슈 수 (기본 {PART_SIZE})')
+    export_data.add_argument('--concurrency', type=int, help='댓글을 동시에 요청할 수')
+
+    sync_parser = subparsers.add_parser('sync', help='로컬 미러 동기화', parents=[output])
+    sync_parser.add_argument('--project', type=int, required=True)
+    sync_parser.add_argument('--no-comments', action='store_true', help='댓글은 동기화하지 않음')
+
+    watch_parser = subparsers.add_parser('watch', help='프로젝트나 이슈의 변경 사항을 JSONL 로 계속 출력')
+    watch_parser.add_argument('--project', type=int, required=True)
+    watch_parser.add_argument('--issue', type=int, help='이 이슈와 댓글만 지켜봄')
+    watch_parser.add_argument(
+        '--interval', type=float, default=MIN_INTERVAL, help=f'최소 폴링 간격(초, 기본 {MIN_INTERVAL:g})'
+    )
+    watch_parser.add_argument(
+        '--max-interval', type=float, default=MAX_INTERVAL,
+        help=f'변경이 없을 때 늘어나는 최대 폴링 간격(초, 기본 {MAX_INTERVAL:g})',
+    )
+    watch_parser.add_argument('--polls', type=int, help='이만큼 폴링하고 끝냄 (기본: Ctrl+C 까지)')
+
+    stats = subparsers.add_parser('stats', help='통계 데이터', parents=[output])
+    stats.add_argument('name', help='통계 이름 (예: issuesPerMonth, issuesPerDayAndStatusInWeek/NEW)')
+    stats.add_argument('--project', type=int, required=True)
+    stats.add_argument('--local', action='store_true', help='로컬 스냅샷으로 계산')
+
+    stats_range = subparsers.add_parser('stats-range', help='기간/단위 지정 이슈 수', parents=[output])
+    stats_range.add_argument('--project', type=int, required=True)
+    stats_range.add_argument('--start', required=True, help='시작일 (YYYY-MM-DD)')
+    stats_range.add_argument('--end', required=True, help='종료일 (YYYY-MM-DD)')
+    stats_range.add_argument('--granularity', choices=GRANULARITIES, default='day', help='단위 (기본: day)')
+    stats_range.add_argument('--by', choices=DIMENSIONS[1:], help='값별로 나눌 필드')
+    stats_range.add_argument('--value', help='--by 필드의 이 값만 셈')
+
+    export_parser = subparsers.add_parser('export-charts', help='통계 그래프를 파일로 저장')
+    export_parser.add_argument('--output', required=True, help='저장할 디렉터리')
+    export_parser.add_argument(
+        '--format', dest='chart_format', nargs='+', default=['png'], help='파일 형식 (png, svg, pdf)'
+    )
+    export_parser.add_argument('--project', nargs='+', type=int, help='프로젝트 ID (기본: 전체)')
+    export_parser.add_argument('--workers', type=int, help='동시에 그릴 프로세스 수')
+    export_parser.add_argument('--full-resolution', action='store_true', help='긴 시계열도 줄이지 않고 모든 점을 그림')
+
+    startup_parser = subparsers.add_parser('startup-profile', help='시작 시간과 모듈별 import 비용 측정')
+    startup_parser.add_argument('--top', type=int, default=20, help='표시할 모듈 수')
+    startup_parser.add_argument('--repeat', type=int, default=5, help='시작 시간 측정 횟수')
+    return parser
+
+def run(argv, session_factory):
+    """
+    명령줄 인자로 기능을 실행하고 종료 코드를 반환한다.
+    결과는 표준 출력에 JSON/JSONL 로 쓰고, 안내 메시지와 오류는 표준 오류로 보낸다.
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == 'startup-profile':
+        from issuemanagement.startup import print_startup_report
+        print_startup_report(args.top, args.repeat)
+        return 0
+
+    writer = JsonWriter(sys.stdout, getattr(args, 'output_format', 'jsonl'))
+    session = session_factory()
+    replay = None
+    try:
+        if args.record or args.replay:
+            from issuemanagement.cassette import use_cassette
+            try:
+                adapter = use_cassette(
+                    session.transport, args.record or args.replay,
+                    'record' if args.record else 'replay', args.replay_latency,
+                )
+            except (OSError, ValueError) as error:
+                return fail(f"카세트를 열지 못했습니다: {error}", 2)
+            replay = adapter if args.replay else None
+        return _dispatch(session, args, writer)
+    except requests.RequestException as error:
+        return fail(f"서버와 통신하는 데 실패했습니다: {error}")
+    finally:
+        sys.stdout.flush()
+        _report_metrics(session, args)
+        if replay is not None and replay.misses:
+            print(f"카세트에 없어 재생하지 못한 요청 {len(replay.misses)}개:", file=sys.stderr)
+            for method, url in replay.misses:
+                print(f"  {method} {url}", file=sys.stderr)
+        session.close()
+
+def _report_metrics(session, args):
+    """
+    --metrics-table, --metrics 가 주어지면 이 프로세스에서 보낸 API 요청 지표를 출력하거나 저장한다.
+    """
+    if not (args.metrics or args.metrics_table) or 'transport' not in session.__dict__:
+        return
+    metrics = session.transport.metrics
+    if metrics is None:
+        return
+    if args.metrics_table:
+        print(metrics.format_table(), file=sys.stderr)
+    if args.metrics:
+        fmt = args.metrics_format or ('json' if args.metrics.endswith('.json') else 'prometheus')
+        try:
+            metrics.export(args.metrics, fmt)
+        except OSError as error:
+            fail(f"지표를 저장하지 못했습니다: {error}")
+
+def _dispatch(session, args, writer):
+    # 관리자가 출력하는 안내 메시지가 JSON 출력에 섞이지 않도록 표준 오류로 돌린다.
+    with contextlib.redirect_stdout(sys.stderr):
+        if not login_from_environment(session):
+            return fail("로그인 실패. 아이디와 비밀번호를 확인하세요.")
+    handler = COMMANDS[(args.command, getattr(args, 'action', None))]
+    return handler(session, args, writer)
+
+def _projects_list(session, args, writer):
+    projects = session.project_manager.load_projects(show=False)
+    if projects is None:
+        return fail("프로젝트 목록을 불러오는 데 실패했습니다.")
+    writer.write_records(projects)
+    return 0
+
+def _issues_list(session, args, writer):
+    if args.local:
+        mirror = session.mirror
+        if mirror is None or not mirror.has_project(args.project):
+            return fail("로컬 미러에 동기화된 프로젝트가 아닙니다.")
+        writer.write_records(mirror.get_issues(args.project))
+        return 0
+    issues = session.issue_manager.stream_issues(args.project)
+    if issues is None:
+        return fail("이슈 목록을 불러오는 데 실패했습니다.")
+    writer.write_records(issues)
+    return 0
+
+def _issues_search(session, args, writer):
+    filters = {
+        "assignee": args.assignee,
+        "reporter": args.reporter,
+        "status": args.status,
+        "priority": args.priority,
+    }
+    if args.text is not None:
+        index = session.issue_manager.get_search_index(args.project)
+        if index is None:
+            return fail("로컬 검색 색인이 없습니다. 먼저 로컬 미러를 동기화하세요.")
+        writer.write_records(index.search(args.text, limit=args.limit, **filters))
+        return 0
+
+    params = {
+        "assigneeUsername": args.assignee,
+        "reporterUsername": args.reporter,
+        "status": args.status,
+        "priority": args.priority,
+    }
+    issues = session.issue_manager.stream_search(
+        args.project, {k: v for k, v in params.items() if v is not None}, user_message=args.nl
+    )
+    if issues is None:
+        return fail("이슈 검색에 실패했습니다.")
+    writer.write_records(issues)
+    return 0
+
+def _issues_search_all(session, args, writer):
+    params = {
+        "assigneeUsername": args.assignee,
+        "reporterUsername": args.reporter,
+        "status": args.status,
+        "priority": args.priority,
+    }
+    if args.concurrency:
+        session.async_client.max_concurrency = args.concurrency
+    manager = session.global_search_manager
+    results = manager.search(
+        {k: v for k, v in params.items() if v is not None}, user_message=args.nl, project_ids=args.projects
+    )
+    if results is None:
+        return fail("프로젝트 목록을 불러오는 데 실패했습니다.")
+    writer.write_records(manager.ranked(results) if args.ranked else results)
+    if manager.failed:
+        names = ', '.join(project['name'] for project in manager.failed[:20])
+        return fail(f"검색에 실패한 프로젝트 {len(manager.failed)}개: {names}")
+    return 0
+
+def _issues_recommend(session, args, writer):
+    results = session.recommendation_manager.recommend_unassigned(args.project, args.top)
+    if results is None:
+        return fail("이슈 목록을 불러오는 데 실패했습니다.")
+    writer.write_records(results)
+    return 0
+
+def _issues_duplicates(session, args, writer):
+    manager = session.issue_manager
+    if args.title is not None:
+        results = manager.find_duplicates(args.project, args.title, args.description, args.threshold)
+    else:
+        results = manager.duplicate_report(args.project, args.threshold, args.min_size)
+    if results is None:
+        return fail("이슈 목록을 불러오는 데 실패했습니다.")
+    writer.write_records(results)
+    return 0
+
+def _issues_import(session, args, writer):
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            summary = session.import_manager.import_issues(
+                args.project, args.file, args.checkpoint, args.workers, args.rate
+            )
+    except (OSError, ValueError) as error:
+        return fail(str(error), 2)
+    writer.write_object(summary)
+    return 0 if not summary["failed"] and not summary["unconfirmed"] and not summary["interrupted"] else 1
+
+def _issues_edit(session, args, writer):
+    if args.ids:
+        issue_ids = args.ids
+    else:
+        filters = {
+            "assignee": args.where_assignee,
+            "reporter": args.where_reporter,
+            "status": args.where_status,
+            "priority": args.where_priority,
+        }
+        if args.where_text is None and all(value is None for value in filters.values()):
+            return fail("수정할 이슈를 --ids 또는 --where-* 로 지정하세요.", 2)
+        issues = session.issue_manager.find_issues(args.project, args.where_text or '', **filters)
+        if issues is None:
+            return fail("이슈 검색에 실패했습니다. (검색어 선택은 로컬 미러 동기화 후 사용)")
+        issue_ids = [issue['id'] for issue in issues]
+
+    changes = {
+        "status": args.set_status,
+        "priority": args.set_priority,
+        "assigneeUsername": args.set_assignee,
+    }
+    try:
+        report = session.bulk_edit_manager.bulk_edit(args.project, issue_ids, changes, args.dry_run)
+    except ValueError as error:
+        return fail(str(error), 2)
+    writer.write_object(report)
+    return 0 if not report["failed"] else 1
+
+def _issues_show(session, args, writer):
+    issue = session.issue_manager.fetch_issue(args.project, args.id)
+    if issue is None:
+        return fail("이슈 정보를 불러오는 데 실패했습니다.")
+    if args.comments:
+        comments = session.comment_manager.iter_comments(args.project, args.id)
+        if comments is None:
+            return fail("코멘트를 불러오는 데 실패했습니다.")
+        issue = {**issue, "comments": list(comments)}
+    writer.write_object(issue)
+    return 0
+
+def _issues_details(session, args, writer):
+    issue_ids = args.ids
+    if issue_ids is None:
+        issues = session.issue_manager.stream_issues(args.project)
+        if issues is None:
+            return fail("이슈 목록을 불러오는 데 실패했습니다.")
+        issue_ids = [issue['id'] for issue in issues]
+    client = session.async_client
+    if args.concurrency:
+        client.max_concurrency = args.concurrency
+    with_comments = not args.no_comments
+    details = client.fetch_issue_details_sync(args.project, issue_ids, with_comments)
+    failed = {
+        detail["id"] for detail in details
+        if detail["issue"] is None or (with_comments and detail["comments"] is None)
+    }
+    writer.write_records(detail for detail in details if detail["id"] not in failed)
+    if failed:
+        return fail(f"이슈 {len(failed)}개를 불러오지 못했습니다: {', '.join(map(str, sorted(failed)[:20]))}")
+    return 0
+
+def _comments_list(session, args, writer):
+    comments = session.comment_manager.iter_comments(args.project, args.issue)
+    if comments is None:
+        return fail("코멘트를 불러오는 데 실패했습니다.")
+    writer.write_records(comments)
+    return 0
+
+def _comments_add(session, args, writer):
+    content = sys.stdin.read().rstrip('\n') if args.content == '-' else args.content
+    if not content.strip():
+        return fail("코멘트 내용이 비어있습니다.", 2)
+    comment = session.comment_manager.create_comment(args.project, args.issue, content)
+    if comment is None:
+        return fail("코멘트 추가에 실패했습니다.")
+    writer.write_object(comment)
+    return 0
+
+def _export(session, args, writer):
+    if args.part_size < 1:
+        return fail("--part-size 는 1 이상이어야 합니다.", 2)
+    if args.concurrency:
+        session.async_client.max_concurrency = args.concurrency
+
+    def progress(stage, part):
+        if stage == 'issues':
+            print(f"이슈 부분 {part['index'] + 1}: {part['issues']}개", file=sys.stderr)
+        else:
+            print(f"댓글 부분 {part['index'] + 1}: {part['comments']}개", file=sys.stderr)
+
+    try:
+        result = session.export_manager.export_project(
+            args.project, args.output, not args.no_comments, args.part_size, progress
+        )
+    except OSError as error:
+        return fail(f"파일을 저장하지 못했습니다: {error}")
+    if result is None:
+        return fail("이슈 목록을 불러오는 데 실패했습니다.")
+    writer.write_object(result)
+    return 1 if result["failedComments"] else 0
+
+def _sync(session, args, writer):
+    if session.mirror is None:
+        return fail("로컬 미러가 비활성화되어 있습니다.")
+    with contextlib.redirect_stdout(sys.stderr):
+        result = session.sync_manager.sync_project(args.project, with_comments=not args.no_comments)
+    if result is None:
+        return fail("동기화에 실패했습니다.")
+    writer.write_object(result)
+    return 1 if result["failedComments"] else 0
+
+def _watch(session, args, writer):
+    manager = session.watch_manager
+    manager.min_interval = args.interval
+    manager.max_interval = args.max_interval
+    try:
+        for event in manager.iter_changes(args.project, args.issue, max_polls=args.polls):
+            writer.write_object(event)
+            # 파이프로 넘겨도 변경이 생기는 대로 읽을 수 있게 한다.
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+    if manager.watcher is not None and manager.watcher.issues is None:
+        return fail("이슈 목록을 불러오는 데 실패했습니다.")
+    return 0
+
+def _stats(session, args, writer):
+    manager = session.statistics_manager
+    manager.use_local = args.local
+    with contextlib.redirect_stdout(sys.stderr):
+        data = manager.fetch_statistics(args.project, args.name)
+    if data is None:
+        return fail("이슈 통계 정보를 불러오는 데 실패했습니다.")
+    writer.write_object(data)
+    return 0
+
+def _stats_range(session, args, writer):
+    if args.value is not None and args.by is None:
+        return fail("--value 는 --by 와 함께 사용해야 합니다.", 2)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            data = session.statistics_manager.count_over_time(
+                args.project, args.start, args.end, args.granularity, args.by, args.value
+            )
+    except ValueError as error:
+        return fail(str(error), 2)
+    if data is None:
+        return fail("이슈 통계 정보를 불러오는 데 실패했습니다.")
+    writer.write_object(data)
+    return 0
+
+def _export_charts(session, args, writer):
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            results = session.report_manager.export_projects(
+                args.output, args.project, args.chart_format, args.workers, args.full_resolution
+            )
+    except ValueError as error:
+        return fail(str(error), 2)
+    if results is None:
+        return 1
+    writer.write_records(
+        {"projectId": project_id, "files": files} for project_id, files in results.items()
+    )
+    return 0 if all(results.values()) else 1
+
+# (명령, 동작) -> 처리 함수
+COMMANDS = {
+    ('projects', 'list'): _projects_list,
+    ('issues', 'list'): _issues_list,
+    ('issues', 'search'): _issues_search,
+    ('issues', 'search-all'): _issues_search_all,
+    ('issues', 'recommend'): _issues_recommend,
+    ('issues', 'duplicates'): _issues_duplicates,
+    ('issues', 'import'): _issues_import,
+    ('issues', 'edit'): _issues_edit,
+    ('issues', 'show'): _issues_show,
+    ('issues', 'details'): _issues_details,
+    ('comments', 'list'): _comments_list,
+    ('comments', 'add'): _comments_add,
+    ('export', None): _export,
+    ('sync', None): _sync,
+    ('watch', None): _watch,
+    ('stats', None): _stats,
+    ('stats-range', None): _stats_range,
+    ('export-charts', None): _export_charts,
+}
@@ -1,4 +1,6 @@
-import requests
+from issuemanagement.cache import response_validators
+from issuemanagement.jsonstream import iter_response_array
+from issuemanagement.pager import Pager
 
 class CommentManager:
     """
@@ -7,72 +9,123 @@ class CommentManager:
     def __init__(self, base_url, session):
         self.base_url = base_url
         self.session = session
+        # 미러에 끝까지 저장한 댓글 목록의 검증 헤더 ((project_id, issue_id) -> 헤더)
+        self._validators = {}
 
     def load_comments(self, project_id, issue_id):
         """
-        특정 이슈에 대한 모든 댓글을 불러와서 표시한다.
+        특정 이슈에 대한 모든 댓글을 불러와서 한 페이지씩 표시한다.
         """
-        response = requests.get(
+        comments = self.iter_comments(project_id, issue_id)
+        if comments is None:
+            print("코멘트를 불러오는 데 실패했습니다.")
+            return
+
+        print("코멘트:")
+        if not Pager().show(comments, self._format_comment):
+            print("  코멘트가 없습니다.")
+
+    def iter_comments(self, project_id, issue_id):
+        """
+        이슈의 댓글을 하나씩 내보내는 반복자를 반환한다. 실패하면 None 을 반환한다.
+        서버 응답을 받는 대로 디코딩하고, 서버에 장애가 있으면 로컬 미러에 저장된 댓글을 내보낸다.
+        목록을 끝까지 미러에 저장한 뒤에는 그 검증 헤더로 조건부 GET 을 보내고, 서버가 304 를 주면 미러에서 내보낸다.
+        """
+        key = (project_id, issue_id)
+        mirror = self.session.mirror
+        response = self.session.transport.get(
             f"{self.base_url}/projects/{project_id}/issues/{issue_id}/comments",
-            headers=self.session.get_headers(),
+            headers=self._validators.get(key) if mirror is not None else None,
+            stream=True,
         )
 
         if response.status_code == 200:
-            comments = response.json()
-            print("코멘트:")
-            if comments:
-                for i, comment in enumerate(comments):
-                    print(
-                        f"  {i+1}. {comment['username']} ({comment['createdAt']}): {comment['content']}"
-                    )
-            else:
-                print("  코멘트가 없습니다.")
-        else:
-            print("코멘트를 불러오는 데 실패했습니다.")
+            comments = iter_response_array(response)
+            if mirror is None:
+                return comments
+            self._validators.pop(key, None)
+            return self._write_through(project_id, issue_id, comments, response_validators(response))
+        response.close()
+        if response.status_code == 304 and mirror is not None:
+            return mirror.iter_comments(project_id, issue_id)
+        if (
+            response.status_code >= 500
+            and mirror is not None
+            and mirror.get_issue(project_id, issue_id) is not None
+        ):
+            return mirror.iter_comments(project_id, issue_id)
+        return None
 
-    def add_comment(self, project_id, issue_id):
+    def _write_through(self, project_id, issue_id, comments, validators, batch_size=500):
         """
-        이슈에 새 댓글을 추가한다.
+        받은 댓글을 그대로 내보내면서 배치 단위로 미러에 저장한다.
+        끝까지 받았을 때만 서버에서 지워진 댓글을 미러에서도 지우고 다음 조회에 쓸 검증 헤더를 기억한다.
         """
-        content = input("코멘트 내용: ")
+        mirror = self.session.mirror
+        batch = []
+        seen = set()
+        complete = False
+        try:
+            for comment in comments:
+                batch.append(comment)
+                seen.add(comment['id'])
+                if len(batch) >= batch_size:
+                    mirror.upsert_comments(project_id, issue_id, batch)
+                    batch = []
+                yield comment
+            complete = True
+        finally:
+            comments.close()
+            if batch:
+                mirror.upsert_comments(project_id, issue_id, batch)
+            if complete:
+                mirror.prune_comments(project_id, issue_id, seen)
+                if validators:
+                    self._validators[(project_id, issue_id)] = validators
 
-        data = {"content": content}
-        response = requests.post(
+    @staticmethod
+    def _format_comment(number, comment):
+        return f"  {number}. {comment['username']} ({comment['createdAt']}): {comment['content']}"
+
+    def create_comment(self, project_id, issue_id, content):
+        """
+        입력 없이 이슈에 댓글을 추가하고, 서버가 돌려준 댓글(본문이 없으면 빈 사전)을 반환한다. 실패하면 None 을 반환한다.
+        """
+        response = self.session.transport.post(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}/comments',
-            json=data,
-            headers=self.session.get_headers(),
+            json={"content": content},
         )
+        if response.status_code != 201:
+            return None
+        try:
+            return response.json() if response.content else {}
+        except ValueError:
+            # 댓글은 추가되었으므로 알아볼 수 없는 응답 본문은 빈 사전으로 대신한다.
+            return {}
+
+    def add_comment(self, project_id, issue_id):
+        """
+        이슈에 새 댓글을 추가한다.
+        """
+        content = input("코멘트 내용: ")
 
-        if response.status_code == 201:
+        if self.create_comment(project_id, issue_id, content) is not None:
             print("코멘트가 성공적으로 추가되었습니다.")
         else:
-            print(f"코멘트 추가에 실패했습니다. (상태 코드: {response.status_code})")
+            print("코멘트 추가에 실패했습니다.")
 
     def select_comment(self, project_id, issue_id):
         """
         사용자에게 댓글 목록을 보여주고 선택하도록 한다.
         """
-        self.load_comments(project_id, issue_id)
-        try:
-            comment_index = int(input("코멘트 번호를 선택하세요: ")) - 1
-            response = requests.get(
-                f"{self.base_url}/projects/{project_id}/issues/{issue_id}/comments",
-                headers=self.session.get_headers(),
-            )
-            if response.status_code == 200:
-                comments = response.json()
-                if 0 <= comment_index < len(comments):
-                    return comments[comment_index]['id']
-                else:
-                    print("잘못된 코멘트 번호입니다.")
-                    return None
-            else:
-                print("코멘트를 불러오는 데 실패했습니다.")
-                return None
-        except ValueError:
-            print("잘못된 입력입니다. 숫자를 입력하세요.")
+        comments = self.iter_comments(project_id, issue_id)
+        if comments is None:
+            print("코멘트를 불러오는 데 실패했습니다.")
             return None
 
+        print("코멘트:")
+        return Pager().select(comments, self._format_comment, "코멘트", empty="  코멘트가 없습니다.")
+
     def update_comment(self, project_id, issue_id, comment_id):
         """
         기존 댓글을 수정한다.
@@ -84,10 +137,9 @@ class CommentManager:
             return
 
         data = {"content": content}
-        response = requests.put(
+        response = self.session.transport.put(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}/comments/{comment_id}',
             json=data,
-            headers=self.session.get_headers(),
         )
 
         if response.status_code == 200:
@@ -105,9 +157,8 @@ class CommentManager:
         """
         댓글을 삭제한다.
         """
-        response = requests.delete(
+        response = self.session.transport.delete(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}/comments/{comment_id}',
-            headers=self.session.get_headers(),
         )
 
         if response.status_code == 204:
@@ -129,7 +180,8 @@ class CommentManager:
             print("3. 코멘트 삭제")
             print("4. 이슈 수정") 
             print("5. 담당자 추천")
-            print("6. 돌아가기")  
+            print("6. 변경 사항 지켜보기")
+            print("7. 돌아가기")
             choice = input("원하는 기능을 선택하세요: ")
             if choice == '1':
                 self.add_comment(project_id, issue_id)
@@ -141,7 +193,7 @@ class CommentManager:
                 comment_id = self.select_comment(project_id, issue_id)
                 if comment_id:
                     self.delete_comment(project_id, issue_id, comment_id)
-            elif choice in ('4', '5', '6'):  # Allow returning to previous menus
+            elif choice in ('4', '5', '6', '7'):  # Allow returning to previous menus
                 return choice
             else:
                 print("잘못된 입력입니다.")
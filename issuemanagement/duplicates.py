@@ -0,0 +1,283 @@
+import itertools
+import threading
+import zlib
+
+import numpy as np
+
+from issuemanagement.search_index import tokenize
+
+# MinHash 서명 길이 = 밴드 수 × 밴드당 행 수
+BANDS = 16
+ROWS = 4
+NUM_PERM = BANDS * ROWS
+# 서명이 이 비율 이상 같으면 중복 후보로 본다. (LSH 는 대략 (1 / BANDS) ** (1 / ROWS) = 0.5 이상을 찾는다)
+DEFAULT_THRESHOLD = 0.5
+# 몇 단어씩 묶어 shingle 을 만들지
+SHINGLE_SIZE = 2
+
+# 해시 함수 h(x) = (a * x + b) mod p 의 계수. 실행할 때마다 같은 서명이 나오도록 시드를 고정한다.
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(20240521)
+_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)
+# 밴드의 행 값들을 정수 하나로 합칠 때 곱하는 수
+_BAND_MIX = _rng.integers(1, 1 << 62, ROWS, dtype=np.uint64) | np.uint64(1)
+_BAND_SALT = _rng.integers(0, 1 << 62, BANDS, dtype=np.uint64) << np.uint64(2)
+
+def shingles(title, description):
+    """
+    제목과 설명의 연속된 SHINGLE_SIZE 개 단어 묶음을 32비트 해시 집합으로 반환한다. 단어가 적으면 단어 하나씩 사용한다.
+    """
+    tokens = tokenize(f"{title or ''} {description or ''}")
+    if len(tokens) >= SHINGLE_SIZE:
+        tokens = map(' '.join, zip(*(tokens[i:] for i in range(SHINGLE_SIZE))))
+    return {zlib.crc32(token.encode('utf-8')) for token in tokens}
+
+def minhash_many(shingle_sets, chunk=65536):
+    """
+    여러 shingle 해시 집합의 MinHash 서명 (NUM_PERM 개의 최솟값) 을 한 번에 계산한다.
+    (개수, NUM_PERM) 서명 배열과 shingle 이 있는 항목을 표시한 마스크를 반환한다.
+    """
+    lengths = np.fromiter(map(len, shingle_sets), dtype=np.int64, count=len(shingle_sets))
+    present = lengths > 0
+    signatures = np.zeros((len(shingle_sets), NUM_PERM), dtype=np.uint32)
+    hashes = np.fromiter(
+        itertools.chain.from_iterable(shingle_sets), dtype=np.uint64, count=int(lengths.sum())
+    ) % _PRIME
+    rows = np.flatnonzero(present)
+    ends = np.cumsum(lengths[rows])
+    starts = ends - lengths[rows]
+    first = 0
+    while first < len(rows):
+        # 해시 값 배열이 chunk 개를 크게 넘지 않도록 이슈를 나누어 계산한다.
+        last = max(first + 1, int(np.searchsorted(ends, starts[first] + chunk, side='right')))
+        block = hashes[starts[first]:ends[last - 1]]
+        values = (_A[:, None] * block[None, :] + _B[:, None]) % _PRIME
+        offsets = starts[first:last] - starts[first]
+        signatures[rows[first:last]] = np.minimum.reduceat(values, offsets, axis=1).T
+        first = last
+    return signatures, present
+
+def minhash(hashes):
+    """
+    shingle 해시 집합의 MinHash 서명을 반환한다. shingle 이 없으면 None 을 반환한다.
+    """
+    signatures, present = minhash_many([hashes])
+    return signatures[0] if present[0] else None
+
+def band_keys(signatures):
+    """
+    서명을 BANDS 개의 밴드로 나누어 밴드마다 정수 키 하나를 만든다. 밴드가 다르면 값이 같아도 키가 다르다.
+    (개수, NUM_PERM) 배열을 주면 서명마다 키 목록을 반환한다.
+    """
+    bands = signatures.reshape(*signatures.shape[:-1], BANDS, ROWS).astype(np.uint64)
+    return ((bands * _BAND_MIX).sum(axis=-1) ^ _BAND_SALT).tolist()
+
+class DuplicateIndex:
+    """
+    이슈 제목과 설명의 MinHash 서명을 LSH 버킷에 나누어 담는 중복 후보 색인.
+    새 이슈와 같은 버킷에 들어간 이슈만 비교하므로 이슈가 많아도 조회 비용이 거의 늘지 않는다.
+    """
+    def __init__(self, capacity=1024):
+        # 이슈마다 슬롯 번호를 붙여 서명을 NumPy 배열로 관리한다.
+        self.slot_of = {}
+        self.issue_at = [None] * capacity
+        self.signatures = np.zeros((capacity, NUM_PERM), dtype=np.uint32)
+        self.free_slots = []
+        # 밴드 키 -> 슬롯 (하나면 정수, 여럿이면 목록). 이슈를 제거할 때는 저장된 서명으로 키를 다시 계산한다.
+        self.buckets = {}
+        # 미러에서 바뀌었다고 알려온 이슈 ID (다음 조회 전에 다시 색인)
+        self.dirty = set()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.slot_of)
+
+    def _allocate_slot(self):
+        if self.free_slots:
+            return self.free_slots.pop()
+        slot = len(self.slot_of)
+        if slot == len(self.issue_at):
+            # 배열이 가득 차면 두 배로 늘린다.
+            grow = len(self.issue_at)
+            self.issue_at.extend([None] * grow)
+            self.signatures = np.concatenate([self.signatures, np.zeros((grow, NUM_PERM), dtype=np.uint32)])
+        return slot
+
+    def add_issue(self, issue):
+        """
+        이슈 하나를 색인한다. 이미 색인된 이슈면 새 내용으로 교체한다. 내용이 비어 있으면 색인하지 않는다.
+        """
+        self.add_issues([issue])
+
+    def add_issues(self, issues):
+        """
+        여러 이슈의 서명을 한 번에 계산해 색인한다.
+        """
+        issues = list(issues)
+        signatures, present = minhash_many(
+            [shingles(issue.get('title'), issue.get('description')) for issue in issues]
+        )
+        all_keys = band_keys(signatures)
+        with self.lock:
+            buckets = self.buckets
+            for issue, signature, keys, ok in zip(issues, signatures, all_keys, present):
+                self._remove(issue['id'])
+                if not ok:
+                    continue
+                slot = self._allocate_slot()
+                self.slot_of[issue['id']] = slot
+                self.issue_at[slot] = {
+                    "id": issue['id'], "title": issue.get('title'), "status": issue.get('status'),
+                }
+                self.signatures[slot] = signature
+                for key in keys:
+                    members = buckets.get(key)
+                    if members is None:
+                        buckets[key] = slot
+                    elif isinstance(members, int):
+                        buckets[key] = [members, slot]
+                    else:
+                        members.append(slot)
+
+    def remove_issue(self, issue_id):
+        """
+        이슈를 색인에서 제거한다.
+        """
+        with self.lock:
+            self._remove(issue_id)
+
+    def _remove(self, issue_id):
+        slot = self.slot_of.pop(issue_id, None)
+        if slot is None:
+            return
+        for key in band_keys(self.signatures[slot]):
+            members = self.buckets[key]
+            if isinstance(members, int):
+                del self.buckets[key]
+            else:
+                members.remove(slot)
+                if len(members) == 1:
+                    self.buckets[key] = members[0]
+        self.issue_at[slot] = None
+        self.free_slots.append(slot)
+
+    def _candidates(self, keys, exclude=None):
+        """
+        밴드 키가 하나라도 같은 슬롯 배열을 반환한다.
+        """
+        slots = set()
+        for key in keys:
+            members = self.buckets.get(key)
+            if members is None:
+                continue
+            if isinstance(members, int):
+                slots.add(members)
+            else:
+                slots.update(members)
+        slots.discard(exclude)
+        return np.fromiter(slots, dtype=np.int64, count=len(slots))
+
+    def similarity(self, signature, slots):
+        """
+        서명과 슬롯들의 서명이 같은 비율 (Jaccard 유사도 추정값) 을 반환한다.
+        """
+        return (self.signatures[slots] == signature).mean(axis=1)
+
+    def find_duplicates(self, title, description, threshold=DEFAULT_THRESHOLD, limit=5):
+        """
+        제목과 설명이 비슷한 기존 이슈를 유사도 순으로 [{"id", "title", "status", "similarity"}, ...] 목록으로 반환한다.
+        """
+        signature = minhash(shingles(title, description))
+        if signature is None:
+            return []
+        with self.lock:
+            slots = self._candidates(band_keys(signature))
+            if not len(slots):
+                return []
+            scores = self.similarity(signature, slots)
+            keep = scores >= threshold
+            slots, scores = slots[keep], scores[keep]
+            order = np.argsort(-scores, kind='stable')[:limit]
+            return [
+                {**self.issue_at[slots[i]], "similarity": round(float(scores[i]), 3)} for i in order
+            ]
+
+    def clusters(self, threshold=DEFAULT_THRESHOLD, min_size=2):
+        """
+        서로 비슷한 이슈끼리 묶은 중복 묶음 목록을 크기 순으로 반환한다.
+        묶음은 {"size", "issues": [{"id", "title", "status"}, ...]} 이고 이슈는 ID 순서이다.
+        """
+        with self.lock:
+            parent = {}
+
+            def find(slot):
+                root = slot
+                while parent.get(root, root) != root:
+                    root = parent[root]
+                while slot != root:
+                    parent[slot], slot = root, parent.get(slot, slot)
+                return root
+
+            for members in self.buckets.values():
+                if isinstance(members, int):
+                    continue
+                # 버킷 안에서 앞서 만든 묶음의 대표와만 비교한다. (같은 이슈가 수십 번 등록된 버킷도 빠르게 묶인다)
+                leaders = []
+                for slot in members:
+                    if leaders:
+                        scores = self.similarity(self.signatures[slot], np.array(leaders))
+                        best = int(np.argmax(scores))
+                        if scores[best] >= threshold:
+                            a, b = find(slot), find(leaders[best])
+                            if a != b:
+                                parent[a] = b
+                            continue
+                    leaders.append(slot)
+
+            groups = {}
+            for slot in parent:
+                groups.setdefault(find(slot), []).append(slot)
+            for root, slots in groups.items():
+                slots.append(root)
+            result = []
+            for slots in groups.values():
+                if len(slots) >= min_size:
+                    issues = sorted((self.issue_at[slot] for slot in slots), key=lambda issue: issue["id"])
+                    result.append({"size": len(issues), "issues": issues})
+        result.sort(key=lambda cluster: (-cluster["size"], cluster["issues"][0]["id"]))
+        return result
+
+    def mark_dirty(self, issue_ids):
+        with self.lock:
+            self.dirty.update(issue_ids)
+
+    def refresh(self, mirror, project_id):
+        """
+        바뀐 것으로 표시된 이슈만 미러에서 다시 읽어 색인을 갱신한다.
+        """
+        with self.lock:
+            dirty, self.dirty = self.dirty, set()
+        changed = []
+        for issue_id in dirty:
+            issue = mirror.get_issue(project_id, issue_id)
+            if issue is None:
+                self.remove_issue(issue_id)
+            else:
+                changed.append(issue)
+        self.add_issues(changed)
+
+    @classmethod
+    def from_issues(cls, issues):
+        """
+        이슈 목록으로 색인을 만든다.
+        """
+        index = cls()
+        batch = []
+        for issue in issues:
+            batch.append(issue)
+            if len(batch) >= 5000:
+                index.add_issues(batch)
+                batch = []
+        index.add_issues(batch)
+        return index
@@ -0,0 +1,275 @@
+import contextlib
+import gzip
+import json
+import os
+import time
+
+# 파일 하나(부분)에 담을 이슈 수. 내보내는 동안 메모리에는 한 부분의 이슈와 댓글만 둔다.
+PART_SIZE = 10000
+MANIFEST = 'manifest.json'
+# 열 파일에 담을 필드와 형식
+#   int: int64 (없으면 -1), date: datetime64[s] (없으면 NaT)
+#   category: 필드.codes int32 (없으면 -1) + 필드.categories 문자열 목록
+#   text: 필드.data (UTF-8 바이트를 이어 붙인 uint8) + 필드.offsets int64 (없으면 빈 문자열)
+ISSUE_COLUMNS = (
+    ('id', 'int'),
+    ('title', 'text'),
+    ('description', 'text'),
+    ('status', 'category'),
+    ('priority', 'category'),
+    ('reporterUsername', 'category'),
+    ('assigneeUsername', 'category'),
+    ('fixerUsername', 'category'),
+    ('reportedDate', 'date'),
+)
+COMMENT_COLUMNS = (
+    ('id', 'int'),
+    ('issueId', 'int'),
+    ('username', 'category'),
+    ('createdAt', 'date'),
+    ('content', 'text'),
+)
+
+def to_columns(records, columns):
+    """
+    레코드 목록을 열 이름 -> NumPy 배열 사전으로 바꾼다.
+    """
+    import numpy as np
+
+    arrays = {}
+    for name, kind in columns:
+        values = [record.get(name) for record in records]
+        if kind == 'int':
+            arrays[name] = np.array([-1 if v is None else v for v in values], dtype=np.int64)
+        elif kind == 'date':
+            arrays[name] = np.array([v[:19] if v else 'NaT' for v in values], dtype='datetime64[s]')
+        elif kind == 'category':
+            categories = sorted({v for v in values if v is not None})
+            lookup = {category: code for code, category in enumerate(categories)}
+            arrays[f'{name}.codes'] = np.array([lookup.get(v, -1) for v in values], dtype=np.int32)
+            arrays[f'{name}.categories'] = np.array(categories, dtype=str)
+        else:
+            encoded = [(v or '').encode('utf-8') for v in values]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in encoded], out=offsets[1:])
+            arrays[f'{name}.offsets'] = offsets
+            arrays[f'{name}.data'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return arrays
+
+def read_columns(path):
+    """
+    to_columns 로 저장한 .npz 열 파일을 읽어 열 이름 -> 배열 사전으로 반환한다.
+    범주 열은 문자열(없으면 None) 객체 배열로, 텍스트 열은 문자열 객체 배열로 되돌린다.
+    """
+    import numpy as np
+
+    with np.load(path) as npz:
+        stored = {key: npz[key] for key in npz.files}
+    columns = {}
+    for key, array in stored.items():
+        name, _, part = key.partition('.')
+        if not part:
+            columns[name] = array
+        elif part == 'codes':
+            categories = np.append(stored[f'{name}.categories'].astype(object), None)
+            columns[name] = categories[array]
+        elif part == 'offsets':
+            data = stored[f'{name}.data'].tobytes()
+            columns[name] = np.array(
+                [data[start:end].decode('utf-8') for start, end in zip(array[:-1], array[1:])], dtype=object
+            )
+    return columns
+
+def _write_atomic(path, write):
+    """
+    임시 파일에 쓴 뒤 이름을 바꾸어, 중단되더라도 반쯤 쓴 파일이 남지 않게 한다.
+    """
+    temporary = f'{path}.tmp'
+    write(temporary)
+    os.replace(temporary, path)
+
+def _write_jsonl_gz(path, records):
+    def write(temporary):
+        with gzip.open(temporary, 'wt', encoding='utf-8', compresslevel=6) as file:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False) + '\n')
+    _write_atomic(path, write)
+
+def _write_npz(path, arrays):
+    import numpy as np
+
+    def write(temporary):
+        with open(temporary, 'wb') as file:
+            np.savez_compressed(file, **arrays)
+    _write_atomic(path, write)
+
+class ExportManager:
+    """
+    프로젝트의 이슈와 댓글을 분석용 파일로 내보내는 클래스.
+    이슈는 서버 응답을 받는 대로 PART_SIZE 개씩 나누어 부분마다 압축 JSONL(issues-00000.jsonl.gz)과
+    NumPy 열 파일(issues-00000.npz)로 쓰고, 그다음 부분마다 댓글을 동시에 받아 같은 형식으로 쓴다.
+    끝난 부분은 manifest.json 에 기록하므로 중단된 뒤 같은 디렉터리로 다시 실행하면 남은 부분부터 이어서 진행한다.
+    """
+    def __init__(self, base_url, session):
+        self.base_url = base_url
+        self.session = session
+
+    def export_project(self, project_id, directory, with_comments=True, part_size=PART_SIZE, progress=None):
+        """
+        프로젝트를 directory 에 내보내고 {"projectId", "issues", "comments", "parts", "failedComments", "resumed"} 를 반환한다.
+        progress 를 주면 부분 하나를 쓸 때마다 (단계, 부분 정보) 로 호출한다. 이슈 목록을 불러오지 못하면 None 을 반환한다.
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest = self._load_manifest(directory, project_id, part_size)
+        resumed = bool(manifest["parts"])
+        if not manifest["issuesComplete"]:
+            if not self._export_issues(project_id, directory, manifest, progress):
+                return None
+        if with_comments:
+            for part in manifest["parts"]:
+                # 댓글을 받지 못한 이슈가 있던 부분도 다시 받는다.
+                if part["comments"] is None or part["failedComments"]:
+                    self._export_comments(project_id, directory, manifest, part)
+                    if progress is not None:
+                        progress('comments', part)
+        parts = manifest["parts"]
+        return {
+            "projectId": project_id,
+            "issues": sum(part["issues"] for part in parts),
+            "comments": sum(part["comments"] or 0 for part in parts),
+            "parts": len(parts),
+            "failedComments": sum(len(part["failedComments"]) for part in parts),
+            "resumed": resumed,
+        }
+
+    @staticmethod
+    def _load_manifest(directory, project_id, part_size):
+        """
+        이어서 진행할 수 있는 manifest 를 읽는다. 없거나 다른 내보내기의 것이면 새로 만든다.
+        """
+        path = os.path.join(directory, MANIFEST)
+        try:
+            with open(path, encoding='utf-8') as file:
+                manifest = json.load(file)
+            if manifest["projectId"] == project_id and manifest["partSize"] == part_size:
+                return manifest
+        except (OSError, ValueError, KeyError):
+            pass
+        return {"projectId": project_id, "partSize": part_size, "issuesComplete": False, "parts": []}
+
+    @staticmethod
+    def _save_manifest(directory, manifest):
+        def write(temporary):
+            with open(temporary, 'w', encoding='utf-8') as file:
+                json.dump(manifest, file, ensure_ascii=False, indent=1)
+        _write_atomic(os.path.join(directory, MANIFEST), write)
+
+    def _export_issues(self, project_id, directory, manifest, progress):
+        """
+        이슈 목록을 받는 대로 부분 파일로 쓴다. 이전에 쓴 부분만큼은 건너뛰고, 건너뛴 마지막 이슈가
+        manifest 와 다르면 (그사이 목록이 바뀐 경우) 처음부터 다시 쓴다. 실패하면 False 를 반환한다.
+        """
+        while True:
+            issues = self.session.issue_manager.stream_issues(project_id)
+            if issues is None:
+                return False
+            with contextlib.closing(issues):
+                parts = manifest["parts"]
+                skip = sum(part["issues"] for part in parts)
+                last_skipped = None
+                for _ in range(skip):
+                    last_skipped = next(issues, None)
+                if parts and (last_skipped is None or last_skipped['id'] != parts[-1]["lastId"]):
+                    self._remove_parts(directory, manifest)
+                    continue
+                batch = []
+                for issue in issues:
+                    batch.append(issue)
+                    if len(batch) == manifest["partSize"]:
+                        self._write_issue_part(directory, manifest, batch, progress)
+                        batch = []
+                if batch:
+                    self._write_issue_part(directory, manifest, batch, progress)
+            manifest["issuesComplete"] = True
+            self._save_manifest(directory, manifest)
+            return True
+
+    def _remove_parts(self, directory, manifest):
+        """
+        이전에 쓴 부분 파일을 모두 지우고 manifest 를 비운다.
+        """
+        for part in manifest["parts"]:
+            for kind in ('issues', 'comments'):
+                for extension in ('jsonl.gz', 'npz'):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(os.path.join(directory, f'{kind}-{part["index"]:05d}.{extension}'))
+        manifest["parts"] = []
+        self._save_manifest(directory, manifest)
+
+    def _write_issue_part(self, directory, manifest, issues, progress):
+        index = len(manifest["parts"])
+        name = f'issues-{index:05d}'
+        _write_jsonl_gz(os.path.join(directory, f'{name}.jsonl.gz'), issues)
+        _write_npz(os.path.join(directory, f'{name}.npz'), to_columns(issues, ISSUE_COLUMNS))
+        part = {
+            "index": index, "issues": len(issues), "firstId": issues[0]['id'], "lastId": issues[-1]['id'],
+            "comments": None, "failedComments": [],
+        }
+        manifest["parts"].append(part)
+        self._save_manifest(directory, manifest)
+        if progress is not None:
+            progress('issues', part)
+
+    def _export_comments(self, project_id, directory, manifest, part):
+        """
+        부분 하나에 속한 이슈들의 댓글을 동시에 받아 부분 파일로 쓴다. 받지 못한 이슈는 failedComments 에 남긴다.
+        """
+        issue_ids = read_columns(os.path.join(directory, f'issues-{part["index"]:05d}.npz'))['id'].tolist()
+        client = self.session.async_client
+        results = client.run(client.fetch_comments_many(project_id, issue_ids))
+        comments = []
+        failed = []
+        for issue_id in issue_ids:
+            if results[issue_id] is None:
+                failed.append(issue_id)
+                continue
+            comments.extend({**comment, "issueId": issue_id} for comment in results[issue_id])
+        name = f'comments-{part["index"]:05d}'
+        _write_jsonl_gz(os.path.join(directory, f'{name}.jsonl.gz'), comments)
+        _write_npz(os.path.join(directory, f'{name}.npz'), to_columns(comments, COMMENT_COLUMNS))
+        part["comments"] = len(comments)
+        part["failedComments"] = failed
+        self._save_manifest(directory, manifest)
+
+    def export_screen(self, project_id):
+        """
+        프로젝트의 이슈와 댓글을 분석용 파일로 내보내는 화면
+        """
+        directory = input("저장할 디렉터리: ").strip()
+        if not directory:
+            print("디렉터리를 입력하세요.")
+            return
+        with_comments = input("댓글도 포함할까요? (y/n): ").strip().lower() != 'n'
+        started = time.perf_counter()
+
+        def progress(stage, part):
+            label = '이슈' if stage == 'issues' else '댓글'
+            print(f"  {label} 부분 {part['index'] + 1} 저장 ({time.perf_counter() - started:.1f}초)")
+
+        try:
+            result = self.export_project(project_id, directory, with_comments, progress=progress)
+        except OSError as error:
+            print(f"파일을 저장하지 못했습니다: {error}")
+            return
+        except KeyboardInterrupt:
+            print("내보내기를 중단했습니다. 같은 디렉터리로 다시 실행하면 이어서 진행합니다.")
+            return
+        if result is None:
+            print("이슈 목록을 불러오는 데 실패했습니다.")
+            return
+        print(
+            f"이슈 {result['issues']}개, 댓글 {result['comments']}개를 {directory} 에 "
+            f"{result['parts']}개 부분으로 저장했습니다. ({time.perf_counter() - started:.1f}초)"
+        )
+        if result["failedComments"]:
+            print(f"댓글을 불러오지 못한 이슈 {result['failedComments']}개는 manifest.json 에 기록했습니다.")
@@ -0,0 +1,103 @@
+import contextlib
+
+from issuemanagement.pager import Pager
+
+class GlobalSearchManager:
+    """
+    모든 프로젝트에 같은 이슈 검색을 동시에 보내고 결과를 합쳐 보여주는 클래스.
+    동시에 보내는 요청 수는 비동기 클라이언트(session.async_client)의 max_concurrency 로 제한한다.
+    """
+    def __init__(self, base_url, session):
+        self.base_url = base_url
+        self.session = session
+        # 마지막 검색에서 실패한 프로젝트 목록
+        self.failed = []
+
+    def search(self, params=None, user_message=None, project_ids=None):
+        """
+        모든 프로젝트(project_ids 를 주면 그 프로젝트만)에서 이슈를 검색해, 프로젝트 응답이 오는 대로 이슈를 내보내는 반복자를 반환한다.
+        이슈에는 projectId, projectName, rank(프로젝트 안에서의 순위) 를 덧붙이고, 같은 이슈는 한 번만 내보낸다.
+        user_message 를 주면 서버의 자연어 검색을 사용한다. 프로젝트 목록을 불러오지 못하면 None 을 반환한다.
+        검색에 실패한 프로젝트는 반복이 끝난 뒤 self.failed 에 남는다.
+        """
+        projects = self.session.project_manager.load_projects(show=False)
+        if projects is None:
+            return None
+        # 같은 프로젝트가 두 번 나와도 한 번만 검색한다.
+        projects = list({project['id']: project for project in projects}.values())
+        if project_ids is not None:
+            wanted = set(project_ids)
+            projects = [project for project in projects if project['id'] in wanted]
+        self.failed = []
+        return self._merge(projects, params, user_message)
+
+    def _merge(self, projects, params, user_message):
+        client = self.session.async_client
+        seen = set()
+        for project, issues in client.iterate(client.search_projects(projects, params, user_message)):
+            if issues is None:
+                self.failed.append(project)
+                continue
+            for rank, issue in enumerate(issues, 1):
+                key = (project['id'], issue['id'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield {**issue, "projectId": project['id'], "projectName": project['name'], "rank": rank}
+
+    @staticmethod
+    def ranked(results):
+        """
+        검색 결과를 모두 받아 프로젝트 안에서의 순위 순서로 섞어 정렬한다. (각 프로젝트의 1위, 그다음 2위, ...)
+        """
+        return sorted(results, key=lambda issue: (issue["rank"], issue["projectName"], issue["id"]))
+
+    def global_search_screen(self):
+        """
+        모든 프로젝트에서 이슈를 검색하는 화면
+        """
+        search_by = input("검색 기준 (assignee, reporter, status, priority, nl): ").strip().lower()
+        params = {}
+        user_message = None
+        if search_by == "assignee":
+            params["assigneeUsername"] = input("담당자 이름: ")
+        elif search_by == "reporter":
+            params["reporterUsername"] = input("등록자 이름: ")
+        elif search_by == "status":
+            params["status"] = input("이슈 상태 (NEW, ASSIGNED, FIXED, RESOLVED, CLOSED, REOPENED): ").upper()
+        elif search_by == "priority":
+            params["priority"] = input("이슈 우선순위 (BLOCKER, CRITICAL, MAJOR, MINOR, TRIVIAL): ").upper()
+        elif search_by == "nl":
+            user_message = input("검색: ")
+        else:
+            print("잘못된 입력입니다.")
+            return
+
+        results = self.search(params, user_message)
+        if results is None:
+            print("프로젝트 목록을 불러오는 데 실패했습니다.")
+            return
+        try:
+            with contextlib.closing(results):
+                if not Pager().show(results, self._format_issue):
+                    print("해당하는 이슈가 없습니다.")
+        except KeyboardInterrupt:
+            print("\n검색을 중단했습니다.")
+            return
+        if self.failed:
+            names = ', '.join(project['name'] for project in self.failed[:20])
+            print(f"검색에 실패한 프로젝트 {len(self.failed)}개: {names}")
+
+    @staticmethod
+    def _format_issue(number, issue):
+        """
+        목록에 표시할 이슈 하나의 문자열을 만든다.
+        """
+        header = "\n--- 전체 프로젝트 검색 결과 ---\n" if number == 1 else ""
+        return (
+            f"{header}{'-' * 20}\n"
+            f"{number}. [{issue['projectName']}] {issue['title']} (ID: {issue['id']})\n"
+            f"  등록자: {issue['reporterUsername']}\n"
+            f"  담당자: {issue['assigneeUsername'] if issue['assigneeUsername'] else '미지정'}\n"
+            f"  상태: {issue['status']}"
+        )
@@ -1,5 +1,8 @@
 import datetime
-import requests
+
+from issuemanagement.cache import response_validators
+from issuemanagement.jsonstream import iter_response_array
+from issuemanagement.pager import Pager
 
 class IssueManager:
     """
@@ -8,6 +11,14 @@ class IssueManager:
     def __init__(self, base_url, session):
         self.base_url = base_url
         self.session = session
+        # 프로젝트 ID -> 로컬 검색 색인
+        self.search_indexes = {}
+        # 프로젝트 ID -> 중복 이슈 색인
+        self.duplicate_indexes = {}
+        # 프로젝트 ID -> 미러에 끝까지 저장한 이슈 목록의 검증 헤더
+        self._list_validators = {}
+        if session.mirror is not None:
+            session.mirror.add_listener(self._on_mirror_change)
 
     def register_issue(self, project_id):
         """
@@ -15,12 +26,41 @@ class IssueManager:
         """
         title = input("이슈 제목: ")
         description = input("이슈 설명: ")
+        if not self._confirm_not_duplicate(project_id, title, description):
+            print("이슈 등록을 취소했습니다.")
+            return
+        issue = self.build_issue(project_id, title, description)
+
+        response = self.session.transport.post(
+            f'{self.base_url}/projects/{project_id}/issues',
+            json=issue,
+        )
+
+        if response.status_code == 201:
+            created = self._created_issue(response)
+            self._index_created_issue(project_id, created)
+            mirror = self.session.mirror
+            if mirror is not None and mirror.has_project(project_id):
+                # 새 이슈가 목록에 바로 보이도록 응답으로 받은 이슈만 미러에 저장한다.
+                # (응답에 이슈가 없을 때만 목록 전체를 다시 받는다)
+                if created is not None:
+                    mirror.save_issues(project_id, [created])
+                else:
+                    self.session.sync_manager.sync_project(project_id, with_comments=False)
+            print("이슈가 성공적으로 등록되었습니다.")
+        else:
+            print("이슈 등록에 실패했습니다.")
+
+    def build_issue(self, project_id, title, description, reported_date=None):
+        """
+        이슈 등록 요청 본문을 만든다. 등록일을 주지 않으면 현재 시각을 사용한다.
+        """
         reporterUsername = (
             self.session.get_headers()['Cookie'].split('=')[1]
-        )  
-        reportedDate = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        )
+        reportedDate = reported_date or datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
 
-        issue = {
+        return {
             "title": title,
             "description": description,
             "reporterUsername": reporterUsername,
@@ -29,64 +69,121 @@ class IssueManager:
             # other fields can be added here
         }
 
-        response = requests.post(
+    def iter_issues(self, project_id):
+        """
+        프로젝트의 모든 이슈를 하나씩 내보내는 반복자를 반환한다. 실패하면 None 을 반환한다.
+        동기화된 프로젝트는 로컬 미러에서 읽고, 아니면 서버 응답을 받는 대로 디코딩한다.
+        목록을 끝까지 미러에 저장한 뒤에는 그 검증 헤더로 조건부 GET 을 보내고, 서버가 304 를 주면 미러에서 내보낸다.
+        """
+        mirror = self.session.mirror
+        if mirror is None:
+            return self.stream_issues(project_id)
+        if mirror.has_project(project_id):
+            return mirror.iter_issues(project_id)
+        response = self.session.transport.get(
             f'{self.base_url}/projects/{project_id}/issues',
-            json=issue,
-            headers=self.session.get_headers(),
+            headers=self._list_validators.get(project_id),
+            stream=True,
         )
+        if response.status_code == 304:
+            response.close()
+            return mirror.iter_issues(project_id)
+        if response.status_code != 200:
+            response.close()
+            return None
+        self._list_validators.pop(project_id, None)
+        return self._write_through(project_id, iter_response_array(response), response_validators(response))
 
-        if response.status_code == 201:
-            print("이슈가 성공적으로 등록되었습니다.")
-        else:
-            print("이슈 등록에 실패했습니다.")
+    def _write_through(self, project_id, issues, validators, batch_size=500):
+        """
+        받은 이슈를 그대로 내보내면서 배치 단위로 미러에 저장한다.
+        끝까지 받았을 때만 서버에서 지워진 이슈를 미러에서도 지우고 다음 조회에 쓸 검증 헤더를 기억한다.
+        """
+        mirror = self.session.mirror
+        batch = []
+        seen = set()
+        complete = False
+        try:
+            for issue in issues:
+                batch.append(issue)
+                seen.add(issue['id'])
+                if len(batch) >= batch_size:
+                    mirror.save_issues(project_id, batch)
+                    batch = []
+                yield issue
+            complete = True
+        finally:
+            issues.close()
+            if batch:
+                mirror.save_issues(project_id, batch)
+            if complete:
+                mirror.delete_issues(project_id, set(mirror.get_issue_hashes(project_id)) - seen)
+                if validators:
+                    self._list_validators[project_id] = validators
 
-    def load_issues(self, project_id):
+    def stream_issues(self, project_id):
         """
-        주어진 프로젝트에 대한 모든 이슈를 불러온다.
+        프로젝트의 이슈를 디코딩되는 대로 하나씩 내보내는 반복자를 반환한다. 실패하면 None 을 반환한다.
         """
-        response = requests.get(
-            f'{self.base_url}/projects/{project_id}/issues',
-            headers=self.session.get_headers(),
+        return self._stream(f'{self.base_url}/projects/{project_id}/issues')
+
+    def stream_search(self, project_id, params=None, user_message=None):
+        """
+        이슈 검색 결과를 하나씩 내보내는 반복자를 반환한다. 실패하면 None 을 반환한다.
+        user_message 를 주면 서버의 자연어 검색을 사용한다.
+        """
+        if user_message is not None:
+            return self._stream(
+                f'{self.base_url}/projects/{project_id}/issues/searchbynl',
+                {"userMessage": user_message},
+            )
+        return self._stream(
+            f'{self.base_url}/projects/{project_id}/issues/search',
+            {"projectId": project_id, **(params or {})},
         )
 
+    def fetch_issue(self, project_id, issue_id):
+        """
+        이슈 하나를 불러와 반환한다. 실패하면 None 을 반환한다.
+        """
+        response = self.session.transport.get(
+            f'{self.base_url}/projects/{project_id}/issues/{issue_id}',
+            cache=True,
+            revalidate=True,
+        )
         if response.status_code == 200:
-            issues = response.json()
-            print("\n--- 이슈 목록 ---")
-            for i, issue in enumerate(issues):
-                print(f"{i+1}. {issue['title']}")
-            return issues
-        else:
-            print("이슈 목록을 불러오는 데 실패했습니다.")
+            return response.json()
+        return None
+
+    def _stream(self, url, params=None):
+        response = self.session.transport.get(url, params=params, stream=True)
+        if response.status_code != 200:
+            response.close()
             return None
+        return iter_response_array(response)
 
     def select_issue(self, project_id):
         """
-        사용자가 이슈 목록에서 특정 이슈를 선택하도록 한다.
+        사용자가 이슈 목록에서 특정 이슈를 선택하도록 한다. 목록은 한 페이지씩 표시한다.
         """
-        issues = self.load_issues(project_id)
-        if not issues:
+        issues = self.iter_issues(project_id)
+        if issues is None:
+            print("이슈 목록을 불러오는 데 실패했습니다.")
             return None
 
-        try:
-            issue_index = int(input("이슈 번호를 선택하세요: ")) - 1
-            if 0 <= issue_index < len(issues):
-                return issues[issue_index]['id']
-            else:
-                print("잘못된 이슈 번호입니다.")
-                return None
-        except ValueError:
-            print("잘못된 입력입니다. 숫자를 입력하세요.")
-            return None
+        print("\n--- 이슈 목록 ---")
+        return Pager().select(issues, lambda number, issue: f"{number}. {issue['title']}", "이슈")
 
     def browse_and_search_issues(self, project_id):
         """
-        다양한 기준 (담당자, 등록자, 상태) 에 따라 이슈를 검색한다.
+        다양한 기준 (담당자, 등록자, 상태, 우선순위, 검색어) 에 따라 이슈를 검색한다.
         """
         search_by = input(
-            "검색 기준 (assignee, reporter, status, all): "
+            "검색 기준 (assignee, reporter, status, priority, text, all): "
         ).lower()
 
         params = {"projectId": project_id}
+        query = ''
         if search_by == "assignee":
             assigneeUsername = input("담당자 이름: ")
             params["assigneeUsername"] = assigneeUsername
@@ -98,74 +195,243 @@ class IssueManager:
                 "이슈 상태 (NEW, ASSIGNED, FIXED, RESOLVED, CLOSED, REOPENED): "
             ).upper()
             params["status"] = status
+        elif search_by == "priority":
+            priority = input(
+                "이슈 우선순위 (BLOCKER, CRITICAL, MAJOR, MINOR, TRIVIAL): "
+            ).upper()
+            params["priority"] = priority
+        elif search_by == "text":
+            query = input("검색어: ")
 
-        response = requests.get(
-            f'{self.base_url}/projects/{project_id}/issues/search',
-            params=params,
-            headers=self.session.get_headers(),
-        )
+        if query and self.get_search_index(project_id) is None:
+            print("검색어 검색은 로컬 미러를 동기화한 뒤에 사용할 수 있습니다.")
+            return
 
-        if response.status_code == 200:
-            issues = response.json()
-            if issues:
-                print("\n--- 이슈 목록 ---")
-                for i, issue in enumerate(issues):
-                    print("-" * 20)
-                    print(f"{i+1}. {issue['title']} (ID: {issue['id']})")
-                    print(f"  설명: {issue['description']}")
-                    print(f"  등록자: {issue['reporterUsername']}")
-                    print(
-                        f"  담당자: {issue['assigneeUsername'] if issue['assigneeUsername'] else '미지정'}"
-                    )
-                    print(f"  상태: {issue['status']}")
-            else:
-                print("해당하는 이슈가 없습니다.")
+        issues = self.find_issues(
+            project_id,
+            query,
+            assignee=params.get("assigneeUsername"),
+            reporter=params.get("reporterUsername"),
+            status=params.get("status"),
+            priority=params.get("priority"),
+        )
+        if issues is not None:
+            self._print_issue_list(issues)
         else:
             print("이슈 검색에 실패했습니다.")
 
-    def search_issuesbyNL(self, project_id):
+    def find_issues(self, project_id, query='', assignee=None, reporter=None, status=None, priority=None):
+        """
+        조건에 맞는 이슈를 내보내는 반복 가능 객체를 반환한다. 실패하면 None 을 반환한다.
+        동기화된 프로젝트는 로컬 색인에서 찾고, 아니면 서버 검색 결과를 받는 대로 디코딩한다. (검색어는 로컬 색인에서만 사용)
+        """
+        index = self.get_search_index(project_id)
+        if index is not None:
+            return index.search(
+                query, limit=None, assignee=assignee, reporter=reporter, status=status, priority=priority
+            )
+        if query:
+            return None
+
+        params = {
+            "assigneeUsername": assignee,
+            "reporterUsername": reporter,
+            "status": status,
+            "priority": priority,
+        }
+        return self.stream_search(project_id, {k: v for k, v in params.items() if v is not None})
+
+    def search_issuesbyNL(self, project_id, use_server=False):
         """
         자연어 입력을 기반으로 이슈를 검색한다.
+        기본적으로 로컬 색인을 사용하고, use_server=True 일 때만 서버의 자연어 검색을 호출한다.
         """
+        if not use_server:
+            index = self.get_search_index(project_id)
+            if index is None:
+                print("로컬 검색 색인이 없습니다. 로컬 미러를 동기화하거나 서버 자연어 검색을 사용하세요.")
+                return
+            userMessage = input("검색: ")
+            self._print_issue_list(index.search(userMessage))
+            return
+
         userMessage = input("검색: ")
 
-        params = {"userMessage": userMessage}
+        issues = self.stream_search(project_id, user_message=userMessage)
+        if issues is not None:
+            self._print_issue_list(issues)
+        else:
+            print("이슈 검색에 실패했습니다.")
 
-        response = requests.get(
-            f'{self.base_url}/projects/{project_id}/issues/searchbynl',
-            params=params,
-            headers=self.session.get_headers(),
-        )
+    def get_search_index(self, project_id):
+        """
+        프로젝트의 로컬 검색 색인을 반환한다. 프로젝트가 아직 동기화되지 않았으면 None 을 반환한다.
+        """
+        # NumPy 를 쓰는 색인 모듈은 처음 검색할 때 불러온다.
+        from issuemanagement.search_index import SearchIndex
 
-        if response.status_code == 200:
-            issues = response.json()
-            if issues:
-                print("\n--- 이슈 목록 ---")
-                for i, issue in enumerate(issues):
-                    print("-" * 20)
-                    print(f"{i+1}. {issue['title']} (ID: {issue['id']})")
-                    print(f"  설명: {issue['description']}")
-                    print(f"  등록자: {issue['reporterUsername']}")
-                    print(
-                        f"  담당자: {issue['assigneeUsername'] if issue['assigneeUsername'] else '미지정'}"
-                    )
-                    print(f"  상태: {issue['status']}")
-            else:
-                print("해당하는 이슈가 없습니다.")
+        mirror = self.session.mirror
+        if mirror is None or not mirror.has_project(project_id):
+            return None
+        index = self.search_indexes.get(project_id)
+        if index is None:
+            index = SearchIndex.from_mirror(mirror, project_id)
+            self.search_indexes[project_id] = index
         else:
-            print("이슈 검색에 실패했습니다.")
+            index.refresh(mirror, project_id)
+        return index
+
+    def get_duplicate_index(self, project_id):
+        """
+        프로젝트의 중복 이슈 색인을 반환한다. 처음에는 프로젝트 이슈 전체로 만들고, 이후에는 바뀐 이슈만 다시 색인한다.
+        이슈 목록을 불러오지 못하면 None 을 반환한다.
+        """
+        # NumPy 를 쓰는 색인 모듈은 처음 사용할 때 불러온다.
+        from issuemanagement.duplicates import DuplicateIndex
+
+        index = self.duplicate_indexes.get(project_id)
+        mirror = self.session.mirror
+        if index is None:
+            issues = self.iter_issues(project_id)
+            if issues is None:
+                return None
+            index = DuplicateIndex.from_issues(issues)
+            self.duplicate_indexes[project_id] = index
+        elif mirror is not None and mirror.has_project(project_id):
+            index.refresh(mirror, project_id)
+        return index
+
+    def find_duplicates(self, project_id, title, description, threshold=None):
+        """
+        제목과 설명이 비슷한 기존 이슈 목록을 반환한다. 색인을 만들지 못하면 None 을 반환한다.
+        """
+        from issuemanagement.duplicates import DEFAULT_THRESHOLD
+
+        index = self.get_duplicate_index(project_id)
+        if index is None:
+            return None
+        return index.find_duplicates(title, description, threshold or DEFAULT_THRESHOLD)
+
+    def duplicate_report(self, project_id, threshold=None, min_size=2):
+        """
+        프로젝트 전체의 중복 이슈 묶음 목록을 크기 순으로 반환한다. 색인을 만들지 못하면 None 을 반환한다.
+        """
+        from issuemanagement.duplicates import DEFAULT_THRESHOLD
+
+        index = self.get_duplicate_index(project_id)
+        if index is None:
+            return None
+        return index.clusters(threshold or DEFAULT_THRESHOLD, min_size)
+
+    def _confirm_not_duplicate(self, project_id, title, description):
+        """
+        비슷한 이슈가 이미 있으면 보여주고 그래도 등록할지 묻는다. 등록을 계속하면 True 를 반환한다.
+        """
+        duplicates = self.find_duplicates(project_id, title, description)
+        if not duplicates:
+            # 색인을 만들지 못했으면 확인 없이 등록한다.
+            return True
+        print("\n비슷한 이슈가 이미 있습니다:")
+        for issue in duplicates:
+            print(f"  ID {issue['id']}: {issue['title']} ({issue['status']}, 유사도 {issue['similarity']:.0%})")
+        return input("그래도 등록할까요? (y/n): ").strip().lower() == 'y'
+
+    @staticmethod
+    def _created_issue(response):
+        """
+        201 응답 본문의 새 이슈를 반환한다. 본문이 비었거나 ID 가 있는 이슈가 아니면 None 을 반환한다.
+        """
+        try:
+            created = response.json()
+        except ValueError:
+            return None
+        return created if isinstance(created, dict) and 'id' in created else None
+
+    def _index_created_issue(self, project_id, created):
+        """
+        등록된 이슈를 중복 색인에 바로 추가한다.
+        """
+        index = self.duplicate_indexes.get(project_id)
+        if index is not None and created is not None:
+            index.add_issue(created)
+
+    def duplicate_report_screen(self, project_id):
+        """
+        프로젝트의 중복 이슈 묶음을 큰 순서대로 한 페이지씩 보여준다.
+        """
+        print("중복 이슈를 찾는 중입니다...")
+        clusters = self.duplicate_report(project_id)
+        if clusters is None:
+            print("이슈 목록을 불러오는 데 실패했습니다.")
+            return
+        if not Pager(page_size=5).show(clusters, self._format_cluster):
+            print("중복으로 보이는 이슈가 없습니다.")
+
+    @staticmethod
+    def _format_cluster(number, cluster):
+        """
+        중복 묶음 하나를 표시할 문자열을 만든다.
+        """
+        header = "\n--- 중복 이슈 묶음 ---\n" if number == 1 else ""
+        lines = [f"{header}{'-' * 20}", f"{number}. {cluster['size']}개 이슈"]
+        for issue in cluster["issues"][:10]:
+            lines.append(f"  ID {issue['id']}: {issue['title']} ({issue['status']})")
+        if cluster["size"] > 10:
+            lines.append(f"  ... 외 {cluster['size'] - 10}개")
+        return '\n'.join(lines)
+
+    def _on_mirror_change(self, project_id, issue_ids):
+        """
+        미러에서 바뀐 이슈를 색인에 표시해 두었다가 다음 검색 때 다시 색인한다.
+        """
+        for indexes in (self.search_indexes, self.duplicate_indexes):
+            index = indexes.get(project_id)
+            if index is not None:
+                index.mark_dirty(issue_ids)
+
+    @staticmethod
+    def _print_issue_list(issues):
+        """
+        검색된 이슈 목록을 한 페이지씩 표시한다.
+        """
+        if not Pager().show(issues, IssueManager._format_issue):
+            print("해당하는 이슈가 없습니다.")
+
+    @staticmethod
+    def _format_issue(number, issue):
+        """
+        목록에 표시할 이슈 하나의 문자열을 만든다.
+        """
+        header = "\n--- 이슈 목록 ---\n" if number == 1 else ""
+        return (
+            f"{header}{'-' * 20}\n"
+            f"{number}. {issue['title']} (ID: {issue['id']})\n"
+            f"  설명: {issue['description']}\n"
+            f"  등록자: {issue['reporterUsername']}\n"
+            f"  담당자: {issue['assigneeUsername'] if issue['assigneeUsername'] else '미지정'}\n"
+            f"  상태: {issue['status']}"
+        )
 
     def view_issue_details(self, project_id, issue_id):
         """
         선택한 이슈의 세부 정보를 표시한다.
         """
-        response = requests.get(
+        response = self.session.transport.get(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}',
-            headers=self.session.get_headers(),
+            cache=True,
+            revalidate=True,
         )
-
+        mirror = self.session.mirror
+        issue = None
         if response.status_code == 200:
             issue = response.json()
+            if mirror is not None and mirror.get_issue(project_id, issue_id) != issue:
+                mirror.save_issues(project_id, [issue])
+        elif response.status_code >= 500 and mirror is not None:
+            # 서버에 닿지 못할 때만 미러에 저장된 이슈를 대신 보여준다.
+            issue = mirror.get_issue(project_id, issue_id)
+
+        if issue is not None:
             print("-" * 20)
             print(f"ID: {issue['id']}")
             print(f"제목: {issue['title']}")
@@ -191,9 +457,10 @@ class IssueManager:
         기존 이슈의 세부 정보를 수정할 수 있도록 한다. (관리자 및 테스터 전용)
         """
         # Get current issue details
-        response = requests.get(
+        response = self.session.transport.get(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}',
-            headers=self.session.get_headers(),
+            cache=True,
+            revalidate=True,
         )
 
         if response.status_code != 200:
@@ -225,8 +492,9 @@ class IssueManager:
                 issue['status'] = input("새로운 상태: ").upper()
                 break
             elif choice == '5':
-                response = requests.get(
-                    f'{self.base_url}/users/devs', headers=self.session.get_headers()
+                response = self.session.transport.get(
+                    f'{self.base_url}/users/devs',
+                    cache=True,
                 )
                 if response.status_code == 200:
                     devs = response.json()
@@ -244,12 +512,13 @@ class IssueManager:
             else:
                 print("잘못된 입력입니다.")
 
-        response = requests.put(
+        response = self.session.transport.put(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}',
             json=issue,
-            headers=self.session.get_headers(),
         )
         if response.status_code == 200:
+            if self.session.mirror is not None:
+                self.session.mirror.save_issues(project_id, [issue])
             print("이슈가 성공적으로 수정되었습니다.")
         else:
             print("이슈 수정에 실패했습니다.")
\ No newline at end of file
@@ -0,0 +1,87 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]'
+
+def iter_json_array(chunks):
+    """
+    바이트 조각으로 들어오는 JSON 배열을 원소 하나씩 디코딩하며 내보낸다.
+    전체 본문을 메모리에 올리지 않으므로 큰 목록도 일정한 메모리로 처리할 수 있다.
+    chunks 는 bytes 를 내보내는 반복 가능 객체이다. (예: response.iter_content(65536))
+    """
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    started = False
+    exhausted = False
+    # 다음에 와야 할 토큰: 'first' (첫 원소 또는 ']'), 'value' (쉼표 뒤의 원소), 'separator' (',' 또는 ']')
+    expect = 'first'
+
+    def fill():
+        # 다음 조각을 읽어 버퍼에 붙인다. 더 읽을 것이 없으면 False 를 반환한다.
+        nonlocal buffer, pos, exhausted
+        for chunk in chunks:
+            if chunk:
+                # 이미 처리한 앞부분은 버려서 버퍼가 커지지 않게 한다.
+                buffer = buffer[pos:] + utf8.decode(chunk)
+                pos = 0
+                return True
+        buffer = buffer[pos:] + utf8.decode(b'', final=True)
+        pos = 0
+        exhausted = True
+        return False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(buffer):
+            if not fill():
+                raise ValueError('JSON 배열이 끝나지 않았습니다.')
+            continue
+
+        char = buffer[pos]
+        if not started:
+            if char != '[':
+                raise ValueError('JSON 배열이 아닙니다.')
+            started = True
+            pos += 1
+            continue
+        if char == ']':
+            if expect == 'value':
+                raise ValueError('JSON 배열의 마지막 쉼표 뒤에 원소가 없습니다.')
+            return
+        if char == ',':
+            if expect != 'separator':
+                raise ValueError('JSON 배열에서 쉼표 앞에 원소가 없습니다.')
+            expect = 'value'
+            pos += 1
+            continue
+        if expect == 'separator':
+            raise ValueError('JSON 배열의 원소 사이에 쉼표가 없습니다.')
+
+        try:
+            value, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # 원소가 아직 다 도착하지 않았으면 더 읽는다.
+            if not exhausted and fill():
+                continue
+            raise
+        if not exhausted and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+            # 숫자처럼 조각 경계에서 잘렸을 수 있는 값은 구분자가 보일 때까지 더 읽고 다시 해석한다.
+            fill()
+            continue
+        yield value
+        pos = end
+        expect = 'separator'
+
+def iter_response_array(response, chunk_size=65536):
+    """
+    stream=True 로 받은 응답 본문의 JSON 배열을 원소 하나씩 내보내고, 끝나면 연결을 돌려준다.
+    """
+    try:
+        yield from iter_json_array(response.iter_content(chunk_size))
+    finally:
+        response.close()
@@ -0,0 +1,204 @@
+import bisect
+import functools
+import json
+import re
+import threading
+import time
+import unicodedata
+
+# 지연 시간 히스토그램 구간 상한(초). 마지막 구간(+Inf)은 따로 센다.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+EXPORT_FORMATS = ('prometheus', 'json')
+
+_ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(path):
+    """
+    요청 경로의 숫자 ID 를 {id} 로 바꿔 엔드포인트 템플릿을 만든다. (예: /projects/3/issues/7 -> /projects/{id}/issues/{id})
+    """
+    return _ID_SEGMENT.sub('/{id}', path)
+
+def _path(url):
+    # scheme://host[:port]/path?query 에서 경로만 꺼낸다.
+    start = url.find('/', url.find('//') + 2)
+    if start < 0:
+        return '/'
+    end = url.find('?', start)
+    return url[start:end] if end >= 0 else url[start:]
+
+def _display_width(text):
+    # 한글처럼 화면에서 두 칸을 차지하는 글자를 고려한 표시 폭
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in text)
+
+def _pad(text, width, right=False):
+    padding = ' ' * max(0, width - _display_width(text))
+    return padding + text if right else text + padding
+
+class EndpointStats:
+    """
+    엔드포인트 하나의 요청 수, 응답 코드별 수, 전송량, 지연 시간 히스토그램
+    """
+    __slots__ = ('count', 'statuses', 'bytes_sent', 'bytes_received', 'latency_sum', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        # 구간별 (누적이 아닌) 요청 수. 마지막 칸은 +Inf 구간이다.
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def percentile(self, q):
+        """
+        히스토그램으로 추정한 q 분위수(0~1) 지연 시간의 구간 상한을 반환한다. +Inf 구간이면 inf 를 반환한다.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+    def to_dict(self):
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), self.buckets):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {
+            "count": self.count,
+            "statuses": dict(self.statuses),
+            "bytesSent": self.bytes_sent,
+            "bytesReceived": self.bytes_received,
+            "latencySum": self.latency_sum,
+            "latencyBuckets": buckets,
+        }
+
+class Metrics:
+    """
+    API 요청을 엔드포인트 템플릿(메서드 + ID 를 뺀 경로)별로 집계하는 클래스. 여러 스레드에서 기록할 수 있다.
+    """
+    def __init__(self):
+        self.started_at = time.time()
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, url, status, elapsed, bytes_sent=0, bytes_received=0):
+        """
+        요청 하나의 결과를 기록한다. status 는 응답 코드 또는 서버에 닿지 못한 이유('timeout' 등)이다.
+        """
+        key = (method, endpoint_template(_path(url)))
+        index = bisect.bisect_left(LATENCY_BUCKETS, elapsed)
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = EndpointStats()
+            stats.count += 1
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.latency_sum += elapsed
+            stats.buckets[index] += 1
+
+    def snapshot(self):
+        """
+        ((메서드, 엔드포인트), 통계 사전) 목록을 엔드포인트 순으로 반환한다.
+        """
+        with self._lock:
+            return [(key, stats.to_dict()) for key, stats in sorted(self._endpoints.items())]
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.started_at = time.time()
+
+    def to_json(self):
+        return json.dumps({
+            "startedAt": self.started_at,
+            "endpoints": [
+                {"method": method, "endpoint": endpoint, **stats}
+                for (method, endpoint), stats in self.snapshot()
+            ],
+        }, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """
+        Prometheus 텍스트 형식으로 반환한다.
+        """
+        lines = [
+            '# HELP issue_console_requests_total API requests by endpoint and status.',
+            '# TYPE issue_console_requests_total counter',
+        ]
+        snapshot = self.snapshot()
+        for (method, endpoint), stats in snapshot:
+            for status, count in sorted(stats["statuses"].items(), key=lambda item: str(item[0])):
+                lines.append(
+                    f'issue_console_requests_total{{method="{method}",endpoint="{endpoint}",status="{status}"}} {count}'
+                )
+        for name, field, help_text in (
+            ('issue_console_request_bytes_total', 'bytesSent', 'Request body bytes sent.'),
+            ('issue_console_response_bytes_total', 'bytesReceived', 'Response body bytes received.'),
+        ):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for (method, endpoint), stats in snapshot:
+                lines.append(f'{name}{{method="{method}",endpoint="{endpoint}"}} {stats[field]}')
+        lines.append('# HELP issue_console_request_duration_seconds API request latency.')
+        lines.append('# TYPE issue_console_request_duration_seconds histogram')
+        for (method, endpoint), stats in snapshot:
+            labels = f'method="{method}",endpoint="{endpoint}"'
+            for bound, count in stats["latencyBuckets"].items():
+                lines.append(f'issue_console_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'issue_console_request_duration_seconds_sum{{{labels}}} {stats["latencySum"]}')
+            lines.append(f'issue_console_request_duration_seconds_count{{{labels}}} {stats["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path, fmt='prometheus'):
+        """
+        지표를 Prometheus 텍스트 또는 JSON 파일로 저장한다.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {fmt}")
+        text = self.to_json() if fmt == 'json' else self.to_prometheus()
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+    def format_table(self):
+        """
+        엔드포인트별 지표를 표 문자열로 반환한다.
+        """
+        rows = []
+        with self._lock:
+            items = sorted(self._endpoints.items())
+            for (method, endpoint), stats in items:
+                errors = sum(
+                    count for status, count in stats.statuses.items()
+                    if not isinstance(status, int) or status >= 400
+                )
+                rows.append((
+                    f'{method} {endpoint}', str(stats.count), str(errors),
+                    f'{stats.latency_sum / stats.count * 1000:.0f}',
+                    self._format_bound(stats.percentile(0.5)),
+                    self._format_bound(stats.percentile(0.95)),
+                    f'{stats.bytes_sent / 1024:.1f}', f'{stats.bytes_received / 1024:.1f}',
+                ))
+        if not rows:
+            return "기록된 API 요청이 없습니다."
+        header = ('엔드포인트', '요청', '오류', '평균(ms)', 'p50(ms)', 'p95(ms)', '보냄(KB)', '받음(KB)')
+        width = max(_display_width(row[0]) for row in (header, *rows))
+        return '\n'.join(
+            _pad(row[0], width) + ' ' + ' '.join(_pad(value, 9, right=True) for value in row[1:])
+            for row in (header, *rows)
+        )
+
+    @staticmethod
+    def _format_bound(bound):
+        # 히스토그램 구간 상한이므로 "이하" 를 뜻하는 <= 를 붙인다.
+        if bound == float('inf'):
+            return f'>{LATENCY_BUCKETS[-1] * 1000:.0f}'
+        return f'<={bound * 1000:.0f}'
@@ -0,0 +1,431 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from issuemanagement.rollup import apply_rollup_deltas, rollup_deltas
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    hash TEXT,
+    data TEXT
+);
+CREATE TABLE IF NOT EXISTS issues (
+    project_id INTEGER,
+    id INTEGER,
+    title TEXT,
+    status TEXT,
+    priority TEXT,
+    reporter TEXT,
+    assignee TEXT,
+    fixer TEXT,
+    reported_date TEXT,
+    hash TEXT,
+    data TEXT,
+    PRIMARY KEY (project_id, id)
+);
+CREATE INDEX IF NOT EXISTS issues_status ON issues (project_id, status);
+CREATE INDEX IF NOT EXISTS issues_assignee ON issues (project_id, assignee);
+CREATE INDEX IF NOT EXISTS issues_reporter ON issues (project_id, reporter);
+CREATE TABLE IF NOT EXISTS comments (
+    project_id INTEGER,
+    issue_id INTEGER,
+    id INTEGER,
+    hash TEXT,
+    data TEXT,
+    PRIMARY KEY (project_id, issue_id, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_id INTEGER PRIMARY KEY,
+    synced_at TEXT,
+    failed_comments TEXT,
+    list_validators TEXT,
+    comments_synced INTEGER
+);
+CREATE TABLE IF NOT EXISTS rollups (
+    project_id INTEGER,
+    granularity TEXT,
+    dimension TEXT,
+    value TEXT,
+    bucket TEXT,
+    count INTEGER,
+    PRIMARY KEY (project_id, granularity, dimension, bucket, value)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_state (
+    project_id INTEGER PRIMARY KEY
+);
+"""
+
+def content_hash(record):
+    """
+    레코드의 내용 해시를 계산한다. (키 순서와 무관)
+    """
+    encoded = json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()
+
+class MirrorStore:
+    """
+    프로젝트, 이슈, 댓글을 로컬 SQLite 데이터베이스에 보관하는 클래스
+    """
+    def __init__(self, path):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 백그라운드 동기화 스레드와 메뉴 스레드가 같은 연결을 잠금으로 공유한다.
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        # 이슈나 댓글이 바뀌면 (project_id, issue_ids) 로 호출되는 함수 목록
+        self.listeners = []
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+            columns = {row[1] for row in self.conn.execute('PRAGMA table_info(sync_state)')}
+            # 이 열들이 생기기 전에 만든 미러 파일
+            for column, kind in (
+                ('failed_comments', 'TEXT'), ('list_validators', 'TEXT'), ('comments_synced', 'INTEGER'),
+            ):
+                if column not in columns:
+                    self.conn.execute(f'ALTER TABLE sync_state ADD COLUMN {column} {kind}')
+
+    def add_listener(self, listener):
+        """
+        이슈/댓글 변경 알림을 받을 함수를 등록한다.
+        """
+        self.listeners.append(listener)
+
+    def _notify(self, project_id, issue_ids):
+        if issue_ids:
+            for listener in self.listeners:
+                listener(project_id, issue_ids)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def save_projects(self, projects):
+        """
+        프로젝트 목록을 저장한다. 서버 목록에 없는 프로젝트는 그 이슈, 댓글, 동기화 상태, 카운터와 함께
+        같은 트랜잭션에서 미러에서 제거한다.
+        """
+        ids = [p['id'] for p in projects]
+        with self.lock, self.conn:
+            placeholders = ",".join("?" * len(ids))
+            for table in ('issues', 'comments', 'sync_state', 'rollups', 'rollup_state'):
+                self.conn.execute(f'DELETE FROM {table} WHERE project_id NOT IN ({placeholders})', ids)
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO projects (id, name, hash, data) VALUES (?, ?, ?, ?)',
+                [
+                    (p['id'], p['name'], content_hash(p), json.dumps(p, ensure_ascii=False))
+                    for p in projects
+                ],
+            )
+            self.conn.execute(f'DELETE FROM projects WHERE id NOT IN ({placeholders})', ids)
+
+    def get_projects(self):
+        with self.lock:
+            rows = self.conn.execute('SELECT data FROM projects ORDER BY rowid').fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def has_project(self, project_id):
+        """
+        프로젝트가 한 번 이상 동기화되었는지 확인한다.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT 1 FROM sync_state WHERE project_id = ?', (project_id,)
+            ).fetchone()
+        return row is not None
+
+    def set_sync_state(self, project_id, synced_at, failed_comments=(), list_validators=None, comments_synced=False):
+        """
+        동기화 상태를 저장한다. failed_comments 는 댓글을 받지 못해 다음 동기화에서 다시 받을 이슈 ID 목록이고,
+        list_validators 는 다음 동기화에서 이슈 목록을 조건부 GET 으로 받을 검증 헤더,
+        comments_synced 는 프로젝트 전체 댓글을 한 번 이상 받았는지 여부이다.
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO sync_state '
+                '(project_id, synced_at, failed_comments, list_validators, comments_synced) VALUES (?, ?, ?, ?, ?)',
+                (
+                    project_id, synced_at, json.dumps(sorted(failed_comments)),
+                    json.dumps(list_validators or {}), int(comments_synced),
+                ),
+            )
+
+    def comments_synced(self, project_id):
+        """
+        프로젝트 전체 댓글을 한 번 이상 동기화했는지 확인한다.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT comments_synced FROM sync_state WHERE project_id = ?', (project_id,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def get_list_validators(self, project_id):
+        """
+        지난 동기화에서 받은 이슈 목록의 검증 헤더를 반환한다. 없으면 빈 사전을 반환한다.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT list_validators FROM sync_state WHERE project_id = ?', (project_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else {}
+
+    def get_failed_comments(self, project_id):
+        """
+        지난 동기화에서 댓글을 받지 못한 이슈 ID 집합을 반환한다.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT failed_comments FROM sync_state WHERE project_id = ?', (project_id,)
+            ).fetchone()
+        return set(json.loads(row[0])) if row and row[0] else set()
+
+    def get_issue_hashes(self, project_id):
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT id, hash FROM issues WHERE project_id = ?', (project_id,)
+            ).fetchall()
+        return dict(rows)
+
+    def save_issues(self, project_id, issues):
+        """
+        이슈들을 저장(추가 또는 갱신)한다. 기간별 이슈 수 카운터가 있으면 바뀐 이슈만큼 고친다.
+        """
+        issues = list(issues)
+        with self.lock, self.conn:
+            old_rows = self._rollup_rows(project_id, [issue['id'] for issue in issues])
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (
+                        project_id,
+                        issue['id'],
+                        issue.get('title'),
+                        issue.get('status'),
+                        issue.get('priority'),
+                        issue.get('reporterUsername'),
+                        issue.get('assigneeUsername'),
+                        issue.get('fixerUsername'),
+                        issue.get('reportedDate'),
+                        content_hash(issue),
+                        json.dumps(issue, ensure_ascii=False),
+                    )
+                    for issue in issues
+                ],
+            )
+            if old_rows is not None:
+                new_rows = [
+                    (
+                        issue.get('reportedDate'), issue.get('status'), issue.get('priority'),
+                        issue.get('assigneeUsername'), issue.get('fixerUsername'),
+                    )
+                    for issue in issues
+                ]
+                apply_rollup_deltas(self.conn, project_id, rollup_deltas(old_rows, new_rows))
+        self._notify(project_id, [issue['id'] for issue in issues])
+
+    def _rollup_rows(self, project_id, issue_ids):
+        """
+        카운터를 고치기 전에 이슈들의 저장된 (reported_date, status, priority, assignee, fixer) 를 읽는다.
+        프로젝트의 카운터가 아직 없으면 None 을 반환한다. (잠금을 잡은 상태에서 호출)
+        """
+        if not self.conn.execute('SELECT 1 FROM rollup_state WHERE project_id = ?', (project_id,)).fetchone():
+            return None
+        rows = []
+        issue_ids = list(issue_ids)
+        for start in range(0, len(issue_ids), 500):
+            chunk = issue_ids[start:start + 500]
+            rows += self.conn.execute(
+                f'SELECT reported_date, status, priority, assignee, fixer FROM issues '
+                f'WHERE project_id = ? AND id IN ({",".join("?" * len(chunk))})',
+                (project_id, *chunk),
+            ).fetchall()
+        return rows
+
+    def delete_issues(self, project_id, issue_ids):
+        issue_ids = list(issue_ids)
+        with self.lock, self.conn:
+            old_rows = self._rollup_rows(project_id, issue_ids)
+            if old_rows:
+                apply_rollup_deltas(self.conn, project_id, rollup_deltas(old_rows, ()))
+            self.conn.executemany(
+                'DELETE FROM issues WHERE project_id = ? AND id = ?',
+                [(project_id, issue_id) for issue_id in issue_ids],
+            )
+            self.conn.executemany(
+                'DELETE FROM comments WHERE project_id = ? AND issue_id = ?',
+                [(project_id, issue_id) for issue_id in issue_ids],
+            )
+        self._notify(project_id, list(issue_ids))
+
+    def get_issues(self, project_id, assignee=None, reporter=None, status=None):
+        """
+        미러에서 이슈 목록을 조회한다. 담당자, 등록자, 상태로 거를 수 있다.
+        """
+        query = 'SELECT data FROM issues WHERE project_id = ?'
+        args = [project_id]
+        for column, value in (('assignee', assignee), ('reporter', reporter), ('status', status)):
+            if value is not None:
+                query += f' AND {column} = ?'
+                args.append(value)
+        with self.lock:
+            rows = self.conn.execute(query + ' ORDER BY id', args).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def iter_issues(self, project_id, batch_size=500):
+        """
+        미러의 이슈를 ID 순서로 하나씩 내보낸다. 배치 사이에는 잠금을 풀어 동기화를 막지 않는다.
+        """
+        last_id = -1
+        while True:
+            with self.lock:
+                rows = self.conn.execute(
+                    'SELECT id, data FROM issues WHERE project_id = ? AND id > ? ORDER BY id LIMIT ?',
+                    (project_id, last_id, batch_size),
+                ).fetchall()
+            for last_id, data in rows:
+                yield json.loads(data)
+            if len(rows) < batch_size:
+                return
+
+    def get_issue_rows(self, project_id):
+        """
+        통계 계산용으로 이슈의 주요 열만 튜플로 반환한다.
+        (id, title, reported_date, status, priority, assignee, fixer)
+        """
+        with self.lock:
+            return self.conn.execute(
+                'SELECT id, title, reported_date, status, priority, assignee, fixer '
+                'FROM issues WHERE project_id = ? ORDER BY id',
+                (project_id,),
+            ).fetchall()
+
+    def get_issue(self, project_id, issue_id):
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT data FROM issues WHERE project_id = ? AND id = ?',
+                (project_id, issue_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_comments(self, project_id, issue_id, comments):
+        """
+        이슈의 댓글 목록을 통째로 교체한다. 내용 해시가 같으면 아무것도 쓰지 않는다.
+        """
+        with self.lock, self.conn:
+            stored = dict(self.conn.execute(
+                'SELECT id, hash FROM comments WHERE project_id = ? AND issue_id = ?',
+                (project_id, issue_id),
+            ).fetchall())
+            fresh = {c['id']: content_hash(c) for c in comments}
+            if stored == fresh:
+                return
+            self.conn.execute(
+                'DELETE FROM comments WHERE project_id = ? AND issue_id = ?',
+                (project_id, issue_id),
+            )
+            self.conn.executemany(
+                'INSERT INTO comments VALUES (?, ?, ?, ?, ?)',
+                [
+                    (project_id, issue_id, c['id'], fresh[c['id']], json.dumps(c, ensure_ascii=False))
+                    for c in comments
+                ],
+            )
+        self._notify(project_id, [issue_id])
+
+    def upsert_comments(self, project_id, issue_id, comments):
+        """
+        댓글 일부를 추가하거나 갱신한다. 내용 해시가 같은 댓글은 쓰지 않는다.
+        (스트리밍으로 받은 댓글을 배치 단위로 저장할 때 사용하고, 끝나면 prune_comments 를 호출한다.)
+        """
+        fresh = {c['id']: content_hash(c) for c in comments}
+        with self.lock, self.conn:
+            stored = dict(self.conn.execute(
+                f'SELECT id, hash FROM comments WHERE project_id = ? AND issue_id = ? '
+                f'AND id IN ({",".join("?" * len(fresh))})',
+                (project_id, issue_id, *fresh),
+            ).fetchall())
+            changed = [c for c in comments if stored.get(c['id']) != fresh[c['id']]]
+            # 기존 행을 그대로 두고 갱신해 저장 순서(rowid)를 유지한다.
+            self.conn.executemany(
+                'INSERT INTO comments VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (project_id, issue_id, id) DO UPDATE SET hash = excluded.hash, data = excluded.data',
+                [
+                    (project_id, issue_id, c['id'], fresh[c['id']], json.dumps(c, ensure_ascii=False))
+                    for c in changed
+                ],
+            )
+        if changed:
+            self._notify(project_id, [issue_id])
+
+    def prune_comments(self, project_id, issue_id, keep_ids):
+        """
+        이슈의 댓글 중 keep_ids 에 없는 댓글을 삭제한다.
+        """
+        with self.lock, self.conn:
+            stored = [
+                comment_id for (comment_id,) in self.conn.execute(
+                    'SELECT id FROM comments WHERE project_id = ? AND issue_id = ?',
+                    (project_id, issue_id),
+                )
+            ]
+            removed = [comment_id for comment_id in stored if comment_id not in keep_ids]
+            self.conn.executemany(
+                'DELETE FROM comments WHERE project_id = ? AND issue_id = ? AND id = ?',
+                [(project_id, issue_id, comment_id) for comment_id in removed],
+            )
+        if removed:
+            self._notify(project_id, [issue_id])
+
+    def iter_comments(self, project_id, issue_id, batch_size=500):
+        """
+        이슈의 댓글을 저장된 순서대로 하나씩 내보낸다.
+        """
+        last_rowid = 0
+        while True:
+            with self.lock:
+                rows = self.conn.execute(
+                    'SELECT rowid, data FROM comments WHERE project_id = ? AND issue_id = ? AND rowid > ? '
+                    'ORDER BY rowid LIMIT ?',
+                    (project_id, issue_id, last_rowid, batch_size),
+                ).fetchall()
+            for last_rowid, data in rows:
+                yield json.loads(data)
+            if len(rows) < batch_size:
+                return
+
+    def get_project_comments(self, project_id):
+        """
+        프로젝트의 모든 댓글을 이슈 ID 별로 묶어 반환한다.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT issue_id, data FROM comments WHERE project_id = ? ORDER BY rowid',
+                (project_id,),
+            ).fetchall()
+        comments = {}
+        for issue_id, data in rows:
+            comments.setdefault(issue_id, []).append(json.loads(data))
+        return comments
+
+    def get_comment_counts(self, project_id):
+        """
+        이슈 ID -> 댓글 수 사전을 반환한다.
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT issue_id, COUNT(*) FROM comments WHERE project_id = ? GROUP BY issue_id',
+                (project_id,),
+            ).fetchall()
+        return dict(rows)
+
+    def get_comments(self, project_id, issue_id):
+        with self.lock:
+            rows = self.conn.execute(
+                'SELECT data FROM comments WHERE project_id = ? AND issue_id = ? ORDER BY rowid',
+                (project_id, issue_id),
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
@@ -0,0 +1,188 @@
+import datetime
+import enum
+import sys
+
+class Status(str, enum.Enum):
+    """
+    이슈 상태
+    """
+    NEW = 'NEW'
+    ASSIGNED = 'ASSIGNED'
+    FIXED = 'FIXED'
+    RESOLVED = 'RESOLVED'
+    CLOSED = 'CLOSED'
+    REOPENED = 'REOPENED'
+
+    @classmethod
+    def parse(cls, value):
+        """
+        문자열을 상태로 바꾼다. 알 수 없는 값은 잃지 않도록 문자열 그대로 반환한다.
+        """
+        try:
+            return cls(value)
+        except ValueError:
+            return value
+
+class Priority(str, enum.Enum):
+    """
+    이슈 우선순위
+    """
+    BLOCKER = 'BLOCKER'
+    CRITICAL = 'CRITICAL'
+    MAJOR = 'MAJOR'
+    MINOR = 'MINOR'
+    TRIVIAL = 'TRIVIAL'
+
+    @classmethod
+    def parse(cls, value):
+        """
+        문자열을 우선순위로 바꾼다. 알 수 없는 값은 잃지 않도록 문자열 그대로 반환한다.
+        """
+        try:
+            return cls(value)
+        except ValueError:
+            return value
+
+STATUSES = [status.value for status in Status]
+PRIORITIES = [priority.value for priority in Priority]
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'MISSING'
+
+# JSON 에 없던 필드를 나타내는 값 (null 과 구분해 원래 JSON 으로 되돌릴 때 빼기 위해 사용)
+MISSING = _Missing()
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _parse_datetime(value):
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+class Record:
+    """
+    API JSON 을 담는 슬롯 기반 레코드의 기반 클래스.
+    FIELDS 에 (JSON 키, 속성 이름, 변환 함수) 를 정의하고, 정의하지 않은 키는 extra 에 그대로 보관한다.
+    """
+    __slots__ = ('extra',)
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._keys = frozenset(key for key, _, _ in cls.FIELDS)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        API JSON 사전으로 레코드를 만든다.
+        """
+        record = cls.__new__(cls)
+        for key, attr, convert in cls.FIELDS:
+            value = data.get(key, MISSING)
+            if convert is not None and value is not MISSING and value is not None:
+                value = convert(value)
+            setattr(record, attr, value)
+        extra = {key: value for key, value in data.items() if key not in cls._keys}
+        record.extra = extra or None
+        return record
+
+    def to_dict(self):
+        """
+        레코드를 API JSON 사전으로 되돌린다. from_dict 에 넣은 사전과 같은 내용이 된다.
+        """
+        data = {}
+        for key, attr, _ in self.FIELDS:
+            value = getattr(self, attr)
+            if value is not MISSING:
+                data[key] = value.value if isinstance(value, enum.Enum) else value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self):
+        fields = ', '.join(
+            f'{attr}={getattr(self, attr)!r}' for _, attr, _ in self.FIELDS
+            if getattr(self, attr) is not MISSING
+        )
+        return f'{type(self).__name__}({fields})'
+
+class Issue(Record):
+    """
+    이슈. 상태와 우선순위는 열거형, 사용자 이름은 intern 된 문자열이며 등록일은 처음 쓸 때 해석한다.
+    """
+    __slots__ = (
+        'id', 'title', 'description', 'reporter', 'assignee', 'fixer',
+        'priority', 'status', 'reported_date', '_reported_at',
+    )
+    FIELDS = (
+        ('id', 'id', None),
+        ('title', 'title', None),
+        ('description', 'description', None),
+        ('reporterUsername', 'reporter', _intern),
+        ('assigneeUsername', 'assignee', _intern),
+        ('fixerUsername', 'fixer', _intern),
+        ('priority', 'priority', Priority.parse),
+        ('status', 'status', Status.parse),
+        ('reportedDate', 'reported_date', None),
+    )
+
+    @property
+    def reported_at(self):
+        """
+        등록일을 datetime 으로 반환한다. 해석할 수 없으면 None 을 반환한다.
+        """
+        try:
+            return self._reported_at
+        except AttributeError:
+            self._reported_at = _parse_datetime(self.reported_date)
+            return self._reported_at
+
+class Comment(Record):
+    """
+    이슈 댓글
+    """
+    __slots__ = ('id', 'username', 'created_date', 'content', '_created_at')
+    FIELDS = (
+        ('id', 'id', None),
+        ('username', 'username', _intern),
+        ('createdAt', 'created_date', None),
+        ('content', 'content', None),
+    )
+
+    @property
+    def created_at(self):
+        """
+        작성 시각을 datetime 으로 반환한다. 해석할 수 없으면 None 을 반환한다.
+        """
+        try:
+            return self._created_at
+        except AttributeError:
+            self._created_at = _parse_datetime(self.created_date)
+            return self._created_at
+
+class Project(Record):
+    """
+    프로젝트
+    """
+    __slots__ = ('id', 'name')
+    FIELDS = (
+        ('id', 'id', None),
+        ('name', 'name', None),
+    )
+
+class User(Record):
+    """
+    사용자
+    """
+    __slots__ = ('username', 'role')
+    FIELDS = (
+        ('username', 'username', _intern),
+        ('role', 'role', None),
+    )
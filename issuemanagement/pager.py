@@ -0,0 +1,84 @@
+import sys
+from array import array
+
+# 한 페이지에 표시할 레코드 수
+PAGE_SIZE = 20
+
+_END = object()
+
+class Pager:
+    """
+    레코드를 받는 대로 한 페이지씩 모아 한 번에 출력하는 클래스.
+    레코드는 반복자에서 하나씩 꺼내므로 목록 전체를 메모리에 올리지 않는다.
+    """
+    def __init__(self, page_size=PAGE_SIZE, out=None):
+        self.page_size = page_size
+        # None 이면 출력할 때의 sys.stdout 을 사용한다.
+        self.out = out
+
+    def show(self, records, render):
+        """
+        레코드를 페이지 단위로 출력하고 출력한 레코드 수를 반환한다.
+        render(번호, 레코드) 는 레코드 하나를 표시할 문자열을 반환한다.
+        """
+        count, _, _ = self._page(records, render, None)
+        return count
+
+    def select(self, records, render, name, key='id', empty=None):
+        """
+        레코드를 페이지 단위로 출력하고 사용자가 고른 레코드의 key 값을 반환한다.
+        페이지 사이에서 바로 번호를 입력할 수 있다. 레코드가 없거나 잘못 고르면 None 을 반환한다.
+        empty 를 주면 레코드가 없을 때 그 문구를 출력한다.
+        """
+        count, keys, answer = self._page(records, render, key)
+        if count == 0:
+            if empty:
+                print(empty)
+            return None
+        if answer is None or not answer.isdigit():
+            answer = input(f"{name} 번호를 선택하세요: ").strip()
+        try:
+            index = int(answer) - 1
+        except ValueError:
+            print("잘못된 입력입니다. 숫자를 입력하세요.")
+            return None
+        if 0 <= index < count:
+            return keys[index]
+        print(f"잘못된 {name} 번호입니다.")
+        return None
+
+    def _page(self, records, render, key):
+        """
+        레코드를 페이지 단위로 출력한다. (출력한 수, 출력한 레코드의 key 값 배열, 페이지 사이에서 받은 입력) 을 반환한다.
+        """
+        prompt = "Enter: 다음 페이지, q: 그만 보기"
+        if key is not None:
+            prompt += ", 번호: 선택"
+        records = iter(records)
+        # 번호로 고를 수 있도록 레코드 대신 key 값만 모아 둔다.
+        keys = array('q')
+        lines = []
+        count = 0
+        record = next(records, _END)
+        while record is not _END:
+            count += 1
+            if key is not None:
+                keys.append(record[key])
+            lines.append(render(count, record))
+            record = next(records, _END)
+            if record is not _END and count % self.page_size == 0:
+                self._write(lines)
+                answer = input(f"-- {count}개 표시됨 ({prompt}): ").strip().lower()
+                if answer == 'q' or answer.isdigit():
+                    # 남은 응답은 읽지 않고 닫는다.
+                    getattr(records, 'close', lambda: None)()
+                    return count, keys, answer
+        self._write(lines)
+        return count, keys, None
+
+    def _write(self, lines):
+        if lines:
+            out = self.out or sys.stdout
+            out.write('\n'.join(lines) + '\n')
+            out.flush()
+            lines.clear()
@@ -1,5 +1,3 @@
-import requests
-
 class ProjectManager:
     """
     프로젝트를 관리하는 클래스
@@ -13,21 +11,33 @@ class ProjectManager:
         새로운 프로젝트를 생성한다.
         """
         data = {"name": project_name}
-        response = requests.post(
-            f'{self.base_url}/projects', json=data, headers=self.session.get_headers()
+        response = self.session.transport.post(
+            f'{self.base_url}/projects', json=data
         )
         return response.status_code == 201
 
-    def load_projects(self):
+    def load_projects(self, show=True):
         """
-        모든 프로젝트를 불러온다.
+        모든 프로젝트를 불러온다. show=False 이면 목록과 오류 문구를 출력하지 않는다.
         """
-        response = requests.get(
-            f'{self.base_url}/projects', headers=self.session.get_headers()
+        response = self.session.transport.get(
+            f'{self.base_url}/projects', cache=True
         )
 
+        mirror = self.session.mirror
         if response.status_code == 200:
             projects = response.json()
+            if mirror is not None:
+                mirror.save_projects(projects)
+        elif response.status_code >= 500 and mirror is not None:
+            # 서버에 장애가 있으면 로컬 미러에 저장된 목록을 보여준다.
+            projects = mirror.get_projects() or None
+        else:
+            projects = None
+
+        if not show:
+            return projects
+        if projects is not None:
             print("\n--- 프로젝트 목록 ---")
             for i, project in enumerate(projects):
                 print(f"{i+1}. {project['name']}")
@@ -40,7 +50,7 @@ class ProjectManager:
         """
         ID를 기반으로 프로젝트를 삭제한다.
         """
-        response = requests.delete(
-            f'{self.base_url}/projects/{project_id}', headers=self.session.get_headers()
+        response = self.session.transport.delete(
+            f'{self.base_url}/projects/{project_id}'
         )
         return response.status_code == 204
\ No newline at end of file
@@ -1,5 +1,3 @@
-import requests
-
 class RecommendationManager:
     """
     이슈 담당자 추천을 관리하는 클래스
@@ -12,9 +10,8 @@ class RecommendationManager:
         """
         이슈에 대한 잠재적인 담당자를 추천한다.
         """
-        response = requests.get(
+        response = self.session.transport.get(
             f'{self.base_url}/projects/{project_id}/issues/{issue_id}/recommendedAssignees',
-            headers=self.session.get_headers(),
         )
         if response.status_code == 200:
             recommended_assignees = response.json()
@@ -22,4 +19,75 @@ class RecommendationManager:
             for i, assignee in enumerate(recommended_assignees):
                 print(f"  {i+1}. {assignee['username']}")
         else:
-            print("담당자 추천에 실패했습니다.")
\ No newline at end of file
+            print("담당자 추천에 실패했습니다.")
+
+    def build_local_recommender(self, project_id):
+        """
+        프로젝트의 이슈를 불러와 (로컬 추천기, 이슈 목록) 을 반환한다. 이슈를 불러오지 못하면 None 을 반환한다.
+        """
+        # NumPy 를 쓰는 추천 모듈은 처음 추천할 때 불러온다.
+        from issuemanagement.recommender import LocalRecommender
+
+        issues = self.session.issue_manager.iter_issues(project_id)
+        if issues is None:
+            return None
+        issues = list(issues)
+        return LocalRecommender.from_issues(issues), issues
+
+    def recommend_unassigned(self, project_id, k=3):
+        """
+        담당자가 없는 NEW 이슈 전체의 추천 담당자를 로컬 추천기로 한 번에 계산한다. 실패하면 None 을 반환한다.
+        결과는 이슈마다 {"id", "title", "recommended": [{"username", "score"}, ...]} 이다.
+        """
+        built = self.build_local_recommender(project_id)
+        if built is None:
+            return None
+        recommender, issues = built
+        targets = [
+            issue for issue in issues if issue['status'] == 'NEW' and not issue.get('assigneeUsername')
+        ]
+        return [
+            {
+                "id": issue['id'],
+                "title": issue['title'],
+                "recommended": [{"username": name, "score": round(score, 4)} for name, score in recommended],
+            }
+            for issue, recommended in zip(targets, recommender.recommend_many(targets, k))
+        ]
+
+    def recommend_unassigned_screen(self, project_id):
+        """
+        담당자가 없는 NEW 이슈의 추천 담당자를 보여주고, 원하면 1순위 추천 담당자로 한 번에 배정한다.
+        """
+        results = self.recommend_unassigned(project_id)
+        if results is None:
+            print("이슈 목록을 불러오는 데 실패했습니다.")
+            return
+        results = [result for result in results if result["recommended"]]
+        if not results:
+            print("추천할 이슈가 없습니다. (담당자가 없는 NEW 이슈나 해결된 이슈 이력이 없음)")
+            return
+        print("\n--- 담당자 추천 (로컬) ---")
+        for result in results:
+            names = ', '.join(
+                f"{item['username']}({item['score']:.2f})" for item in result["recommended"]
+            )
+            print(f"{result['id']}. {result['title']}\n  추천: {names}")
+        if input(f"{len(results)}개 이슈를 1순위 추천 담당자로 배정할까요? (y/n): ").strip().lower() != 'y':
+            return
+        by_assignee = {}
+        for result in results:
+            by_assignee.setdefault(result["recommended"][0]["username"], []).append(result["id"])
+        updated = failed = 0
+        for assignee, issue_ids in by_assignee.items():
+            try:
+                report = self.session.bulk_edit_manager.bulk_edit(
+                    project_id, issue_ids, {"assigneeUsername": assignee}
+                )
+            except ValueError as error:
+                print(error)
+                failed += len(issue_ids)
+                continue
+            updated += len(report["updated"])
+            failed += len(report["failed"])
+        print(f"배정 완료: {updated}개, 실패: {failed}개")
@@ -0,0 +1,170 @@
+import zlib
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+from issuemanagement.search_index import FIELD_WEIGHTS, tokenize
+
+# 해시 특징 벡터의 차원 수 (2의 거듭제곱)
+N_FEATURES = 1 << 14
+# 학습에 쓰는 이슈 상태 (해결이 끝난 이슈)
+HISTORY_STATUSES = ('RESOLVED', 'CLOSED')
+# 담당자가 지금 맡고 있는 이슈 상태
+OPEN_STATUSES = ('ASSIGNED', 'REOPENED')
+# 맡은 이슈 수가 평균만큼 많을 때 점수를 1 / (1 + WORKLOAD_PENALTY) 배로 낮춘다.
+WORKLOAD_PENALTY = 0.5
+# 한 번에 행렬 곱으로 계산할 이슈 수
+BATCH_ROWS = 1024
+
+@lru_cache(maxsize=65536)
+def feature_index(token):
+    """
+    토큰을 특징 벡터의 위치로 바꾼다. 실행할 때마다 같은 값이 나오도록 crc32 를 사용한다.
+    """
+    return zlib.crc32(token.encode('utf-8')) & (N_FEATURES - 1)
+
+def issue_features(issue):
+    """
+    이슈 제목과 설명의 토큰을 {특징 위치: 가중 빈도} 로 센다. (제목에 나온 단어를 더 중요하게 본다)
+    """
+    counts = Counter()
+    for field in ('title', 'description'):
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(issue.get(field)):
+            counts[feature_index(token)] += weight
+    return counts
+
+def issue_label(issue):
+    """
+    해결된 이슈를 맡았던 개발자를 반환한다. 해결자가 없으면 담당자를 사용한다.
+    """
+    return issue.get('fixerUsername') or issue.get('assigneeUsername')
+
+class LocalRecommender:
+    """
+    프로젝트의 해결된 이슈 이력으로 담당자를 추천하는 클래스.
+    이슈 텍스트를 해시 TF-IDF 벡터로 바꾸고, 개발자마다 해결한 이슈 벡터의 평균(프로필)과의 코사인 유사도를 구한다.
+    유사도에는 개발자가 지금 맡고 있는 이슈 수에 따른 가중치를 곱한다.
+    """
+    def __init__(self, workload_penalty=WORKLOAD_PENALTY):
+        self.workload_penalty = workload_penalty
+        # 추천 후보 개발자 이름 (프로필 행 순서)
+        self.developers = []
+        # (개발자 수, N_FEATURES) 정규화된 프로필 행렬
+        self.profiles = np.zeros((0, N_FEATURES), dtype=np.float32)
+        self.idf = np.ones(N_FEATURES, dtype=np.float32)
+        # 개발자별로 지금 맡고 있는 이슈 수
+        self.workload = np.zeros(0)
+        # 학습에 사용한 이슈 수
+        self.trained = 0
+
+    @classmethod
+    def from_issues(cls, issues, workload_penalty=WORKLOAD_PENALTY):
+        """
+        프로젝트의 이슈로 학습한 추천기를 만든다.
+        """
+        recommender = cls(workload_penalty)
+        recommender.fit(issues)
+        return recommender
+
+    def fit(self, issues):
+        """
+        해결된 이슈로 개발자 프로필을 만들고, 진행 중인 이슈로 개발자별 작업량을 센다.
+        """
+        rows, columns, counts, labels = [], [], [], []
+        workload = Counter()
+        for issue in issues:
+            status = issue['status']
+            if status in OPEN_STATUSES and issue.get('assigneeUsername'):
+                workload[issue['assigneeUsername']] += 1
+            if status not in HISTORY_STATUSES or not issue_label(issue):
+                continue
+            features = issue_features(issue)
+            rows.extend([len(labels)] * len(features))
+            columns.extend(features.keys())
+            counts.extend(features.values())
+            labels.append(issue_label(issue))
+
+        documents = len(labels)
+        self.developers = sorted(set(labels))
+        self.trained = documents
+        if not documents:
+            self.profiles = np.zeros((0, N_FEATURES), dtype=np.float32)
+            self.workload = np.zeros(0)
+            return self
+
+        rows = np.array(rows, dtype=np.int64)
+        columns = np.array(columns, dtype=np.int64)
+        document_frequency = np.bincount(columns, minlength=N_FEATURES)
+        self.idf = (np.log((1 + documents) / (1 + document_frequency)) + 1).astype(np.float32)
+        weights = self._normalize(rows, columns, np.array(counts, dtype=np.float64), documents)
+
+        # 같은 개발자가 해결한 이슈 벡터를 더해 프로필을 만든다.
+        developer_of = {name: i for i, name in enumerate(self.developers)}
+        owners = np.array([developer_of[label] for label in labels], dtype=np.int64)
+        profiles = np.bincount(
+            owners[rows] * N_FEATURES + columns, weights, minlength=len(self.developers) * N_FEATURES
+        ).reshape(len(self.developers), N_FEATURES)
+        norms = np.linalg.norm(profiles, axis=1, keepdims=True)
+        self.profiles = (profiles / np.where(norms == 0, 1, norms)).astype(np.float32)
+        self.workload = np.array([workload[name] for name in self.developers], dtype=np.float64)
+        return self
+
+    def _normalize(self, rows, columns, counts, documents):
+        """
+        가중 빈도를 (1 + log tf) × idf 로 바꾸고 문서마다 길이가 1 이 되도록 나눈다.
+        """
+        weights = (1 + np.log(counts)) * self.idf[columns]
+        norms = np.sqrt(np.bincount(rows, weights * weights, minlength=documents))
+        return weights / np.where(norms == 0, 1, norms)[rows]
+
+    def _vectors(self, issues):
+        """
+        이슈 목록을 (이슈 수, N_FEATURES) TF-IDF 행렬로 바꾼다.
+        """
+        matrix = np.zeros((len(issues), N_FEATURES), dtype=np.float32)
+        rows, columns, counts = [], [], []
+        for row, issue in enumerate(issues):
+            features = issue_features(issue)
+            rows.extend([row] * len(features))
+            columns.extend(features.keys())
+            counts.extend(features.values())
+        if rows:
+            rows = np.array(rows, dtype=np.int64)
+            columns = np.array(columns, dtype=np.int64)
+            matrix[rows, columns] = self._normalize(rows, columns, np.array(counts, dtype=np.float64), len(issues))
+        return matrix
+
+    def workload_factor(self):
+        """
+        개발자별 작업량 가중치를 반환한다. 맡은 이슈가 많을수록 작다.
+        """
+        average = self.workload.mean() if len(self.workload) else 0
+        return 1 / (1 + self.workload_penalty * self.workload / max(average, 1))
+
+    def recommend_many(self, issues, k=3):
+        """
+        여러 이슈의 추천 담당자를 한 번에 계산해 이슈마다 [(개발자, 점수), ...] 목록을 반환한다. (점수가 높은 순서)
+        이력이 없으면 빈 목록을 반환한다.
+        """
+        issues = list(issues)
+        if not self.developers:
+            return [[] for _ in issues]
+        factor = self.workload_factor()
+        k = min(k, len(self.developers))
+        results = []
+        for start in range(0, len(issues), BATCH_ROWS):
+            similarity = self._vectors(issues[start:start + BATCH_ROWS]) @ self.profiles.T
+            # 비슷한 이력이 전혀 없으면 맡은 이슈가 적은 개발자를 먼저 추천한다.
+            scores = similarity * factor + 1e-6 * factor
+            top = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+            for row, columns in enumerate(top):
+                results.append([(self.developers[c], float(scores[row, c])) for c in columns])
+        return results
+
+    def recommend(self, issue, k=3):
+        """
+        이슈 하나의 추천 담당자 [(개발자, 점수), ...] 를 반환한다.
+        """
+        return self.recommend_many([issue], k)[0]
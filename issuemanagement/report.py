@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+
+from issuemanagement.statistics import StatisticsManager
+from issuemanagement.transport import Transport
+
+EXPORT_FORMATS = ('png', 'svg', 'pdf')
+
+class _WorkerSession:
+    """
+    작업 프로세스 안에서 사용하는 최소한의 세션. 인증 헤더와 자체 연결 풀만 가진다.
+    """
+    def __init__(self, headers):
+        self.headers = headers
+        self.transport = Transport()
+        self.transport.set_headers(headers)
+        self.mirror = None
+
+    def get_headers(self):
+        return dict(self.headers)
+
+def _export_project(base_url, headers, project_id, output_dir, formats, full_resolution=False):
+    """
+    작업 프로세스에서 프로젝트 하나의 통계 그래프를 파일로 저장한다.
+    """
+    # 화면이 없는 서버에서도 동작하도록 비대화형 백엔드를 사용한다.
+    matplotlib.use('Agg', force=True)
+    session = _WorkerSession(headers)
+    try:
+        manager = StatisticsManager(base_url, session)
+        return manager.export_charts(project_id, output_dir, formats, full_resolution=full_resolution)
+    finally:
+        session.transport.close()
+
+class ReportManager:
+    """
+    여러 프로젝트의 통계 그래프를 파일로 저장하는 보고서 생성 클래스
+    """
+    def __init__(self, base_url, session):
+        self.base_url = base_url
+        self.session = session
+
+    def export_projects(self, output_dir, project_ids=None, formats=('png',), max_workers=None, full_resolution=False):
+        """
+        프로젝트들의 통계 그래프를 프로세스 풀에서 나누어 그리고 파일로 저장한다.
+        project_ids 가 None 이면 모든 프로젝트를 대상으로 한다. full_resolution 이면 긴 시계열도 줄이지 않는다.
+        프로젝트 ID -> 저장한 파일 목록을 반환한다.
+        """
+        unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+        if unknown:
+            raise ValueError(f'지원하지 않는 형식입니다: {", ".join(unknown)}')
+
+        if project_ids is None:
+            response = self.session.transport.get(f'{self.base_url}/projects')
+            if response.status_code != 200:
+                print("프로젝트 목록을 불러오는 데 실패했습니다.")
+                return None
+            project_ids = [project['id'] for project in response.json()]
+
+        results = {}
+        headers = self.session.get_headers()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _export_project, self.base_url, headers, project_id, output_dir, tuple(formats), full_resolution
+                ): project_id
+                for project_id in project_ids
+            }
+            for future in as_completed(futures):
+                project_id = futures[future]
+                try:
+                    results[project_id] = future.result()
+                    print(f"프로젝트 {project_id}: 그래프 {len(results[project_id])}개 저장")
+                except Exception as error:
+                    results[project_id] = []
+                    print(f"프로젝트 {project_id}: 그래프 저장에 실패했습니다. ({error})")
+        return results
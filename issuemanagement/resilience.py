@@ -0,0 +1,118 @@
+import random
+import re
+import threading
+import time
+
+import requests
+
+# 엔드포인트 종류별 (연결, 읽기) 제한 시간(초)
+TIMEOUTS = {
+    'default': (3.05, 10),
+    'auth': (3.05, 10),
+    # 서버가 전체 이슈를 집계한다.
+    'statistics': (3.05, 30),
+    # 자연어 검색과 담당자 추천은 서버에서 언어 모델을 호출한다.
+    'assistant': (3.05, 60),
+}
+
+# URL 경로 -> 엔드포인트 종류 (위에서부터 처음 맞는 것을 사용)
+ENDPOINT_CLASSES = (
+    (re.compile(r'/users/(login|logout|signup)$'), 'auth'),
+    (re.compile(r'/statistics/'), 'statistics'),
+    (re.compile(r'/(searchbynl|recommendedAssignees)$'), 'assistant'),
+)
+
+# 응답 대신 돌려주는 503 응답에 실패 원인을 적는 헤더
+UNAVAILABLE_HEADER = 'X-Issue-Console-Unavailable'
+
+def endpoint_class(url):
+    """
+    URL 이 속하는 엔드포인트 종류를 반환한다.
+    """
+    path = url.split('?', 1)[0]
+    for pattern, name in ENDPOINT_CLASSES:
+        if pattern.search(path):
+            return name
+    return 'default'
+
+def unavailable_response(method, url, reason):
+    """
+    서버에 닿지 못했을 때 돌려줄 503 응답을 만든다. 관리자는 다른 서버 오류와 같은 방식으로 처리한다.
+    reason 은 'timeout', 'connection', 'circuit-open' 중 하나이다.
+    """
+    response = requests.Response()
+    response.status_code = 503
+    response.reason = 'Service Unavailable'
+    response.url = url
+    response.headers[UNAVAILABLE_HEADER] = reason
+    response.request = requests.Request(method, url).prepare()
+    response._content = b''
+    response._content_consumed = True
+    return response
+
+class RetryPolicy:
+    """
+    멱등 요청(GET)의 재시도 정책. 지수 백오프에 전체 지터를 적용한다.
+    """
+    def __init__(self, max_retries=3, backoff=0.25, max_backoff=5.0, statuses=(502, 503, 504)):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # 다시 시도할 응답 코드
+        self.statuses = frozenset(statuses)
+
+    def delay(self, attempt, response=None):
+        """
+        attempt 번째(0부터) 실패 뒤 기다릴 시간(초). Retry-After 헤더가 있으면 따른다.
+        """
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+class CircuitBreaker:
+    """
+    연속으로 실패하면 한동안 요청을 보내지 않고 바로 실패시키는 회로 차단기.
+    닫힘(정상) -> 열림(차단) -> 반열림(시험 요청 하나만 허용) 순서로 상태가 바뀐다.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        # 연속 실패가 이 횟수에 이르면 회로를 연다.
+        self.failure_threshold = failure_threshold
+        # 회로를 연 뒤 시험 요청을 보내기까지 기다리는 시간(초)
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """
+        요청을 보내도 되는지 반환한다. 열린 회로는 재설정 시간이 지나면 시험 요청 하나만 허용한다.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            # 재설정 시간마다 시험 요청 하나만 보낸다. 시험 요청이 결과 없이 끝나도 다음 시험은 가능하다.
+            if self.clock() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self.opened_at = self.clock()
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
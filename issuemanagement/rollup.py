@@ -0,0 +1,203 @@
+import datetime
+from collections import Counter
+from functools import lru_cache
+
+from issuemanagement.models import PRIORITIES, STATUSES
+
+GRANULARITIES = ('day', 'week', 'month', 'quarter')
+# 값별로 나누어 셀 수 있는 이슈 필드 ('all' 은 전체 이슈 수)
+DIMENSIONS = ('all', 'status', 'priority', 'assignee', 'fixer')
+
+def bucket_start(day, granularity):
+    """
+    날짜를 주어진 단위의 구간 시작 날짜로 내린다. (주는 월요일부터 시작)
+    """
+    if granularity == 'day':
+        return day
+    if granularity == 'week':
+        return day - datetime.timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+
+def next_bucket(start, granularity):
+    """
+    구간 시작 날짜의 다음 구간 시작 날짜를 반환한다.
+    """
+    if granularity == 'day':
+        return start + datetime.timedelta(days=1)
+    if granularity == 'week':
+        return start + datetime.timedelta(days=7)
+    months = 1 if granularity == 'month' else 3
+    month = start.month - 1 + months
+    return start.replace(year=start.year + month // 12, month=month % 12 + 1)
+
+def bucket_label(start, granularity):
+    text = start.isoformat()
+    if granularity == 'month':
+        return text[:7]
+    if granularity == 'quarter':
+        return f'{text[:4]}-Q{(start.month - 1) // 3 + 1}'
+    return text
+
+@lru_cache(maxsize=4096)
+def _day_buckets(day_text):
+    """
+    'YYYY-MM-DD' 날짜가 속한 단위별 (단위, 구간 시작) 목록. 같은 날짜의 이슈가 많으므로 캐시한다.
+    """
+    day = datetime.date.fromisoformat(day_text)
+    return tuple((granularity, bucket_start(day, granularity).isoformat()) for granularity in GRANULARITIES)
+
+def row_keys(row):
+    """
+    이슈 행 (reported_date, status, priority, assignee, fixer) 이 더해지는 카운터 키
+    (단위, 필드, 값, 구간 시작) 목록을 반환한다. 등록일이 없으면 빈 목록을 반환한다.
+    """
+    reported, status, priority, assignee, fixer = row
+    if not reported:
+        return []
+    # 담당자나 해결자가 없으면 그 필드로는 세지 않는다. 전체 이슈 수의 값은 빈 문자열이다.
+    values = [
+        (dimension, value)
+        for dimension, value in zip(DIMENSIONS, ('', status, priority, assignee, fixer))
+        if value is not None
+    ]
+    return [
+        (granularity, dimension, value, bucket)
+        for granularity, bucket in _day_buckets(reported[:10])
+        for dimension, value in values
+    ]
+
+def rollup_deltas(removed, added):
+    """
+    빠지는 이슈 행과 더해지는 이슈 행으로 카운터 변화량 {키: 증감} 을 계산한다. 변화가 없는 키는 뺀다.
+    """
+    deltas = Counter()
+    for row in removed:
+        deltas.subtract(row_keys(row))
+    for row in added:
+        deltas.update(row_keys(row))
+    return {key: delta for key, delta in deltas.items() if delta}
+
+def apply_rollup_deltas(conn, project_id, deltas):
+    """
+    카운터 변화량을 rollups 테이블에 더한다. 0 이 된 카운터는 지운다. (호출한 쪽의 트랜잭션 안에서 실행)
+    """
+    if not deltas:
+        return
+    conn.executemany(
+        'INSERT INTO rollups (project_id, granularity, dimension, value, bucket, count) '
+        'VALUES (?, ?, ?, ?, ?, ?) '
+        'ON CONFLICT (project_id, granularity, dimension, bucket, value) '
+        'DO UPDATE SET count = count + excluded.count',
+        [(project_id, *key, delta) for key, delta in deltas.items()],
+    )
+    conn.executemany(
+        'DELETE FROM rollups WHERE project_id = ? AND granularity = ? AND dimension = ? '
+        'AND value = ? AND bucket = ? AND count <= 0',
+        [(project_id, *key) for key, delta in deltas.items() if delta < 0],
+    )
+
+class RollupStore:
+    """
+    로컬 미러에 보관하는 일별/주별/월별/분기별 이슈 수 카운터.
+    미러에 이슈가 저장되거나 삭제될 때 바뀐 이슈만큼만 카운터를 고치므로 (동기화, 변경 사항 지켜보기)
+    기간과 단위를 어떻게 주어도 이슈 수와 관계없이 구간 수에 비례하는 시간에 답한다.
+    """
+    def __init__(self, mirror):
+        self.mirror = mirror
+
+    def ensure(self, project_id):
+        """
+        프로젝트의 카운터가 아직 없으면 미러의 이슈로 한 번 만든다. 이후에는 미러가 카운터를 갱신한다.
+        """
+        mirror = self.mirror
+        with mirror.lock, mirror.conn:
+            if mirror.conn.execute(
+                'SELECT 1 FROM rollup_state WHERE project_id = ?', (project_id,)
+            ).fetchone():
+                return
+            rows = mirror.conn.execute(
+                'SELECT reported_date, status, priority, assignee, fixer FROM issues WHERE project_id = ?',
+                (project_id,),
+            ).fetchall()
+            mirror.conn.execute('DELETE FROM rollups WHERE project_id = ?', (project_id,))
+            apply_rollup_deltas(mirror.conn, project_id, rollup_deltas((), rows))
+            mirror.conn.execute('INSERT INTO rollup_state VALUES (?)', (project_id,))
+
+    def _counts(self, project_id, granularity, dimension, first, last, value=None):
+        """
+        [first, last] 구간 시작 날짜의 카운터를 (구간 시작, 값, 수) 목록으로 반환한다.
+        """
+        query = (
+            'SELECT bucket, value, count FROM rollups WHERE project_id = ? AND granularity = ? '
+            'AND dimension = ? AND bucket BETWEEN ? AND ?'
+        )
+        args = [project_id, granularity, dimension, first.isoformat(), last.isoformat()]
+        if value is not None:
+            query += ' AND value = ?'
+            args.append(value)
+        with self.mirror.lock:
+            return self.mirror.conn.execute(query, args).fetchall()
+
+    def count_over_time(self, project_id, start, end, granularity='day', by=None, value=None):
+        """
+        [start, end] 기간에 등록된 이슈 수를 day/week/month/quarter 단위로 센다.
+        by 가 'status', 'priority', 'assignee', 'fixer' 이면 값별로 나누고, value 를 주면 그 값만 센다.
+        결과는 StatisticsEngine.count_over_time 과 같은 모양이다.
+        기간 안에 온전히 들어가는 구간은 그 단위의 카운터를, 기간 경계에 걸친 구간은 일별 카운터를 더한다.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'지원하지 않는 단위입니다: {granularity}')
+        if by is not None and by not in DIMENSIONS[1:]:
+            raise ValueError(f'지원하지 않는 구분입니다: {by}')
+        try:
+            start = datetime.date.fromisoformat(str(start)[:10])
+            end = datetime.date.fromisoformat(str(end)[:10])
+        except ValueError:
+            raise ValueError('날짜는 YYYY-MM-DD 형식이어야 합니다.') from None
+        if end < start:
+            raise ValueError('종료일이 시작일보다 앞입니다.')
+        self.ensure(project_id)
+
+        buckets = [bucket_start(start, granularity)]
+        while next_bucket(buckets[-1], granularity) <= end:
+            buckets.append(next_bucket(buckets[-1], granularity))
+        position = {bucket.isoformat(): i for i, bucket in enumerate(buckets)}
+        dimension = 'all' if by is None else by
+
+        rows = []
+        # 기간 안에 온전히 들어가는 구간
+        full = [
+            bucket for bucket in buckets
+            if bucket >= start and next_bucket(bucket, granularity) - datetime.timedelta(days=1) <= end
+        ]
+        if full:
+            rows.extend(self._counts(project_id, granularity, dimension, full[0], full[-1], value))
+        # 기간 경계에 걸친 첫 구간과 마지막 구간은 기간 안의 날짜만 더한다.
+        for bucket in {buckets[0], buckets[-1]} - set(full):
+            first = max(bucket, start)
+            last = min(next_bucket(bucket, granularity) - datetime.timedelta(days=1), end)
+            rows.extend(
+                (bucket.isoformat(), row_value, count)
+                for _, row_value, count in self._counts(project_id, 'day', dimension, first, last, value)
+            )
+
+        labels = [bucket_label(bucket, granularity) for bucket in buckets]
+        if by is None or value is not None:
+            counts = [0] * len(buckets)
+            for bucket, _, count in rows:
+                counts[position[bucket]] += count
+            return dict(zip(labels, counts))
+
+        if by == 'status':
+            categories = list(STATUSES)
+        elif by == 'priority':
+            categories = list(PRIORITIES)
+        else:
+            categories = sorted({row_value for _, row_value, _ in rows})
+        grid = [dict.fromkeys(categories, 0) for _ in buckets]
+        for bucket, row_value, count in rows:
+            if row_value in grid[0]:
+                grid[position[bucket]][row_value] += count
+        return dict(zip(labels, grid))
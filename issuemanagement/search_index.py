@@ -0,0 +1,202 @@
+import math
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+from issuemanagement.models import Issue
+
+# 영문/숫자 단어와 한글 음절 덩어리를 토큰으로 본다.
+TOKEN_RE = re.compile(r'[0-9a-z]+|[가-힣]+')
+
+# 필드별 가중치 (제목에 나온 단어를 더 중요하게 본다)
+FIELD_WEIGHTS = {'title': 2, 'description': 1, 'comments': 1}
+
+# 필터로 사용할 수 있는 필드 (Issue 속성 이름)
+FILTER_FIELDS = ('assignee', 'reporter', 'status', 'priority')
+
+def tokenize(text):
+    """
+    문자열을 검색 토큰으로 나눈다. 영어는 단어 단위, 한글은 음절 바이그램 단위로 나눈다.
+    """
+    tokens = []
+    for word in TOKEN_RE.findall((text or '').lower()):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            # 형태소 분석기 없이도 조사가 붙은 단어를 찾을 수 있도록 바이그램을 사용한다.
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+class SearchIndex:
+    """
+    이슈 제목, 설명, 댓글에 대한 역색인. BM25 로 순위를 매긴다.
+    """
+    def __init__(self, k1=1.2, b=0.75, capacity=1024):
+        self.k1 = k1
+        self.b = b
+        # 이슈마다 슬롯 번호를 붙여 길이와 필터 값을 NumPy 배열로 관리한다.
+        # 이슈는 사전 대신 슬롯 기반 Issue 레코드로 보관한다.
+        self.slot_of = {}
+        self.issue_at = [None] * capacity
+        self.free_slots = []
+        self.doc_lengths = np.zeros(capacity)
+        self.occupied = np.zeros(capacity, dtype=bool)
+        self.fields = {
+            field: np.full(capacity, None, dtype=object) for field in FILTER_FIELDS
+        }
+        self.total_length = 0
+        # 토큰 -> {슬롯: 가중 빈도}
+        self.postings = {}
+        # 슬롯 -> 토큰 빈도 (문서 제거 시 사용)
+        self.doc_terms = {}
+        # 미러에서 바뀌었다고 알려온 이슈 ID (다음 검색 전에 다시 색인)
+        self.dirty = set()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.slot_of)
+
+    def _allocate_slot(self):
+        if self.free_slots:
+            return self.free_slots.pop()
+        slot = len(self.slot_of)
+        if slot == len(self.issue_at):
+            # 배열이 가득 차면 두 배로 늘린다.
+            grow = len(self.issue_at)
+            self.issue_at.extend([None] * grow)
+            self.doc_lengths = np.concatenate([self.doc_lengths, np.zeros(grow)])
+            self.occupied = np.concatenate([self.occupied, np.zeros(grow, dtype=bool)])
+            for field, values in self.fields.items():
+                self.fields[field] = np.concatenate(
+                    [values, np.full(grow, None, dtype=object)]
+                )
+        return slot
+
+    def add_issue(self, issue, comments=()):
+        """
+        이슈 하나를 색인한다. 이미 색인된 이슈면 새 내용으로 교체한다.
+        """
+        if not isinstance(issue, Issue):
+            issue = Issue.from_dict(issue)
+        if issue.id in self.slot_of:
+            self.remove_issue(issue.id)
+
+        terms = Counter()
+        texts = {
+            'title': issue.title,
+            'description': issue.description,
+            'comments': ' '.join(c.get('content') or '' for c in comments),
+        }
+        for field, text in texts.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                terms[token] += weight
+
+        slot = self._allocate_slot()
+        self.slot_of[issue.id] = slot
+        self.issue_at[slot] = issue
+        self.occupied[slot] = True
+        for field in FILTER_FIELDS:
+            self.fields[field][slot] = getattr(issue, field)
+        for token, tf in terms.items():
+            self.postings.setdefault(token, {})[slot] = tf
+        length = sum(terms.values())
+        self.doc_terms[slot] = terms
+        self.doc_lengths[slot] = length
+        self.total_length += length
+
+    def remove_issue(self, issue_id):
+        """
+        이슈를 색인에서 제거한다.
+        """
+        slot = self.slot_of.pop(issue_id, None)
+        if slot is None:
+            return
+        for token in self.doc_terms.pop(slot):
+            posting = self.postings[token]
+            del posting[slot]
+            if not posting:
+                del self.postings[token]
+        self.total_length -= self.doc_lengths[slot]
+        self.doc_lengths[slot] = 0
+        self.issue_at[slot] = None
+        self.occupied[slot] = False
+        for values in self.fields.values():
+            values[slot] = None
+        self.free_slots.append(slot)
+
+    def _filter_mask(self, filters):
+        """
+        필터 조건을 만족하는 슬롯을 True 로 표시한 배열을 반환한다.
+        """
+        mask = self.occupied.copy()
+        for field, value in filters.items():
+            if value is not None:
+                mask &= self.fields[field] == value
+        return mask
+
+    def search(self, query='', limit=20, **filters):
+        """
+        질의어로 이슈를 검색하고 점수 순으로 반환한다.
+        assignee, reporter, status, priority 로 결과를 거를 수 있다. 질의어가 없으면 필터에 맞는 이슈를 ID 순으로 반환한다.
+        """
+        mask = self._filter_mask(filters)
+        tokens = set(tokenize(query))
+        if not tokens:
+            matched = sorted(
+                (self.issue_at[slot] for slot in np.flatnonzero(mask)),
+                key=lambda issue: issue.id,
+            )
+            if limit is not None:
+                matched = matched[:limit]
+            return [issue.to_dict() for issue in matched]
+
+        n = len(self.slot_of)
+        avg_length = self.total_length / n if n else 1
+        scores = np.zeros(len(self.issue_at))
+        for token in tokens:
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            slots = np.fromiter(posting.keys(), dtype=np.int64, count=len(posting))
+            tfs = np.fromiter(posting.values(), dtype=float, count=len(posting))
+            idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[slots] / avg_length)
+            scores[slots] += idf * tfs * (self.k1 + 1) / (tfs + norm)
+
+        candidates = np.flatnonzero(mask & (scores > 0))
+        if limit is not None and len(candidates) > limit:
+            top = np.argpartition(scores[candidates], -limit)[-limit:]
+            candidates = candidates[top]
+        ranked = candidates[np.argsort(-scores[candidates], kind='stable')]
+        return [self.issue_at[slot].to_dict() for slot in ranked]
+
+    def mark_dirty(self, issue_ids):
+        with self.lock:
+            self.dirty.update(issue_ids)
+
+    def refresh(self, mirror, project_id):
+        """
+        바뀐 것으로 표시된 이슈만 미러에서 다시 읽어 색인을 갱신한다.
+        """
+        with self.lock:
+            dirty, self.dirty = self.dirty, set()
+        for issue_id in dirty:
+            issue = mirror.get_issue(project_id, issue_id)
+            if issue is None:
+                self.remove_issue(issue_id)
+            else:
+                self.add_issue(issue, mirror.get_comments(project_id, issue_id))
+
+    @classmethod
+    def from_mirror(cls, mirror, project_id):
+        """
+        미러에 저장된 프로젝트 전체로 색인을 만든다.
+        """
+        index = cls()
+        comments = mirror.get_project_comments(project_id)
+        for issue in mirror.get_issues(project_id):
+            index.add_issue(issue, comments.get(issue['id'], ()))
+        return index
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+import time
+
+# 로그인 화면이 뜨기 직전까지 실행되는 코드 (main 모듈 import 와 세션 생성)
+PROMPT_SCRIPT = 'import main; main.Session()'
+
+# 로그인 화면 전에 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = ('matplotlib', 'numpy')
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure_import_times(script=PROMPT_SCRIPT):
+    """
+    새 인터프리터에서 script 를 `-X importtime` 으로 실행해 모듈별 import 시간을 측정한다.
+    (모듈 이름, 자체 시간(초), 누적 시간(초)) 목록을 누적 시간 내림차순으로 반환한다.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        # 형식: "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        timings.append((module.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    timings.sort(key=lambda timing: timing[2], reverse=True)
+    return timings
+
+def measure_time_to_prompt(repeat=5, script=PROMPT_SCRIPT):
+    """
+    인터프리터 시작부터 로그인 화면 직전까지 걸리는 시간을 repeat 번 재서 중앙값(초)을 반환한다.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, check=True)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2]
+
+def print_startup_report(top=20, repeat=5):
+    """
+    로그인 화면까지의 시간과 import 비용이 큰 모듈을 표로 출력한다.
+    """
+    timings = measure_import_times()
+    print(f"로그인 화면까지 걸린 시간 (중앙값, {repeat}회): {measure_time_to_prompt(repeat):.3f}초")
+    print(f"\n{'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+    for module, self_time, cumulative in timings[:top]:
+        print(f"{cumulative * 1000:10.1f} {self_time * 1000:10.1f}  {module}")
+
+    loaded = {module.split('.')[0] for module, _, _ in timings}
+    heavy = [module for module in HEAVY_MODULES if module in loaded]
+    if heavy:
+        print(f"\n경고: 시작 시 무거운 모듈을 불러옵니다: {', '.join(heavy)}")
+    return timings
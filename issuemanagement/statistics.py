@@ -1,21 +1,143 @@
-import requests
-import matplotlib.pyplot as plt
-import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from issuemanagement.models import PRIORITIES, STATUSES
+
+# 대시보드에서 한 번에 요청하는 통계 엔드포인트 (상태/우선순위별 엔드포인트는 따로 추가)
+DASHBOARD_ENDPOINTS = (
+    'issuesPerMonth',
+    'issuesPerStatus',
+    'issuesPerFixer',
+    'issuesOrderByComments',
+    'issuesPerDayInMonth',
+    'issuesPerPriorityInMonth',
+    'issuesPerDayAndStatusInWeek',
+)
+
+# 꺾은선 그래프 하나에 그릴 최대 점 수. 이보다 긴 시계열은 LTTB 로 줄인다.
+MAX_POINTS = 500
+# 점이 이보다 많으면 점 표시(marker)는 그리지 않는다.
+MARKER_POINTS = 60
+
+def _rotate_xticklabels(ax):
+    """
+    x 축 눈금 이름을 45도 기울여 오른쪽 정렬한다.
+    """
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets 로 시계열의 모양을 잘 남기는 점 threshold 개를 골라 인덱스 배열로 반환한다.
+    첫 점과 마지막 점은 항상 남기고, 나머지 구간마다 앞에서 고른 점, 다음 구간의 평균점과 만드는 삼각형이
+    가장 큰 점을 고른다. 점이 threshold 개 이하이면 모든 인덱스를 반환한다.
+    """
+    import numpy as np
+
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # 첫 점과 마지막 점 사이를 threshold - 2 개 구간으로 나눈다. (구간 폭이 1 이상이므로 빈 구간은 없다)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+def _date_values(labels):
+    """
+    'YYYY-MM-DD', 'YYYY-MM', 'YYYY-Qn' 형태의 이름 목록을 datetime64[D] 배열로 바꾼다.
+    날짜로 읽을 수 없는 이름이 하나라도 있으면 None 을 반환한다.
+    """
+    import numpy as np
+
+    texts = []
+    for label in labels:
+        text = str(label)
+        if len(text) < 7 or not text[:4].isdigit() or text[4] != '-':
+            return None
+        if text[5] == 'Q':
+            if text[6] not in '1234':
+                return None
+            text = f'{text[:4]}-{(int(text[6]) - 1) * 3 + 1:02d}'
+        texts.append(text[:10])
+    try:
+        return np.array(texts, dtype='datetime64[D]')
+    except ValueError:
+        return None
+
+def _plot_series(ax, labels, values, full_resolution=False, **kwargs):
+    """
+    {이름: 개수} 시계열 하나를 꺾은선으로 그린다. 이름이 날짜이면 날짜 축에 실제 간격대로 그리고,
+    full_resolution 이 아니면 MAX_POINTS 보다 긴 시계열을 LTTB 로 줄여 그리는 시간과 메모리를 일정하게 유지한다.
+    날짜 축에 그렸으면 True 를 반환한다.
+    """
+    import numpy as np
+
+    labels = list(labels)
+    y = np.asarray(list(values), dtype=float)
+    x = _date_values(labels)
+    if x is None:
+        x = labels
+    elif not full_resolution and len(y) > MAX_POINTS:
+        keep = lttb(x.astype(np.int64), y, MAX_POINTS)
+        x, y = x[keep], y[keep]
+    ax.plot(x, y, marker='o' if len(y) <= MARKER_POINTS else None, **kwargs)
+    return not isinstance(x, list)
+
+def _format_time_axis(ax, dated):
+    """
+    날짜 축이면 확대 수준에 맞춰 눈금을 고르고 간결한 날짜 형식으로 표시한다. 아니면 눈금 이름을 기울인다.
+    """
+    if not dated:
+        _rotate_xticklabels(ax)
+        return
+    import matplotlib.dates as mdates
+
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
 
 class StatisticsManager:
     """
-    이슈 통계 분석을 관리하는 클래스
+    이슈 통계 분석을 관리하는 클래스.
+    matplotlib 와 NumPy 는 시작 시간을 줄이기 위해 그래프를 처음 그릴 때 불러온다.
+    그래프 창은 종류(그래프, 대시보드)마다 그림 하나를 지워 가며 다시 쓰므로 메뉴를 여러 번 열어도 그림이 쌓이지 않는다.
     """
     def __init__(self, base_url, session):
         self.base_url = base_url
         self.session = session
         self.project_id = None
+        # True 이면 서버 대신 로컬 스냅샷으로 통계를 계산한다.
+        self.use_local = False
+        # True 이면 긴 시계열도 줄이지 않고 모든 점을 그린다.
+        self.full_resolution = False
+        self.engine = None
+        # 종류 -> 다시 쓰는 matplotlib 그림
+        self._figures = {}
 
     def analyze_issue_statistics(self, project_id):
         """
         다양한 이슈 통계 분석 옵션을 제공한다.
         """
         self.project_id = project_id
+        # 통계 화면에 들어올 때마다 스냅샷을 새로 만든다.
+        self.engine = None
         while True:
             print("\n--- 이슈 통계 분석 ---")
             print("1. 월별 이슈 수 (꺾은선 그래프)")
@@ -27,7 +149,11 @@ class StatisticsManager:
             print("7. 우선순위별 일주일 간 이슈 수 (꺾은선 그래프)")
             print("8. 이번 달 우선순위별 이슈 수 (파이 그래프)")
             print("9. 상태별 일주일 간 이슈 수 (막대 그래프)")
-            print("10. 돌아가기")
+            print("10. 기간/단위 지정 이슈 수 (꺾은선 그래프)")
+            print("11. 전체 통계 대시보드")
+            print(f"12. 계산 위치 전환 (현재: {'로컬' if self.use_local else '서버'})")
+            print(f"13. 그래프 해상도 전환 (현재: {'전체' if self.full_resolution else '자동 축소'})")
+            print("14. 돌아가기")
 
             choice = input("원하는 기능을 선택하세요: ")
 
@@ -50,17 +176,41 @@ class StatisticsManager:
             elif choice == '9':
                 self.get_issues_per_day_and_status_in_week()
             elif choice == '10':
+                self.get_issues_over_time_chart()
+            elif choice == '11':
+                self.show_dashboard()
+            elif choice == '12':
+                self.use_local = not self.use_local
+            elif choice == '13':
+                self.full_resolution = not self.full_resolution
+            elif choice == '14':
                 break
             else:
                 print("잘못된 입력입니다.")
 
+    def fetch_statistics(self, project_id, endpoint):
+        """
+        프로젝트의 통계 데이터 하나를 반환한다. (예: 'issuesPerMonth', 'issuesPerDayAndStatusInWeek/NEW')
+        """
+        if project_id != self.project_id:
+            self.project_id = project_id
+            self.engine = None
+        return self._request_statistics_data(endpoint)
+
     def _request_statistics_data(self, endpoint):
         """
         통계 데이터를 요청하는 내부 함수
         """
-        response = requests.get(
+        if self.use_local:
+            engine = self._get_engine()
+            data = engine.compute(endpoint) if engine is not None else None
+            if data is not None:
+                return data
+            # 로컬에서 계산할 수 없는 통계(댓글 수를 모르는 경우 등)는 서버에 요청한다.
+
+        response = self.session.transport.get(
             f'{self.base_url}/projects/{self.project_id}/statistics/{endpoint}',
-            headers=self.session.get_headers(),
+            cache=True,
         )
         if response.status_code == 200:
             return response.json()
@@ -68,23 +218,105 @@ class StatisticsManager:
             print("이슈 통계 정보를 불러오는 데 실패했습니다.")
             return None
 
+    def _get_engine(self):
+        """
+        현재 프로젝트의 통계 엔진을 반환한다. 처음 호출될 때 이슈를 한 번만 불러온다.
+        """
+        from issuemanagement.stats_engine import StatisticsEngine
+
+        if self.engine is not None:
+            return self.engine
+        mirror = self.session.mirror
+        if mirror is not None and mirror.has_project(self.project_id):
+            self.engine = StatisticsEngine.from_mirror(mirror, self.project_id)
+        else:
+            response = self.session.transport.get(
+                f'{self.base_url}/projects/{self.project_id}/issues',
+                cache=True,
+            )
+            if response.status_code != 200:
+                print("이슈 목록을 불러오는 데 실패했습니다.")
+                return None
+            self.engine = StatisticsEngine.from_issues(response.json())
+        return self.engine
+
+    def count_over_time(self, project_id, start, end, granularity='day', by=None, value=None):
+        """
+        [start, end] 기간의 이슈 수를 day/week/month/quarter 단위로 센다. (by: status, priority, assignee, fixer)
+        로컬 미러에 동기화된 프로젝트는 미리 집계된 카운터로, 아니면 이슈 스냅샷으로 계산한다.
+        이슈 목록을 불러오지 못하면 None 을 반환하고, 날짜나 단위가 잘못되면 ValueError 를 일으킨다.
+        """
+        from issuemanagement.rollup import RollupStore
+
+        if project_id != self.project_id:
+            self.project_id = project_id
+            self.engine = None
+        mirror = self.session.mirror
+        if mirror is not None and mirror.has_project(project_id):
+            return RollupStore(mirror).count_over_time(project_id, start, end, granularity, by, value)
+        engine = self._get_engine()
+        if engine is None:
+            return None
+        return engine.count_over_time(start, end, granularity, by=by, value=value)
+
+    def get_issues_over_time_chart(self):
+        """
+        지정한 기간과 단위(일/주/월/분기)의 이슈 수를 꺾은선 그래프로 표시한다. (로컬 계산)
+        """
+        from issuemanagement.rollup import DIMENSIONS, GRANULARITIES
+
+        start = input("시작일 (YYYY-MM-DD): ")
+        end = input("종료일 (YYYY-MM-DD): ")
+        granularity = input(f"단위 ({', '.join(GRANULARITIES)}): ").lower()
+        by = input(f"구분 ({', '.join(DIMENSIONS[1:])}, 없음은 Enter): ").lower() or None
+        if granularity not in GRANULARITIES or by not in (None, *DIMENSIONS[1:]):
+            print("잘못된 입력입니다.")
+            return
+
+        try:
+            data = self.count_over_time(self.project_id, start, end, granularity, by=by)
+        except ValueError:
+            print("잘못된 날짜입니다.")
+            return
+        if data is None:
+            return
+
+        self._show_chart(
+            self._plot_counts_over_time, data, granularity.capitalize(),
+            f'Number of Issues ({start} ~ {end})', self.full_resolution,
+        )
+
+    def _figure(self, kind, figsize):
+        """
+        kind 종류의 그래프에 쓸 그림을 반환한다. 이전에 만든 그림이 아직 열려 있으면 지워서 다시 쓴다.
+        """
+        import matplotlib.pyplot as plt
+
+        fig = self._figures.get(kind)
+        if fig is not None and plt.fignum_exists(fig.number):
+            fig.clf()
+            return fig
+        fig = self._figures[kind] = plt.figure(figsize=figsize)
+        return fig
+
+    def _show_chart(self, plot, data, *args):
+        """
+        plot(ax, data, ...) 로 그래프 하나를 그려 창에 표시한다.
+        """
+        import matplotlib.pyplot as plt
+
+        fig = self._figure('chart', (10, 5))
+        plot(fig.add_subplot(), data, *args)
+        fig.tight_layout()
+        plt.show()
+
     def get_issues_per_month_chart(self):
         """
         월별 이슈 수를 꺾은선 그래프로 표시한다.
         """
         data = self._request_statistics_data('issuesPerMonth')
         if data:
-            months = list(data.keys())
-            counts = list(data.values())
-
-            plt.figure(figsize=(10, 5))
-            plt.plot(months, counts, marker='o')
-            plt.xlabel('Month')
-            plt.ylabel('Number of Issues')
-            plt.title('Number of Issues Per Month')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
+            self._show_chart(self._plot_issues_per_month, data, self.full_resolution)
 
     def get_issues_per_status_chart(self):
         """
@@ -92,17 +324,7 @@ class StatisticsManager:
         """
         data = self._request_statistics_data('issuesPerStatus')
         if data:
-            status = list(data.keys())
-            counts = list(data.values())
-
-            plt.figure(figsize=(10, 5))
-            plt.bar(status, counts)
-            plt.xlabel('Issue Status')
-            plt.ylabel('Number of Issues')
-            plt.title('Number of Issues Per Status')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
+            self._show_chart(self._plot_issues_per_status, data)
 
     def get_issues_per_fixer_chart(self):
         """
@@ -110,40 +332,7 @@ class StatisticsManager:
         """
         data = self._request_statistics_data('issuesPerFixer')
         if data:
-            fixers = list(data.keys())
-            resolved_counts = []
-            closed_counts = []
-            other_counts = []
-
-            for fixer in fixers:
-                resolved_counts.append(data[fixer].get('RESOLVED', 0))
-                closed_counts.append(data[fixer].get('CLOSED', 0))
-                other_counts.append(
-                    data[fixer].get('OTHER', 0) if 'OTHER' in data[fixer] else 0
-                )
-
-            width = 0.25  # the width of the bars
-
-            fig, ax = plt.subplots(figsize=(10, 5))
-
-            x = range(len(fixers))
-            rects1 = ax.bar(x, resolved_counts, width, label='Resolved')
-            rects2 = ax.bar(
-                [i + width for i in x], closed_counts, width, label='Closed'
-            )
-            rects3 = ax.bar(
-                [i + 2 * width for i in x], other_counts, width, label='Other'
-            )
-
-            ax.set_xlabel('Fixer')
-            ax.set_ylabel('Number of Issues')
-            ax.set_title('Number of Issues Per Fixer (Resolved/Closed)')
-            ax.set_xticks([i + width for i in x])
-            ax.set_xticklabels(fixers)
-            ax.legend()
-
-            fig.tight_layout()
-            plt.show()
+            self._show_chart(self._plot_issues_per_fixer, data)
 
     def get_issues_per_day_and_status_in_week_chart(self):
         """
@@ -156,17 +345,9 @@ class StatisticsManager:
             f'issuesPerDayAndStatusInWeek/{status}'
         )
         if data:
-            days = list(data.keys())
-            counts = list(data.values())
-
-            plt.figure(figsize=(10, 5))
-            plt.plot(days, counts, marker='o')
-            plt.xlabel('Day')
-            plt.ylabel('Number of Issues')
-            plt.title(f'Number of Issues in a Week (Status: {status})')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
+            self._show_chart(
+                self._plot_weekly_lines, {status: data}, f'Number of Issues in a Week (Status: {status})'
+            )
 
     def get_issues_order_by_comments_chart(self):
         """
@@ -174,16 +355,7 @@ class StatisticsManager:
         """
         data = self._request_statistics_data('issuesOrderByComments')
         if data:
-            issues = list(data.keys())
-            comment_counts = list(data.values())
-
-            plt.bar(issues, comment_counts)
-            plt.xlabel('Issue Title')
-            plt.ylabel('Number of Comments')
-            plt.title('Top 3 Issues by Comment Count')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
+            self._show_chart(self._plot_issues_order_by_comments, data)
 
     def get_issues_per_day_in_month_chart(self):
         """
@@ -191,18 +363,7 @@ class StatisticsManager:
         """
         data = self._request_statistics_data('issuesPerDayInMonth')
         if data:
-            days = list(data.keys())
-            counts = list(data.values())
-
-            plt.figure(figsize=(10, 5))
-            plt.plot(days, counts, marker='o')
-            plt.xlabel('Day')
-            plt.ylabel('Number of Issues')
-            plt.title('Number of Issues Per Day in This Month')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
-
+            self._show_chart(self._plot_issues_per_day_in_month, data, self.full_resolution)
 
     def get_issues_per_day_and_priority_in_week_chart(self):
         """
@@ -215,17 +376,9 @@ class StatisticsManager:
             f'issuesPerDayAndPriorityInWeek/{priority}'
         )
         if data:
-            days = list(data.keys())
-            counts = list(data.values())
-
-            plt.figure(figsize=(10, 5))
-            plt.plot(days, counts, marker='o')
-            plt.xlabel('Day')
-            plt.ylabel('Number of Issues')
-            plt.title(f'Number of Issues in a Week (Priority: {priority})')
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
+            self._show_chart(
+                self._plot_weekly_lines, {priority: data}, f'Number of Issues in a Week (Priority: {priority})'
+            )
 
     def get_issues_per_priority_in_month_chart(self):
         """
@@ -233,20 +386,7 @@ class StatisticsManager:
         """
         data = self._request_statistics_data('issuesPerPriorityInMonth')
         if data:
-            priority = list(data.keys())
-            counts = list(data.values())
-
-            # 파이 그래프에 개수 표시
-            def func(pct, allvals):
-                absolute = int(pct / 100. * np.sum(allvals))
-                return "{:.1f}%\n({:d} issues)".format(pct, absolute)
-
-            plt.figure(figsize=(10, 5))
-            plt.pie(counts, labels=priority, autopct=lambda pct: func(pct, counts), startangle=90)
-            plt.title('Number of Issues by Priority (This Month)')
-            plt.tight_layout()
-            plt.show()
-
+            self._show_chart(self._plot_issues_per_priority_in_month, data)
 
     def get_issues_per_day_and_status_in_week(self):
         """
@@ -254,40 +394,284 @@ class StatisticsManager:
         """
         data = self._request_statistics_data('issuesPerDayAndStatusInWeek')
         if data:
-            days = list(data.keys())
-            status_data = {}
-            for day in days:
-                for status, count in data[day].items():
-                    if status not in status_data:
-                        status_data[status] = []
-                    status_data[status].append(count)
-
-            colors = {
-                'NEW': 'lightblue',
-                'ASSIGNED': 'lightgreen',
-                'FIXED': 'lightyellow',
-                'RESOLVED': 'lightcoral',
-                'CLOSED': 'lightgray',
-                'REOPENED': 'orange',
-            }
-
-            plt.figure(figsize=(10, 5))
-            bottom = [0] * len(days) 
-
-            for status, counts in status_data.items():
-                bars = plt.bar(days, counts, label=status, bottom=bottom, color=colors.get(status, 'gray')) 
-                bottom = [b + c for b, c in zip(bottom, counts)]  
-
-            plt.xlabel('Day')
-            plt.ylabel('Number of Issues')
-            plt.title('Number of Issues per Day and Status in Week')
-            plt.xticks(rotation=45, ha='right')
-            plt.legend()
-            plt.tight_layout()
-
-            max_issues = max(sum(status_data[status]) for status in status_data)
-            plt.ylim(0, max_issues * 1.5) 
+            self._show_chart(self._plot_issues_per_day_and_status_in_week, data)
 
+    def show_dashboard(self, max_workers=None):
+        """
+        모든 통계를 동시에 요청해 하나의 격자 그림(대시보드)으로 표시한다.
+        """
+        import matplotlib.pyplot as plt
+
+        results = self._request_dashboard_data(max_workers)
+        fig = self._draw_dashboard(results)
+        if fig is not None:
             plt.show()
 
-        
\ No newline at end of file
+    def _request_dashboard_data(self, max_workers=None):
+        """
+        대시보드에 필요한 모든 통계 엔드포인트를 제한된 스레드 풀로 동시에 요청한다.
+        스레드 수는 기본적으로 연결 풀 크기를 넘지 않는다.
+        """
+        if self.use_local:
+            # 스레드들이 같은 스냅샷을 쓰도록 먼저 만들어 둔다.
+            self._get_engine()
+        endpoints = list(DASHBOARD_ENDPOINTS)
+        endpoints += [f'issuesPerDayAndStatusInWeek/{status}' for status in STATUSES]
+        endpoints += [f'issuesPerDayAndPriorityInWeek/{priority}' for priority in PRIORITIES]
+        if max_workers is None:
+            max_workers = min(len(endpoints), self.session.transport.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(endpoints, executor.map(self._request_statistics_data, endpoints)))
+
+    def _draw_dashboard(self, results):
+        """
+        요청한 통계 결과로 3x3 격자 그림을 그린다. 그릴 데이터가 하나도 없으면 None 을 반환한다.
+        """
+        status_series = {
+            status: results[f'issuesPerDayAndStatusInWeek/{status}'] for status in STATUSES
+            if results.get(f'issuesPerDayAndStatusInWeek/{status}')
+        }
+        priority_series = {
+            priority: results[f'issuesPerDayAndPriorityInWeek/{priority}'] for priority in PRIORITIES
+            if results.get(f'issuesPerDayAndPriorityInWeek/{priority}')
+        }
+        panels = [
+            (self._plot_issues_per_month, results.get('issuesPerMonth')),
+            (self._plot_issues_per_status, results.get('issuesPerStatus')),
+            (self._plot_issues_per_fixer, results.get('issuesPerFixer')),
+            (lambda ax, data: self._plot_weekly_lines(ax, data, 'Issues in a Week by Status'), status_series),
+            (self._plot_issues_order_by_comments, results.get('issuesOrderByComments')),
+            (self._plot_issues_per_day_in_month, results.get('issuesPerDayInMonth')),
+            (lambda ax, data: self._plot_weekly_lines(ax, data, 'Issues in a Week by Priority'), priority_series),
+            (self._plot_issues_per_priority_in_month, results.get('issuesPerPriorityInMonth')),
+            (self._plot_issues_per_day_and_status_in_week, results.get('issuesPerDayAndStatusInWeek')),
+        ]
+        if not any(data for _, data in panels):
+            return None
+
+        fig = self._figure('dashboard', (20, 14))
+        for ax, (plot, data) in zip(fig.subplots(3, 3).flat, panels):
+            if data:
+                plot(ax, data)
+            else:
+                ax.set_axis_off()
+                ax.text(0.5, 0.5, 'No data', ha='center', va='center')
+        fig.suptitle(f'Issue Statistics Dashboard (Project {self.project_id})')
+        fig.tight_layout()
+        return fig
+
+    def export_charts(self, project_id, output_dir, formats=('png',), max_workers=None, full_resolution=False):
+        """
+        프로젝트의 모든 통계 그래프를 창에 띄우지 않고 파일(PNG/SVG/PDF)로 저장한다.
+        full_resolution 이면 긴 시계열도 줄이지 않는다. 저장한 파일 경로 목록을 반환한다.
+        """
+        import matplotlib.pyplot as plt
+
+        self.project_id = project_id
+        results = self._request_dashboard_data(max_workers)
+        project_dir = os.path.join(output_dir, f'project_{project_id}')
+        os.makedirs(project_dir, exist_ok=True)
+
+        paths = []
+        # 그래프마다 새 그림을 만들지 않고 하나를 지워 가며 재사용한다.
+        fig = self._figure('chart', (10, 5))
+        try:
+            for name, plot, data in self._chart_specs(results, full_resolution):
+                fig.clf()
+                plot(fig.add_subplot(), data)
+                fig.tight_layout()
+                paths += self._save_figure(fig, project_dir, name, formats)
+        finally:
+            plt.close(fig)
+
+        dashboard = self._draw_dashboard(results)
+        if dashboard is not None:
+            try:
+                paths += self._save_figure(dashboard, project_dir, 'dashboard', formats)
+            finally:
+                plt.close(dashboard)
+        return paths
+
+    def _chart_specs(self, results, full_resolution=False):
+        """
+        저장할 그래프 목록을 (파일 이름, 그리기 함수, 데이터) 로 반환한다. 데이터가 없는 그래프는 건너뛴다.
+        """
+        specs = [
+            ('issuesPerMonth', lambda ax, data: self._plot_issues_per_month(ax, data, full_resolution)),
+            ('issuesPerStatus', self._plot_issues_per_status),
+            ('issuesPerFixer', self._plot_issues_per_fixer),
+            ('issuesOrderByComments', self._plot_issues_order_by_comments),
+            ('issuesPerDayInMonth', lambda ax, data: self._plot_issues_per_day_in_month(ax, data, full_resolution)),
+            ('issuesPerPriorityInMonth', self._plot_issues_per_priority_in_month),
+            ('issuesPerDayAndStatusInWeek', self._plot_issues_per_day_and_status_in_week),
+        ]
+        charts = [(name, plot, results.get(name)) for name, plot in specs]
+        for status in STATUSES:
+            charts.append((
+                f'issuesPerDayAndStatusInWeek_{status}',
+                lambda ax, data, status=status: self._plot_weekly_lines(
+                    ax, {status: data}, f'Number of Issues in a Week (Status: {status})'
+                ),
+                results.get(f'issuesPerDayAndStatusInWeek/{status}'),
+            ))
+        for priority in PRIORITIES:
+            charts.append((
+                f'issuesPerDayAndPriorityInWeek_{priority}',
+                lambda ax, data, priority=priority: self._plot_weekly_lines(
+                    ax, {priority: data}, f'Number of Issues in a Week (Priority: {priority})'
+                ),
+                results.get(f'issuesPerDayAndPriorityInWeek/{priority}'),
+            ))
+        return [(name, plot, data) for name, plot, data in charts if data]
+
+    @staticmethod
+    def _save_figure(fig, directory, name, formats):
+        paths = []
+        for fmt in formats:
+            path = os.path.join(directory, f'{name}.{fmt}')
+            fig.savefig(path, format=fmt)
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def _plot_issues_per_month(ax, data, full_resolution=False):
+        dated = _plot_series(ax, data.keys(), data.values(), full_resolution)
+        ax.set_xlabel('Month')
+        ax.set_ylabel('Number of Issues')
+        ax.set_title('Number of Issues Per Month')
+        _format_time_axis(ax, dated)
+
+    @staticmethod
+    def _plot_counts_over_time(ax, data, xlabel, title, full_resolution=False):
+        """
+        count_over_time 결과 ({구간: 개수} 또는 {구간: {값: 개수}}) 를 꺾은선으로 그린다.
+        """
+        labels = list(data.keys())
+        first = next(iter(data.values()), None)
+        if isinstance(first, dict):
+            dated = False
+            for category in first:
+                dated = _plot_series(
+                    ax, labels, [data[label][category] for label in labels], full_resolution, label=category
+                )
+            ax.legend()
+        else:
+            dated = _plot_series(ax, labels, data.values(), full_resolution)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Number of Issues')
+        ax.set_title(title)
+        _format_time_axis(ax, dated)
+
+    @staticmethod
+    def _plot_issues_per_status(ax, data):
+        status = list(data.keys())
+        counts = list(data.values())
+        ax.bar(status, counts)
+        ax.set_xlabel('Issue Status')
+        ax.set_ylabel('Number of Issues')
+        ax.set_title('Number of Issues Per Status')
+        _rotate_xticklabels(ax)
+
+    @staticmethod
+    def _plot_issues_per_fixer(ax, data):
+        fixers = list(data.keys())
+        resolved_counts = [data[fixer].get('RESOLVED', 0) for fixer in fixers]
+        closed_counts = [data[fixer].get('CLOSED', 0) for fixer in fixers]
+        other_counts = [data[fixer].get('OTHER', 0) for fixer in fixers]
+
+        width = 0.25  # the width of the bars
+        x = range(len(fixers))
+        ax.bar(x, resolved_counts, width, label='Resolved')
+        ax.bar([i + width for i in x], closed_counts, width, label='Closed')
+        ax.bar([i + 2 * width for i in x], other_counts, width, label='Other')
+
+        ax.set_xlabel('Fixer')
+        ax.set_ylabel('Number of Issues')
+        ax.set_title('Number of Issues Per Fixer (Resolved/Closed)')
+        ax.set_xticks([i + width for i in x])
+        ax.set_xticklabels(fixers)
+        ax.legend()
+
+    @staticmethod
+    def _plot_weekly_lines(ax, series, title):
+        """
+        {구분: {날짜: 개수}} 형태의 일주일 데이터를 구분별 꺾은선으로 그린다.
+        """
+        dated = False
+        for label, data in series.items():
+            dated = _plot_series(ax, data.keys(), data.values(), label=label)
+        ax.set_xlabel('Day')
+        ax.set_ylabel('Number of Issues')
+        ax.set_title(title)
+        _format_time_axis(ax, dated)
+        if len(series) > 1:
+            ax.legend()
+
+    @staticmethod
+    def _plot_issues_order_by_comments(ax, data):
+        issues = list(data.keys())
+        comment_counts = list(data.values())
+        ax.bar(issues, comment_counts)
+        ax.set_xlabel('Issue Title')
+        ax.set_ylabel('Number of Comments')
+        ax.set_title('Top 3 Issues by Comment Count')
+        _rotate_xticklabels(ax)
+
+    @staticmethod
+    def _plot_issues_per_day_in_month(ax, data, full_resolution=False):
+        dated = _plot_series(ax, data.keys(), data.values(), full_resolution)
+        ax.set_xlabel('Day')
+        ax.set_ylabel('Number of Issues')
+        ax.set_title('Number of Issues Per Day in This Month')
+        _format_time_axis(ax, dated)
+
+    @staticmethod
+    def _plot_issues_per_priority_in_month(ax, data):
+        priority = list(data.keys())
+        counts = list(data.values())
+
+        # 파이 그래프에 개수 표시
+        def func(pct, allvals):
+            absolute = int(pct / 100. * sum(allvals))
+            return "{:.1f}%\n({:d} issues)".format(pct, absolute)
+
+        ax.set_title('Number of Issues by Priority (This Month)')
+        if not any(counts):
+            # 모든 값이 0 이면 파이 그래프를 그릴 수 없다.
+            ax.set_axis_off()
+            ax.text(0.5, 0.5, 'No data', ha='center', va='center')
+            return
+        ax.pie(counts, labels=priority, autopct=lambda pct: func(pct, counts), startangle=90)
+
+    @staticmethod
+    def _plot_issues_per_day_and_status_in_week(ax, data):
+        days = list(data.keys())
+        status_data = {}
+        for day in days:
+            for status, count in data[day].items():
+                if status not in status_data:
+                    status_data[status] = []
+                status_data[status].append(count)
+
+        colors = {
+            'NEW': 'lightblue',
+            'ASSIGNED': 'lightgreen',
+            'FIXED': 'lightyellow',
+            'RESOLVED': 'lightcoral',
+            'CLOSED': 'lightgray',
+            'REOPENED': 'orange',
+        }
+
+        bottom = [0] * len(days)
+        for status, counts in status_data.items():
+            ax.bar(days, counts, label=status, bottom=bottom, color=colors.get(status, 'gray'))
+            bottom = [b + c for b, c in zip(bottom, counts)]
+
+        ax.set_xlabel('Day')
+        ax.set_ylabel('Number of Issues')
+        ax.set_title('Number of Issues per Day and Status in Week')
+        _rotate_xticklabels(ax)
+        ax.legend()
+
+        max_issues = max(sum(status_data[status]) for status in status_data)
+        ax.set_ylim(0, max(max_issues, 1) * 1.5)
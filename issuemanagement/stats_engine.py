@@ -0,0 +1,242 @@
+import datetime
+
+import numpy as np
+
+from issuemanagement.models import PRIORITIES, STATUSES
+from issuemanagement.rollup import GRANULARITIES
+
+# 담당자별 해결/미해결 차트에서 사용하는 구분
+FIXER_CATEGORIES = ['RESOLVED', 'CLOSED', 'OTHER']
+
+def _codes(values, categories):
+    """
+    문자열 목록을 범주 번호 배열로 바꾼다. 목록에 없는 값은 -1 이 된다.
+    범주가 int8 에 들어가면 (상태, 우선순위) int8, 아니면 (사용자 이름) int32 배열을 만든다.
+    """
+    lookup = {name: code for code, name in enumerate(categories)}
+    dtype = np.int8 if len(categories) <= np.iinfo(np.int8).max else np.int32
+    return np.fromiter((lookup.get(v, -1) for v in values), dtype=dtype, count=len(values))
+
+class StatisticsEngine:
+    """
+    프로젝트 이슈 스냅샷을 열 단위 NumPy 배열로 보관하고 통계를 벡터 연산으로 계산하는 클래스
+    """
+    def __init__(self, ids, titles, reported, status, priority, assignee, fixer,
+                 comment_counts=None, today=None):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.titles = list(titles)
+        self.days = self._parse_dates(reported)
+        self.status = _codes(status, STATUSES)
+        self.priority = _codes(priority, PRIORITIES)
+        # 사용자 이름은 한 번만 저장하고 배열에는 번호만 둔다. (-1 은 미지정)
+        self.usernames = sorted({name for name in list(assignee) + list(fixer) if name})
+        self.assignee = _codes(assignee, self.usernames)
+        self.fixer = _codes(fixer, self.usernames)
+        # 댓글 수를 모르면 None (댓글 수 차트는 계산할 수 없음)
+        self.comment_counts = (
+            None if comment_counts is None else np.asarray(comment_counts, dtype=np.int32)
+        )
+        self.today = np.datetime64(today or datetime.date.today(), 'D')
+
+    @staticmethod
+    def _parse_dates(reported):
+        """
+        'YYYY-MM-DDTHH:MM:SS' 문자열을 날짜 배열로 한 번에 변환한다. 날짜가 없으면 NaT 가 된다.
+        """
+        return np.array([d[:10] if d else 'NaT' for d in reported], dtype='datetime64[D]')
+
+    @classmethod
+    def from_issues(cls, issues, comment_counts=None, today=None):
+        """
+        API 가 반환한 이슈 JSON 목록으로 엔진을 만든다. comment_counts 는 이슈 ID -> 댓글 수.
+        """
+        return cls(
+            [i['id'] for i in issues],
+            [i.get('title') for i in issues],
+            [i.get('reportedDate') for i in issues],
+            [i.get('status') for i in issues],
+            [i.get('priority') for i in issues],
+            [i.get('assigneeUsername') for i in issues],
+            [i.get('fixerUsername') for i in issues],
+            None if comment_counts is None else [comment_counts.get(i['id'], 0) for i in issues],
+            today,
+        )
+
+    @classmethod
+    def from_mirror(cls, mirror, project_id, today=None):
+        """
+        로컬 미러에 저장된 프로젝트로 엔진을 만든다. (JSON 을 해석하지 않고 열을 바로 읽는다)
+        """
+        rows = mirror.get_issue_rows(project_id)
+        counts = mirror.get_comment_counts(project_id)
+        columns = list(zip(*rows)) if rows else [()] * 7
+        ids = columns[0]
+        return cls(*columns, [counts.get(i, 0) for i in ids], today)
+
+    def __len__(self):
+        return len(self.ids)
+
+    # --- 기간/단위 ---
+
+    @staticmethod
+    def _bucket(days, granularity):
+        """
+        날짜 배열을 주어진 단위의 구간 시작 날짜로 내린다.
+        """
+        if granularity == 'day':
+            return days
+        if granularity == 'week':
+            # 1970-01-01 은 목요일이므로 3 을 더해 월요일을 0 으로 맞춘다.
+            weekday = (days.astype(np.int64) + 3) % 7
+            return days - weekday.astype('timedelta64[D]')
+        months = days.astype('datetime64[M]')
+        if granularity == 'quarter':
+            months = months - (months.astype(np.int64) % 3).astype('timedelta64[M]')
+        return months.astype('datetime64[D]')
+
+    @staticmethod
+    def _label(bucket_start, granularity):
+        text = str(bucket_start)
+        if granularity == 'month':
+            return text[:7]
+        if granularity == 'quarter':
+            return f'{text[:4]}-Q{(int(text[5:7]) - 1) // 3 + 1}'
+        return text
+
+    def count_over_time(self, start, end, granularity='day', by=None, value=None):
+        """
+        [start, end] 기간의 이슈 수를 day/week/month/quarter 단위로 센다.
+        by 가 'status', 'priority', 'assignee', 'fixer' 이면 값별로 나누고, value 를 주면 그 값만 센다.
+        (담당자와 해결자는 기간 안에 한 번이라도 나온 사람만 결과에 넣는다)
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'지원하지 않는 단위입니다: {granularity}')
+        start = np.datetime64(start, 'D')
+        end = np.datetime64(end, 'D')
+        mask = (self.days >= start) & (self.days <= end)
+
+        categories = None
+        if by is not None:
+            codes, categories = self._dimension(by)
+            if value is not None:
+                mask &= codes == (categories.index(value) if value in categories else -2)
+                categories = None
+            else:
+                mask &= codes >= 0
+
+        buckets = np.unique(self._bucket(np.arange(start, end + 1), granularity))
+        index = np.searchsorted(buckets, self._bucket(self.days[mask], granularity))
+        labels = [self._label(b, granularity) for b in buckets]
+
+        if categories is None:
+            counts = np.bincount(index, minlength=len(buckets))
+            return dict(zip(labels, counts.tolist()))
+
+        flat = index * len(categories) + codes[mask]
+        grid = np.bincount(flat, minlength=len(buckets) * len(categories))
+        grid = grid.reshape(len(buckets), len(categories))
+        if by in ('assignee', 'fixer'):
+            present = np.flatnonzero(grid.sum(axis=0))
+            categories = [categories[i] for i in present]
+            grid = grid[:, present]
+        return {
+            label: dict(zip(categories, row.tolist())) for label, row in zip(labels, grid)
+        }
+
+    def _dimension(self, by):
+        """
+        나누어 셀 필드의 (범주 번호 배열, 범주 이름 목록) 을 반환한다.
+        """
+        if by == 'status':
+            return self.status, STATUSES
+        if by == 'priority':
+            return self.priority, PRIORITIES
+        if by == 'assignee':
+            return self.assignee, self.usernames
+        if by == 'fixer':
+            return self.fixer, self.usernames
+        raise ValueError(f'지원하지 않는 구분입니다: {by}')
+
+    def _this_week(self):
+        monday = self._bucket(np.array([self.today]), 'week')[0]
+        return monday, monday + np.timedelta64(6, 'D')
+
+    def _this_month(self):
+        first = self.today.astype('datetime64[M]')
+        return first.astype('datetime64[D]'), (first + 1).astype('datetime64[D]') - 1
+
+    # --- 기존 통계 엔드포인트와 같은 모양의 결과 ---
+
+    def issues_per_month(self):
+        months = self.days[~np.isnat(self.days)].astype('datetime64[M]')
+        values, counts = np.unique(months, return_counts=True)
+        return {str(m): int(c) for m, c in zip(values, counts)}
+
+    def issues_per_status(self):
+        counts = np.bincount(self.status[self.status >= 0], minlength=len(STATUSES))
+        return dict(zip(STATUSES, counts.tolist()))
+
+    def issues_per_fixer(self):
+        category = np.full(len(self.status), 2, dtype=np.int64)
+        category[self.status == STATUSES.index('RESOLVED')] = 0
+        category[self.status == STATUSES.index('CLOSED')] = 1
+        mask = self.fixer >= 0
+        flat = self.fixer[mask].astype(np.int64) * 3 + category[mask]
+        grid = np.bincount(flat, minlength=len(self.usernames) * 3).reshape(-1, 3)
+        return {
+            self.usernames[f]: dict(zip(FIXER_CATEGORIES, grid[f].tolist()))
+            for f in np.flatnonzero(grid.sum(axis=1))
+        }
+
+    def issues_per_day_and_status_in_week(self, status=None):
+        start, end = self._this_week()
+        if status is None:
+            return self.count_over_time(start, end, 'day', by='status')
+        return self.count_over_time(start, end, 'day', by='status', value=status)
+
+    def issues_order_by_comments(self, top=3):
+        if self.comment_counts is None:
+            return None
+        order = np.argsort(-self.comment_counts, kind='stable')[:top]
+        return {self.titles[i]: int(self.comment_counts[i]) for i in order}
+
+    def issues_per_day_in_month(self):
+        start, end = self._this_month()
+        return self.count_over_time(start, end, 'day')
+
+    def issues_per_day_and_priority_in_week(self, priority):
+        start, end = self._this_week()
+        return self.count_over_time(start, end, 'day', by='priority', value=priority)
+
+    def issues_per_priority_in_month(self):
+        start, end = self._this_month()
+        mask = (self.days >= start) & (self.days <= end) & (self.priority >= 0)
+        counts = np.bincount(self.priority[mask], minlength=len(PRIORITIES))
+        return dict(zip(PRIORITIES, counts.tolist()))
+
+    def compute(self, endpoint):
+        """
+        '/statistics/<endpoint>' 와 같은 이름으로 통계를 계산한다. 계산할 수 없으면 None 을 반환한다.
+        """
+        name, _, argument = endpoint.partition('/')
+        if name == 'issuesPerMonth':
+            return self.issues_per_month()
+        if name == 'issuesPerStatus':
+            return self.issues_per_status()
+        if name == 'issuesPerFixer':
+            return self.issues_per_fixer()
+        if name == 'issuesPerDayAndStatusInWeek':
+            if argument and argument not in STATUSES:
+                return None
+            return self.issues_per_day_and_status_in_week(argument or None)
+        if name == 'issuesOrderByComments':
+            return self.issues_order_by_comments()
+        if name == 'issuesPerDayInMonth':
+            return self.issues_per_day_in_month()
+        if name == 'issuesPerDayAndPriorityInWeek':
+            if argument not in PRIORITIES:
+                return None
+            return self.issues_per_day_and_priority_in_week(argument)
+        if name == 'issuesPerPriorityInMonth':
+            return self.issues_per_priority_in_month()
+        return None
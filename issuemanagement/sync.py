@@ -0,0 +1,170 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from issuemanagement.cache import response_validators
+from issuemanagement.jsonstream import iter_response_array
+from issuemanagement.mirror import content_hash
+
+class SyncManager:
+    """
+    서버의 프로젝트, 이슈, 댓글을 로컬 미러와 동기화하는 클래스
+    """
+    def __init__(self, base_url, session, max_workers=8):
+        self.base_url = base_url
+        self.session = session
+        # 댓글을 동시에 받아올 때 사용할 최대 스레드 수
+        self.max_workers = max_workers
+        self.last_result = None
+        self._threads = {}
+
+    def sync_project(self, project_id, with_comments=True, batch_size=500):
+        """
+        프로젝트의 이슈와 댓글을 동기화한다.
+        처음에는 전체를 받아오고, 이후에는 새로 생기거나 바뀐 이슈만 기록하고 그 댓글만 다시 받는다.
+        with_comments=True 로 처음 동기화할 때만 모든 이슈의 댓글을 받는다.
+        이슈 목록은 스트리밍으로 읽어 배치 단위로 저장하고, 지난 목록의 검증 헤더로 조건부 GET 을 보내
+        서버가 304 를 주면 이슈는 바뀌지 않은 것으로 본다.
+        댓글을 받지 못한 이슈는 동기화 상태에 남겨 다음 동기화에서 다시 받는다.
+        """
+        mirror = self.session.mirror
+        first_sync = not mirror.has_project(project_id)
+
+        response = self.session.transport.get(
+            f'{self.base_url}/projects/{project_id}/issues',
+            headers={} if first_sync else mirror.get_list_validators(project_id),
+            stream=True,
+        )
+        if response.status_code == 304:
+            response.close()
+            list_validators = mirror.get_list_validators(project_id)
+            new_ids, changed_ids, deleted_ids = [], [], set()
+            listed_ids = None
+        elif response.status_code == 200:
+            list_validators = response_validators(response)
+            try:
+                listed_ids, new_ids, changed_ids = self._save_listed_issues(
+                    project_id, iter_response_array(response), batch_size
+                )
+            except (ValueError, requests.RequestException):
+                # 목록을 끝까지 받지 못하면 지워진 이슈를 알 수 없으므로 여기서 멈춘다.
+                return None
+            deleted_ids = set(mirror.get_issue_hashes(project_id)) - set(listed_ids)
+            mirror.delete_issues(project_id, deleted_ids)
+        else:
+            response.close()
+            return None
+
+        # 지난 동기화에서 댓글을 받지 못한 이슈는 바뀌지 않았더라도 다시 받는다.
+        failed_comments = mirror.get_failed_comments(project_id) - deleted_ids
+        comments_synced = mirror.comments_synced(project_id)
+        pending_comments = set()
+        if with_comments:
+            if comments_synced:
+                targets = new_ids + changed_ids
+            else:
+                # 댓글을 처음 받을 때는 프로젝트의 모든 이슈에서 받는다.
+                targets = listed_ids if listed_ids is not None else sorted(mirror.get_issue_hashes(project_id))
+            target_ids = list(dict.fromkeys(targets + sorted(failed_comments)))
+            failed_comments = set(self._sync_comments(project_id, target_ids))
+            comments_synced = True
+        elif comments_synced:
+            # 댓글 없이 동기화할 때는 새로 생기거나 바뀐 이슈를 남겨 두었다가 다음 댓글 동기화에서 받는다.
+            pending_comments = set(new_ids + changed_ids)
+
+        mirror.set_sync_state(
+            project_id,
+            datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            failed_comments | pending_comments,
+            list_validators,
+            comments_synced,
+        )
+        self.last_result = {
+            "projectId": project_id,
+            "new": len(new_ids),
+            "changed": len(changed_ids),
+            "deleted": len(deleted_ids),
+            "failedComments": len(failed_comments) if with_comments else 0,
+        }
+        return self.last_result
+
+    def _save_listed_issues(self, project_id, issues, batch_size):
+        """
+        스트리밍으로 받은 이슈를 저장된 내용 해시와 비교해 새로 생기거나 바뀐 이슈만 배치 단위로 저장한다.
+        (목록의 이슈 ID, 새 이슈 ID, 바뀐 이슈 ID) 를 반환한다.
+        """
+        mirror = self.session.mirror
+        stored = mirror.get_issue_hashes(project_id)
+        listed_ids, new_ids, changed_ids = [], [], []
+        batch = []
+        for issue in issues:
+            listed_ids.append(issue['id'])
+            stored_hash = stored.get(issue['id'])
+            if stored_hash is None:
+                new_ids.append(issue['id'])
+            elif stored_hash != content_hash(issue):
+                changed_ids.append(issue['id'])
+            else:
+                continue
+            batch.append(issue)
+            if len(batch) >= batch_size:
+                mirror.save_issues(project_id, batch)
+                batch = []
+        if batch:
+            mirror.save_issues(project_id, batch)
+        return listed_ids, new_ids, changed_ids
+
+    def sync_comments(self, project_id, issue_id):
+        """
+        이슈 하나의 댓글을 동기화한다. 댓글을 받아 저장했으면 True 를 반환한다.
+        """
+        response = self.session.transport.get(
+            f"{self.base_url}/projects/{project_id}/issues/{issue_id}/comments"
+        )
+        if response.status_code != 200:
+            return False
+        try:
+            comments = response.json()
+        except ValueError:
+            return False
+        self.session.mirror.save_comments(project_id, issue_id, comments)
+        return True
+
+    def _sync_comments(self, project_id, issue_ids):
+        """
+        여러 이슈의 댓글을 동시에 동기화하고 댓글을 받지 못한 이슈 ID 목록을 반환한다.
+        """
+        if not issue_ids:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lambda issue_id: self.sync_comments(project_id, issue_id), issue_ids)
+            return [issue_id for issue_id, saved in zip(issue_ids, results) if not saved]
+
+    def start_background_sync(self, project_id):
+        """
+        메뉴를 막지 않도록 별도 스레드에서 프로젝트를 동기화한다.
+        이슈 하나마다 요청이 필요한 첫 전체 댓글 동기화는 하지 않고, 댓글을 한 번 받은 프로젝트만 바뀐 이슈의 댓글을 받는다.
+        """
+        thread = self._threads.get(project_id)
+        if thread is not None and thread.is_alive():
+            return thread
+        thread = threading.Thread(
+            target=self._background_sync, args=(project_id,), daemon=True
+        )
+        self._threads[project_id] = thread
+        thread.start()
+        return thread
+
+    def _background_sync(self, project_id):
+        try:
+            result = self.sync_project(
+                project_id, with_comments=self.session.mirror.comments_synced(project_id)
+            )
+        except Exception as error:
+            # 메뉴 스레드를 막지 않도록 실패는 결과로 남기고 다음 동기화 때 다시 시도한다.
+            self.last_result = {"projectId": project_id, "error": f'{error.__class__.__name__}: {error}'}
+            return
+        if result is None:
+            self.last_result = {"projectId": project_id, "error": "이슈 목록을 받지 못했습니다."}
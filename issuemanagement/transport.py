@@ -0,0 +1,161 @@
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from issuemanagement.resilience import (
+    TIMEOUTS, UNAVAILABLE_HEADER, CircuitBreaker, RetryPolicy, endpoint_class, unavailable_response,
+)
+
+class Transport:
+    """
+    모든 관리자가 공유하는 HTTP 전송 계층. 연결 풀을 유지하여 세션 동안 연결을 재사용한다.
+    모든 요청에 제한 시간을 두고, GET 은 실패하면 다시 시도하며, 서버 장애가 이어지면 회로 차단기로 바로 실패시킨다.
+    """
+    def __init__(self, pool_connections=4, pool_maxsize=10, pool_block=False, cache=None,
+                 timeouts=None, retry=None, breaker=None, metrics=None):
+        # keep-alive 연결을 유지하는 requests 세션
+        self.http = requests.Session()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        # pool_connections: 캐시할 호스트별 풀 수, pool_maxsize: 호스트당 최대 연결 수
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        # 이슈/댓글 조회용 응답 캐시 (None 이면 캐시하지 않음)
+        self.cache = cache
+        # 엔드포인트 종류별 (연결, 읽기) 제한 시간
+        self.timeouts = dict(TIMEOUTS, **(timeouts or {}))
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        # 엔드포인트별 요청 지표 (None 이면 기록하지 않음)
+        self.metrics = metrics
+
+    def set_headers(self, headers):
+        """
+        이후 모든 요청에 적용할 인증 헤더를 설정한다.
+        """
+        self.http.headers.pop('Cookie', None)
+        # 로그인 응답으로 쌓인 쿠키는 헤더로 대신 전달하므로 비운다.
+        self.http.cookies.clear()
+        self.http.headers.update(headers)
+        # 사용자가 바뀌면 이전 사용자의 권한으로 받은 응답을 재사용하지 않는다.
+        if self.cache is not None:
+            self.cache.clear()
+
+    def request(self, method, url, **kwargs):
+        """
+        연결 풀을 통해 HTTP 요청을 보낸다.
+        GET 은 연결 실패, 시간 초과, 일시적인 서버 오류(502/503/504)에 지터를 둔 지수 백오프로 다시 시도한다.
+        GET 이 끝내 서버에 닿지 못하거나 회로가 열려 있으면 예외 대신 503 응답을 반환한다.
+        다른 메서드는 서버에 반영되었는지 알 수 없으므로 다시 시도하지 않고 예외를 그대로 전달한다.
+        """
+        if not self.breaker.allow():
+            if self.metrics is not None:
+                self.metrics.record(method, url, 'circuit-open', 0.0)
+            return unavailable_response(method, url, 'circuit-open')
+        kwargs.setdefault('timeout', self.timeouts[endpoint_class(url)])
+        retries = self.retry.max_retries if method == 'GET' else 0
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.http.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                reason = 'timeout' if isinstance(error, requests.Timeout) else 'connection'
+                if self.metrics is not None:
+                    self.metrics.record(method, url, reason, time.perf_counter() - started)
+                if attempt < retries:
+                    time.sleep(self.retry.delay(attempt))
+                    attempt += 1
+                    continue
+                self.breaker.record_failure()
+                if method != 'GET':
+                    raise
+                return unavailable_response(method, url, reason)
+            except requests.RequestException:
+                self.breaker.record_failure()
+                raise
+            if self.metrics is not None:
+                self._record(method, url, response, time.perf_counter() - started)
+            if response.status_code in self.retry.statuses and attempt < retries:
+                delay = self.retry.delay(attempt, response)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+            break
+
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        if (
+            method != 'GET'
+            and self.cache is not None
+            and 200 <= response.status_code < 300
+        ):
+            self.cache.invalidate_for_write(method, url)
+        return response
+
+    def _record(self, method, url, response, elapsed):
+        """
+        응답 하나를 지표에 기록한다. 스트리밍 응답은 헤더를 받을 때까지의 시간과 Content-Length 를 기록한다.
+        """
+        body = response.request.body if response.request is not None else None
+        received = response.headers.get('Content-Length')
+        if received is not None and received.isdigit():
+            received = int(received)
+        elif response._content_consumed and response._content:
+            received = len(response._content)
+        else:
+            received = 0
+        self.metrics.record(method, url, response.status_code, elapsed, len(body) if body else 0, received)
+
+    def get(self, url, cache=False, revalidate=False, **kwargs):
+        """
+        GET 요청을 보낸다. cache=True 이면 캐시를 먼저 확인하고 필요할 때만 조건부 GET 을 보낸다.
+        revalidate=True 이면 유효 시간 안의 항목도 항상 서버에 조건부 GET 으로 확인하고,
+        서버에 닿지 못해도 오래된 응답을 대신 쓰지 않는다. 읽은 값을 다시 쓰는 곳에서 사용한다.
+        """
+        if not cache or self.cache is None:
+            return self.request('GET', url, **kwargs)
+
+        key = self.cache.make_key(url, kwargs.get('params'))
+        entry = self.cache.lookup(key)
+        if entry is not None and not revalidate and self.cache.is_fresh(entry):
+            return entry.response
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            headers.update(entry.validators())
+        response = self.request('GET', url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidated(key)
+            return entry.response
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        elif UNAVAILABLE_HEADER in response.headers and entry is not None and not revalidate:
+            # 서버에 닿지 못하면 유효 시간이 지났더라도 캐시된 응답을 대신 사용한다.
+            return entry.response
+        return response
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self):
+        """
+        풀에 남아있는 연결을 모두 닫는다.
+        """
+        self.http.close()
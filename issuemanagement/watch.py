@@ -0,0 +1,324 @@
+import datetime
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from issuemanagement.mirror import content_hash
+
+# 폴링 간격(초). 바뀐 것이 없으면 GROWTH 배씩 늘려 MAX_INTERVAL 까지 늦추고, 변경이 보이면 MIN_INTERVAL 로 되돌린다.
+MIN_INTERVAL = 2.0
+MAX_INTERVAL = 60.0
+GROWTH = 1.5
+# 상태 변화를 알려줄 이슈 필드
+TRACKED_FIELDS = ('status', 'assigneeUsername', 'priority')
+# 프로젝트를 지켜볼 때 댓글까지 따라갈 최근 변경 이슈 수 (폴링마다 이슈당 요청 하나)
+MAX_FOLLOWED = 20
+# 조건부 요청 결과, 지난번과 같은 응답이면 NOT_MODIFIED 를 돌려준다.
+NOT_MODIFIED = object()
+
+class AdaptiveInterval:
+    """
+    변경 빈도에 맞춰 폴링 간격을 조절하는 클래스.
+    """
+    def __init__(self, minimum=MIN_INTERVAL, maximum=MAX_INTERVAL, growth=GROWTH):
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.growth = growth
+        self.current = minimum
+
+    def next(self, changed=False, failed=False):
+        """
+        이번 폴링 결과에 따라 다음 폴링까지 기다릴 시간을 반환한다. 실패하면 두 배로 늦춘다.
+        """
+        if changed:
+            self.current = self.minimum
+        else:
+            self.current = min(self.maximum, self.current * (2 if failed else self.growth))
+        return self.current
+
+class ConditionalFetcher:
+    """
+    URL 별로 마지막 응답의 검증 헤더(ETag / Last-Modified)와 본문 다이제스트를 기억해 두고 조건부 GET 을 보내는 클래스.
+    서버가 304 를 주거나 본문이 지난번과 같으면 JSON 을 디코딩하지 않는다.
+    공유 응답 캐시와 별개로 동작하므로 지켜보는 동안 다른 화면의 캐시 항목을 밀어내지 않는다.
+    """
+    def __init__(self, transport):
+        self.transport = transport
+        # URL -> (검증 헤더, 본문 다이제스트)
+        self.validators = {}
+        # 보낸 요청 수, 304 응답 수, 받은 본문 바이트 수
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+
+    def fetch(self, url):
+        """
+        (상태 코드, 데이터) 를 반환한다. 바뀌지 않았으면 데이터는 NOT_MODIFIED, 실패하면 None 이다.
+        """
+        headers, digest = self.validators.get(url, ({}, None))
+        response = self.transport.request('GET', url, headers=headers)
+        self.requests += 1
+        if response.status_code == 304:
+            self.not_modified += 1
+            return 304, NOT_MODIFIED
+        if response.status_code != 200:
+            return response.status_code, None
+        body = response.content
+        self.bytes_received += len(body)
+        fresh = hashlib.blake2b(body, digest_size=16).digest()
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        self.validators[url] = (validators, fresh)
+        if fresh == digest:
+            return 200, NOT_MODIFIED
+        return 200, json.loads(body)
+
+    def forget(self, url):
+        self.validators.pop(url, None)
+
+def issue_snapshot(issues):
+    """
+    이슈 목록을 {ID: (내용 해시, 추적 필드 값, 제목)} 으로 줄인다.
+    """
+    return {
+        issue['id']: (
+            content_hash(issue), tuple(issue.get(field) for field in TRACKED_FIELDS), issue.get('title'),
+        )
+        for issue in issues
+    }
+
+def comment_snapshot(comments):
+    """
+    댓글 목록을 {ID: 내용 해시} 로 줄인다.
+    """
+    return {comment['id']: content_hash(comment) for comment in comments}
+
+class Watcher:
+    """
+    프로젝트나 이슈 하나의 이전 스냅숏을 들고 있다가 폴링할 때마다 바뀐 것만 이벤트로 만드는 클래스.
+    이벤트는 {"type", "at", "projectId", "issueId", ...} 사전이고 type 은 다음 중 하나이다.
+    issue.new, issue.changed (changes: {필드: [이전, 이후]}), issue.edited (추적 필드 외의 내용 변경), issue.deleted,
+    comment.new, comment.edited, comment.deleted
+    """
+    def __init__(self, base_url, session, project_id, issue_id=None, max_followed=MAX_FOLLOWED):
+        self.base_url = base_url
+        self.session = session
+        self.project_id = project_id
+        self.issue_id = issue_id
+        self.max_followed = max_followed
+        self.fetcher = ConditionalFetcher(session.transport)
+        # 이슈 ID -> (내용 해시, 추적 필드 값, 제목). 첫 폴링 전에는 None
+        self.issues = None
+        # 댓글을 따라가는 이슈 ID -> {댓글 ID: 내용 해시} (오래된 것부터)
+        self.comments = OrderedDict()
+        if issue_id is not None:
+            self.comments[issue_id] = None
+
+    def _issue_url(self):
+        if self.issue_id is None:
+            return f'{self.base_url}/projects/{self.project_id}/issues'
+        return f'{self.base_url}/projects/{self.project_id}/issues/{self.issue_id}'
+
+    def _comments_url(self, issue_id):
+        return f'{self.base_url}/projects/{self.project_id}/issues/{issue_id}/comments'
+
+    def _mirror(self):
+        """
+        프로젝트가 로컬 미러에 동기화되어 있으면 미러를, 아니면 None 을 반환한다.
+        """
+        mirror = self.session.mirror
+        if mirror is not None and mirror.has_project(self.project_id):
+            return mirror
+        return None
+
+    def _event(self, kind, issue_id, **fields):
+        return {
+            "type": kind,
+            "at": datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+            "projectId": self.project_id,
+            "issueId": issue_id,
+            **fields,
+        }
+
+    @property
+    def finished(self):
+        """
+        이슈 하나를 지켜보다 그 이슈가 삭제되었으면 True.
+        """
+        return self.issue_id is not None and self.issue_id not in self.comments
+
+    def poll(self):
+        """
+        한 번 폴링해 바뀐 것의 이벤트 목록을 반환한다. 첫 폴링은 기준 스냅숏만 만들고 빈 목록을 반환한다.
+        이슈 목록을 받아오지 못하면 None 을 반환한다.
+        """
+        status, data = self.fetcher.fetch(self._issue_url())
+        if self.issue_id is not None and status == 404 and self.issues:
+            data = []
+        elif data is None:
+            return None
+        events = []
+        if data is not NOT_MODIFIED:
+            issues = data if self.issue_id is None else ([data] if isinstance(data, dict) else data)
+            events.extend(self._diff_issues(issues))
+        for issue_id in list(self.comments):
+            events.extend(self._poll_comments(issue_id))
+        return events
+
+    def _diff_issues(self, issues):
+        fresh = issue_snapshot(issues)
+        previous, self.issues = self.issues, fresh
+        if previous is None:
+            return []
+        events = []
+        changed = []
+        for issue in issues:
+            issue_id = issue['id']
+            old = previous.get(issue_id)
+            new = fresh[issue_id]
+            if old is None:
+                events.append(self._event('issue.new', issue_id, issue=issue))
+            elif old[0] == new[0]:
+                continue
+            elif old[1] != new[1]:
+                changes = {
+                    field: [before, after]
+                    for field, before, after in zip(TRACKED_FIELDS, old[1], new[1])
+                    if before != after
+                }
+                events.append(self._event('issue.changed', issue_id, title=new[2], changes=changes))
+            else:
+                events.append(self._event('issue.edited', issue_id, issue=issue))
+            changed.append(issue)
+            self._follow(issue_id, new=old is None)
+        deleted = previous.keys() - fresh.keys()
+        for issue_id in sorted(deleted):
+            events.append(self._event('issue.deleted', issue_id, title=previous[issue_id][2]))
+            self.comments.pop(issue_id, None)
+            self.fetcher.forget(self._comments_url(issue_id))
+
+        mirror = self._mirror()
+        if mirror is not None:
+            # 미러를 갱신해 두면 검색 색인과 중복 색인도 바뀐 이슈만 다시 색인한다.
+            mirror.save_issues(self.project_id, changed)
+            mirror.delete_issues(self.project_id, deleted)
+        return events
+
+    def _follow(self, issue_id, new):
+        """
+        바뀐 이슈의 댓글을 따라가기 시작한다. 새 이슈는 빈 목록을, 기존 이슈는 미러의 댓글(없으면 다음 응답)을 기준으로 삼는다.
+        """
+        if issue_id in self.comments:
+            self.comments.move_to_end(issue_id)
+            return
+        baseline = {} if new else None
+        mirror = self._mirror()
+        if baseline is None and mirror is not None:
+            baseline = comment_snapshot(mirror.get_comments(self.project_id, issue_id)) or None
+        self.comments[issue_id] = baseline
+        while len(self.comments) > self.max_followed:
+            dropped, _ = self.comments.popitem(last=False)
+            self.fetcher.forget(self._comments_url(dropped))
+
+    def _poll_comments(self, issue_id):
+        status, data = self.fetcher.fetch(self._comments_url(issue_id))
+        if data is None or data is NOT_MODIFIED:
+            return []
+        fresh = comment_snapshot(data)
+        previous, self.comments[issue_id] = self.comments[issue_id], fresh
+        if previous is None or previous == fresh:
+            return []
+        events = []
+        for comment in data:
+            old = previous.get(comment['id'])
+            if old is None:
+                events.append(self._event('comment.new', issue_id, comment=comment))
+            elif old != fresh[comment['id']]:
+                events.append(self._event('comment.edited', issue_id, comment=comment))
+        for comment_id in sorted(previous.keys() - fresh.keys()):
+            events.append(self._event('comment.deleted', issue_id, commentId=comment_id))
+        mirror = self._mirror()
+        if mirror is not None:
+            mirror.save_comments(self.project_id, issue_id, data)
+        return events
+
+def format_event(event):
+    """
+    화면에 표시할 이벤트 한 줄을 만든다.
+    """
+    kind = event["type"]
+    prefix = f"[{event['at'][11:]}] 이슈 #{event['issueId']}"
+    if kind == 'issue.new':
+        issue = event["issue"]
+        return f"{prefix} 새 이슈: {issue.get('title')} ({issue.get('status')}, {issue.get('priority')})"
+    if kind == 'issue.changed':
+        labels = {'status': '상태', 'assigneeUsername': '담당자', 'priority': '우선순위'}
+        changes = ', '.join(
+            f"{labels[field]} {before or '미지정'} → {after or '미지정'}"
+            for field, (before, after) in event["changes"].items()
+        )
+        return f"{prefix} {event['title']}: {changes}"
+    if kind == 'issue.edited':
+        return f"{prefix} 내용 수정: {event['issue'].get('title')}"
+    if kind == 'issue.deleted':
+        return f"{prefix} 삭제됨: {event['title']}"
+    if kind == 'comment.deleted':
+        return f"{prefix} 댓글 {event['commentId']} 삭제됨"
+    comment = event["comment"]
+    action = '새 댓글' if kind == 'comment.new' else '댓글 수정'
+    return f"{prefix} {action} ({comment.get('username')}): {comment.get('content')}"
+
+class WatchManager:
+    """
+    프로젝트나 이슈 하나의 변경 사항을 적응형 간격으로 폴링해 바뀐 것만 보여주는 클래스.
+    서버가 ETag/Last-Modified 를 주면 바뀌지 않은 목록은 본문 없이 304 로 확인한다.
+    """
+    def __init__(self, base_url, session, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+        self.base_url = base_url
+        self.session = session
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        # 마지막으로 사용한 Watcher (요청 수와 받은 바이트 수 확인용)
+        self.watcher = None
+
+    def iter_changes(self, project_id, issue_id=None, stop_event=None, max_polls=None):
+        """
+        변경 이벤트를 생기는 대로 내보내는 반복자를 반환한다.
+        stop_event 가 설정되거나 max_polls 번 폴링하거나 지켜보던 이슈가 삭제되면 끝난다.
+        """
+        watcher = self.watcher = Watcher(self.base_url, self.session, project_id, issue_id)
+        interval = AdaptiveInterval(self.min_interval, self.max_interval)
+        stop_event = stop_event or threading.Event()
+        polls = 0
+        while True:
+            events = watcher.poll()
+            if events:
+                yield from events
+            polls += 1
+            if watcher.finished or (max_polls is not None and polls >= max_polls):
+                return
+            if stop_event.wait(interval.next(changed=bool(events), failed=events is None)):
+                return
+
+    def watch_screen(self, project_id, issue_id=None):
+        """
+        Ctrl+C 를 누를 때까지 변경 사항을 출력하는 화면
+        """
+        target = f"이슈 #{issue_id}" if issue_id is not None else f"프로젝트 {project_id}"
+        print(f"\n--- {target} 변경 사항 지켜보기 (Ctrl+C 로 중단) ---")
+        changes = 0
+        try:
+            for event in self.iter_changes(project_id, issue_id):
+                print(format_event(event))
+                changes += 1
+        except KeyboardInterrupt:
+            pass
+        fetcher = self.watcher.fetcher
+        print(
+            f"\n변경 {changes}건, 요청 {fetcher.requests}회 (변경 없음 {fetcher.not_modified}회), "
+            f"받은 데이터 {fetcher.bytes_received / 1024:.1f}KB"
+        )
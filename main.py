@@ -1,29 +1,113 @@
+import importlib
 import os
+import sys
 
 from issuemanagement.auth import AuthManager
-from issuemanagement.project import ProjectManager
-from issuemanagement.issue import IssueManager
-from issuemanagement.comment import CommentManager
-from issuemanagement.statistics import StatisticsManager
-from issuemanagement.recommendation import RecommendationManager
 
 # API 기본 URL 설정
 API_BASE_URL = 'https://swe.mldljyh.tech/api'  
 
+# 연결 풀 설정 (호스트별 풀 수, 호스트당 최대 연결 수)
+POOL_CONNECTIONS = int(os.environ.get('ISSUE_CONSOLE_POOL_CONNECTIONS', 4))
+POOL_MAXSIZE = int(os.environ.get('ISSUE_CONSOLE_POOL_MAXSIZE', 20))
+
+# 이슈/댓글 응답 캐시 설정 (유효 시간(초), 최대 항목 수)
+CACHE_TTL = float(os.environ.get('ISSUE_CONSOLE_CACHE_TTL', 10))
+CACHE_SIZE = int(os.environ.get('ISSUE_CONSOLE_CACHE_SIZE', 256))
+
+# 장애 대응 설정 (GET 재시도 횟수, 회로를 여는 연속 실패 수, 회로를 연 뒤 다시 시험하기까지의 시간(초))
+MAX_RETRIES = int(os.environ.get('ISSUE_CONSOLE_MAX_RETRIES', 3))
+BREAKER_THRESHOLD = int(os.environ.get('ISSUE_CONSOLE_BREAKER_THRESHOLD', 5))
+BREAKER_RESET = float(os.environ.get('ISSUE_CONSOLE_BREAKER_RESET', 30))
+
+# 요청/응답 카세트 (경로, 모드: record 는 기록, replay 는 서버 없이 재생). 경로가 비어 있으면 사용하지 않는다.
+CASSETTE_PATH = os.environ.get('ISSUE_CONSOLE_CASSETTE', '')
+CASSETTE_MODE = os.environ.get('ISSUE_CONSOLE_CASSETTE_MODE', 'replay')
+
+# 로컬 SQLite 미러 경로 (빈 문자열이면 미러를 사용하지 않음)
+MIRROR_PATH = os.environ.get(
+    'ISSUE_CONSOLE_MIRROR', os.path.join(os.path.expanduser('~'), '.issue_console', 'mirror.db')
+)
+
+# 세션 속성 이름 -> (모듈, 클래스). 관리자는 처음 사용할 때 모듈을 불러와 만든다.
+MANAGERS = {
+    'auth_manager': ('issuemanagement.auth', 'AuthManager'),
+    'project_manager': ('issuemanagement.project', 'ProjectManager'),
+    'issue_manager': ('issuemanagement.issue', 'IssueManager'),
+    'comment_manager': ('issuemanagement.comment', 'CommentManager'),
+    'statistics_manager': ('issuemanagement.statistics', 'StatisticsManager'),
+    'recommendation_manager': ('issuemanagement.recommendation', 'RecommendationManager'),
+    'sync_manager': ('issuemanagement.sync', 'SyncManager'),
+    'report_manager': ('issuemanagement.report', 'ReportManager'),
+    'import_manager': ('issuemanagement.bulk_import', 'ImportManager'),
+    'bulk_edit_manager': ('issuemanagement.bulk_edit', 'BulkEditManager'),
+    'async_client': ('issuemanagement.async_client', 'AsyncClient'),
+    'global_search_manager': ('issuemanagement.global_search', 'GlobalSearchManager'),
+    'watch_manager': ('issuemanagement.watch', 'WatchManager'),
+    'export_manager': ('issuemanagement.export', 'ExportManager'),
+}
+
 class Session:
     """
     사용자 세션을 나타내는 클래스. 쿠키, 인증 관리자 및 기타 관리자 인스턴스를 저장한다.
+    관리자, 연결 풀, 로컬 미러는 시작 시간을 줄이기 위해 처음 사용할 때 만든다.
     """
     def __init__(self, cookies=None):
         # 사용자 세션 쿠키
         self.cookies = cookies
-        # API 호출에 사용될 헤더
-        self.auth_manager = AuthManager(API_BASE_URL, self)
-        self.project_manager = ProjectManager(API_BASE_URL, self)
-        self.issue_manager = IssueManager(API_BASE_URL, self)
-        self.comment_manager = CommentManager(API_BASE_URL, self)
-        self.statistics_manager = StatisticsManager(API_BASE_URL, self)
-        self.recommendation_manager = RecommendationManager(API_BASE_URL, self)
+
+    def __getattr__(self, name):
+        """
+        아직 만들어지지 않은 관리자, 연결 풀(transport), 미러(mirror)를 만들어 반환한다.
+        """
+        if name == 'transport':
+            # 세션 동안 모든 관리자가 공유하는 연결 풀
+            from issuemanagement.cache import ResponseCache
+            from issuemanagement.metrics import Metrics
+            from issuemanagement.resilience import CircuitBreaker, RetryPolicy
+            from issuemanagement.transport import Transport
+            value = Transport(
+                POOL_CONNECTIONS, POOL_MAXSIZE, cache=ResponseCache(CACHE_TTL, CACHE_SIZE),
+                retry=RetryPolicy(MAX_RETRIES),
+                breaker=CircuitBreaker(BREAKER_THRESHOLD, BREAKER_RESET),
+                metrics=Metrics(),
+            )
+            if CASSETTE_PATH:
+                from issuemanagement.cassette import use_cassette
+                use_cassette(value, CASSETTE_PATH, CASSETTE_MODE)
+            value.set_headers(self.get_headers())
+        elif name == 'mirror':
+            # 프로젝트/이슈/댓글의 로컬 미러
+            from issuemanagement.mirror import MirrorStore
+            value = MirrorStore(MIRROR_PATH) if MIRROR_PATH else None
+        elif name in MANAGERS:
+            module_name, class_name = MANAGERS[name]
+            manager_class = getattr(importlib.import_module(module_name), class_name)
+            value = manager_class(API_BASE_URL, self)
+        else:
+            raise AttributeError(name)
+        setattr(self, name, value)
+        return value
+
+    @property
+    def cookies(self):
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, cookies):
+        # 쿠키가 바뀔 때 한 번만 전송 계층의 인증 헤더를 갱신한다.
+        self._cookies = cookies
+        if 'transport' in self.__dict__:
+            self.transport.set_headers(self.get_headers())
+
+    def close(self):
+        """
+        세션에서 만들어진 연결 풀과 미러를 닫는다.
+        """
+        if 'transport' in self.__dict__:
+            self.transport.close()
+        if self.__dict__.get('mirror') is not None:
+            self.mirror.close()
 
     def get_headers(self):
         """
@@ -115,15 +199,31 @@ def project_screen(session, project_id):
     """
     선택한 프로젝트 내에서 이슈를 관리하는 화면
     """
+    if session.mirror is not None:
+        # 메뉴는 로컬 미러를 읽고, 최신화는 백그라운드에서 진행한다.
+        # (처음 모든 이슈의 댓글을 받는 동기화는 7번 메뉴에서 직접 실행한다)
+        session.sync_manager.start_background_sync(project_id)
     while True:
         clear_console()
         print("\n--- 프로젝트 화면 ---")
+        last_result = session.sync_manager.last_result if session.mirror is not None else None
+        if last_result and last_result.get("projectId") == project_id and "error" in last_result:
+            print(f"(백그라운드 동기화 실패: {last_result['error']})")
         print("1. 이슈 목록보기")
         print("2. 이슈 등록")
         print("3. 이슈 탐색 및 검색")
         print("4. 이슈 자연어 검색")
-        print("5. 이슈 통계 분석")
-        print("6. 돌아가기")
+        print("5. 이슈 자연어 검색 (서버)")
+        print("6. 이슈 통계 분석")
+        print("7. 로컬 미러 동기화 (댓글 포함)")
+        print("8. 이슈 일괄 가져오기 (CSV/JSONL)")
+        print("9. 이슈 일괄 수정")
+        print("10. 이슈 상세+댓글 내보내기 (JSONL)")
+        print("11. 미배정 이슈 담당자 일괄 추천 (로컬)")
+        print("12. 중복 이슈 보고서")
+        print("13. 변경 사항 지켜보기")
+        print("14. 분석용 내보내기 (압축 JSONL + 열 파일)")
+        print("15. 돌아가기")
         choice = input("원하는 기능을 선택하세요: ")
 
         if choice == '1':
@@ -139,6 +239,9 @@ def project_screen(session, project_id):
                     elif choice == '5':
                         session.recommendation_manager.recommend_assignee(project_id, issue_id)
                     elif choice == '6':
+                        session.watch_manager.watch_screen(project_id, issue_id)
+                        input("계속하려면 Enter 를 누르세요.")
+                    elif choice == '7':
                         break
                     else:
                         print("잘못된 입력입니다.")
@@ -150,13 +253,71 @@ def project_screen(session, project_id):
         elif choice == '4':
             session.issue_manager.search_issuesbyNL(project_id)
         elif choice == '5':
-            session.statistics_manager.analyze_issue_statistics(project_id)
+            session.issue_manager.search_issuesbyNL(project_id, use_server=True)
         elif choice == '6':
+            session.statistics_manager.analyze_issue_statistics(project_id)
+        elif choice == '7':
+            result = None
+            if session.mirror is None:
+                print("로컬 미러가 비활성화되어 있습니다.")
+            else:
+                result = session.sync_manager.sync_project(project_id)
+            if result:
+                print(
+                    f"동기화 완료: 새 이슈 {result['new']}개, 변경 {result['changed']}개, 삭제 {result['deleted']}개"
+                )
+                if result['failedComments']:
+                    print(f"댓글을 불러오지 못한 이슈 {result['failedComments']}개는 다음 동기화에서 다시 받습니다.")
+            elif session.mirror is not None:
+                print("동기화에 실패했습니다.")
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '8':
+            session.import_manager.import_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '9':
+            session.bulk_edit_manager.bulk_edit_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '10':
+            session.async_client.export_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '11':
+            session.recommendation_manager.recommend_unassigned_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '12':
+            session.issue_manager.duplicate_report_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '13':
+            session.watch_manager.watch_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '14':
+            session.export_manager.export_screen(project_id)
+            input("계속하려면 Enter 를 누르세요.")
+        elif choice == '15':
             break
         else:
             print("잘못된 입력입니다.")
 
 
+def show_metrics(session):
+    """
+    이번 세션의 엔드포인트별 API 요청 지표를 표로 보여주고, 원하면 파일로 저장한다. (메뉴에 표시하지 않는 기능)
+    """
+    from issuemanagement.metrics import EXPORT_FORMATS
+
+    metrics = session.transport.metrics
+    print(metrics.format_table())
+    path = input("저장할 파일 경로 (저장하지 않으려면 Enter): ").strip()
+    if not path:
+        return
+    fmt = 'json' if path.endswith('.json') else 'prometheus'
+    try:
+        metrics.export(path, fmt)
+    except OSError as error:
+        print(f"지표를 저장하지 못했습니다: {error}")
+        return
+    print(f"{path} 에 {fmt} 형식으로 저장했습니다. (지원 형식: {', '.join(EXPORT_FORMATS)})")
+
+
 def main():
     """
     이슈 관리 콘솔 프로그램 시작 UI
@@ -170,6 +331,7 @@ def main():
             print("2. 계정 추가 (관리자)")
             print("3. 프로젝트 관리 (관리자)")
             print("4. 로그아웃")
+            print("5. 전체 프로젝트 이슈 검색")
             print("0. 종료")
         else:
             print("\n--- 로그아웃됨 ---")
@@ -178,28 +340,48 @@ def main():
 
         choice = input("원하는 기능을 선택하세요: ")
         clear_console()
-        if choice == '1' and session.cookies:
-            projects = session.project_manager.load_projects()
-            if projects:
-                project_index = int(input("프로젝트 번호를 선택하세요: ")) - 1
-                if 0 <= project_index < len(projects):
-                    selected_project_id = projects[project_index]["id"]
-                    project_screen(session, selected_project_id)
-                else:
-                    print("잘못된 프로젝트 번호입니다.")
-        elif choice == '1' and not session.cookies:
-            login(session)
-        elif choice == '2' and session.cookies:
-            add_user(session)
-        elif choice == '3' and session.cookies:
-            manage_projects(session)
-        elif choice == '4' and session.cookies:
-            logout(session)
-        elif choice == '0':
-            break
-        else:
-            print("잘못된 입력입니다.")
+        try:
+            if choice == '1' and session.cookies:
+                projects = session.project_manager.load_projects()
+                if projects:
+                    project_index = int(input("프로젝트 번호를 선택하세요: ")) - 1
+                    if 0 <= project_index < len(projects):
+                        selected_project_id = projects[project_index]["id"]
+                        project_screen(session, selected_project_id)
+                    else:
+                        print("잘못된 프로젝트 번호입니다.")
+            elif choice == '1' and not session.cookies:
+                login(session)
+            elif choice == '2' and session.cookies:
+                add_user(session)
+            elif choice == '3' and session.cookies:
+                manage_projects(session)
+            elif choice == '4' and session.cookies:
+                logout(session)
+            elif choice == '5' and session.cookies:
+                session.global_search_manager.global_search_screen()
+                input("계속하려면 Enter 를 누르세요.")
+            elif choice == '0':
+                break
+            elif choice == 'm':
+                show_metrics(session)
+            else:
+                print("잘못된 입력입니다.")
+        except OSError as error:
+            # requests 의 통신 예외도 OSError 이다. 쓰기 요청이 시간 초과되면 결과를 알 수 없으므로 메뉴로 돌아간다.
+            print(f"서버와 통신하지 못했습니다. 잠시 후 다시 시도하세요. ({error.__class__.__name__})")
+    session.close()
+
+
+def run_command(argv):
+    """
+    메뉴 없이 명령줄 인자로 기능을 실행한다. (스크립트, CI, cron 등 자동화용)
+    """
+    from issuemanagement.cli import run
+    return run(argv, Session)
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_command(sys.argv[1:]))
     main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from issuemanagement.jsonstream import iter_json_array
+
+def split(data, size):
+    """
+    바이트열을 size 바이트씩 잘라 조각 목록으로 만든다.
+    """
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+class IterJsonArrayTest(unittest.TestCase):
+    """
+    iter_json_array 가 조각 경계와 관계없이 같은 원소를 내보내고, 잘못된 배열은 ValueError 로 거부하는지 확인한다.
+    """
+    records = [
+        {"id": 1, "title": "로그인 오류", "count": 12345},
+        {"id": 2, "title": "업로드 실패 😀", "tags": ["a", "b"], "score": -1.5e3},
+        12345678901234567890,
+        "문자열 \"따옴표\" 와 \\ 역슬래시",
+        None,
+        True,
+        [],
+        {},
+    ]
+
+    def test_every_chunk_size(self):
+        data = json.dumps(self.records, ensure_ascii=False).encode('utf-8')
+        for size in range(1, len(data) + 1):
+            with self.subTest(size=size):
+                self.assertEqual(list(iter_json_array(split(data, size))), self.records)
+
+    def test_number_split_at_chunk_boundary(self):
+        self.assertEqual(list(iter_json_array([b'[12', b'34, 5', b'6]'])), [1234, 56])
+
+    def test_multibyte_utf8_split_across_chunks(self):
+        data = '["가나다", "😀"]'.encode('utf-8')
+        first = data.index('나'.encode('utf-8')) + 1
+        second = data.index('😀'.encode('utf-8')) + 2
+        chunks = [data[:first], data[first:second], data[second:]]
+        self.assertEqual(list(iter_json_array(chunks)), ["가나다", "😀"])
+
+    def test_empty_chunks_and_whitespace(self):
+        self.assertEqual(list(iter_json_array([b'', b' \n[', b'', b' 1 ,\t2 ', b'', b']'])), [1, 2])
+        self.assertEqual(list(iter_json_array([b'[', b' ', b']'])), [])
+
+    def test_malformed_arrays(self):
+        for data in (b'[1 2,,3]', b'[1,]', b'[,1]', b'[1,,2]', b'[,]', b'{"id": 1}', b'[1, 2', b'', b'[1, x]'):
+            for size in (1, 3, len(data) or 1):
+                with self.subTest(data=data, size=size):
+                    with self.assertRaises(ValueError):
+                        list(iter_json_array(split(data, size)))
+
+    def test_invalid_utf8(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'["\xff"]']))
+
+if __name__ == '__main__':
+    unittest.main()